@@ -0,0 +1,38 @@
+"""
+앱 파일(로컬 저장소, 세션 상태, 리포트) 위치
+
+작업 폴더(CWD)가 아니라 실행 파일(.exe) 옆 — 소스 실행이면 이 프로젝트 폴더 — 를 기준으로 합니다.
+그 폴더에 쓸 수 없으면(예: Program Files에 설치) 사용자별 데이터 폴더를 씁니다.
+"""
+import os
+import sys
+
+APP_NAME = "MarketAnalysisTool"
+
+
+def app_dir():
+    """PyInstaller로 빌드된 경우 exe가 있는 폴더, 아니면 프로젝트 폴더"""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def user_data_dir():
+    """사용자별 데이터 폴더 (Windows: %LOCALAPPDATA%, macOS: ~/Library/Application Support, 그 외: ~/.local/share)"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_NAME)
+
+
+def data_path(path):
+    """config의 상대 경로(예: 'data/quotes.db') -> 절대 경로. 절대 경로는 그대로"""
+    if os.path.isabs(path):
+        return path
+    base = app_dir()
+    if not os.access(base, os.W_OK):
+        base = user_data_dir()
+    return os.path.join(base, path)
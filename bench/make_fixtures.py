@@ -0,0 +1,122 @@
+"""
+벤치마크용 fixture 생성
+
+    python bench/make_fixtures.py            # 합성(synthetic) fixture 생성 — 네트워크 불필요
+    python bench/make_fixtures.py --record   # 실제 Sina/SGX 응답을 녹화 (네트워크 필요)
+
+파일 이름에 synthetic / recorded를 붙여 구분하며, run_bench.py는 recorded가 있으면 우선 사용합니다.
+합성 fixture는 실제 응답 형식(필드 수, GBK 인코딩, 빈 월물)을 흉내 낸 임의 값이며 실제 시세가 아닙니다.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SINA_PREFIXES = ["nf_TA", "nf_PX", "hf_OIL"]
+# 만든 날부터 36개월치: fixture를 다시 만들지 않아도 한동안 월물이 맞음
+FIXTURE_MONTHS = 36
+# 이 간격마다 빈 월물("") 한 줄씩 (실제 응답처럼 상장되지 않은 월물)
+EMPTY_EVERY = 7
+
+SINA_NAMES = {"nf_TA": ("PTA", "郑商所"), "nf_PX": ("对二甲苯", "郑商所"), "hf_OIL": ("布伦特原油", "ICE")}
+
+
+def fixture_path(name, kind):
+    """name: 'sina_hq.txt' -> bench/fixtures/sina_hq.<kind>.txt"""
+    base, ext = os.path.splitext(name)
+    return os.path.join(FIXTURE_DIR, f"{base}.{kind}{ext}")
+
+
+def _months(count=FIXTURE_MONTHS):
+    now = datetime.now()
+    return [now + relativedelta(months=i) for i in range(count)]
+
+
+def synthetic_sina_line(symbol, prefix, rng):
+    """Sina 선물 한 줄 형식 (18개 필드, 이름/거래소는 한자)"""
+    name, exchange = SINA_NAMES[prefix]
+    base = {"nf_TA": 5800, "nf_PX": 7600, "hf_OIL": 75}[prefix]
+    last = base * (1 + rng.uniform(-0.05, 0.05))
+    prev = last * (1 + rng.uniform(-0.01, 0.01))
+    fields = [
+        name + symbol[-4:], "150000", f"{last:.0f}", f"{last * 1.01:.0f}", f"{last * 0.99:.0f}", f"{prev:.0f}",
+        f"{last - 2:.0f}", f"{last + 2:.0f}", f"{last:.2f}", f"{last:.2f}", f"{prev:.2f}",
+        str(rng.randint(1, 500)), str(rng.randint(1, 500)), str(rng.randint(1000, 900000)),
+        str(rng.randint(100, 500000)), exchange, name, datetime.now().strftime("%Y-%m-%d"),
+    ]
+    return f'var hq_str_{symbol}="{",".join(fields)}";'
+
+
+def make_synthetic(seed=7):
+    rng = random.Random(seed)
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+
+    lines = []
+    for prefix in SINA_PREFIXES:
+        for i, date in enumerate(_months()):
+            symbol = f"{prefix}{date.strftime('%y%m')}"
+            if i % EMPTY_EVERY == EMPTY_EVERY - 1:
+                lines.append(f'var hq_str_{symbol}="";')
+            else:
+                lines.append(synthetic_sina_line(symbol, prefix, rng))
+    # Sina 응답은 GBK 인코딩
+    with open(fixture_path("sina_hq.txt", "synthetic"), "wb") as f:
+        f.write(("\n".join(lines) + "\n").encode("gbk"))
+
+    # SGX JSON API 응답 형식 ({"data": [레코드...]})
+    records = [
+        {"contract-code": f"UC{'FGHJKMNQUVXZ'[d.month - 1]}{d.strftime('%y')}",
+         "delivery-month": d.strftime("%Y%m"),
+         "last-price": f"{7.1 + rng.uniform(-0.05, 0.05):.4f}" if i % 5 != 3 else None,
+         "daily-settlement-price": f"{7.1 + rng.uniform(-0.05, 0.05):.4f}"}
+        for i, d in enumerate(_months())
+    ]
+    with open(fixture_path("sgx_uc.json", "synthetic"), "w", encoding="utf-8") as f:
+        json.dump({"meta": {"synthetic": True}, "data": records}, f)
+
+    # SGX 페이지 DOM에서 execute_script(EXTRACT_ROWS_JS)로 읽은 [[라벨, 가격]] 형식
+    rows = []
+    for i, d in enumerate(_months()):
+        label = f"UC {d.strftime('%b %y')}"
+        rows.append([label, "﹣" if i % 5 == 3 else f"{7.1 + rng.uniform(-0.05, 0.05):.4f}"])
+        rows.append([f"{label} Spread", ""])
+    with open(fixture_path("sgx_rows.json", "synthetic"), "w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False)
+
+
+def record_live():
+    """실제 응답 녹화 (Sina 원문 바이트 그대로, SGX JSON)"""
+    from request.http_session import http_get
+    from request.request_other import API_URL, HEADERS, chunk_symbols, get_month_symbols
+    from request.request_sgx_http import HEADERS as SGX_HEADERS
+    import config
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    symbols = [sym for p in SINA_PREFIXES for sym, _ in get_month_symbols(p, FIXTURE_MONTHS)]
+    body = b""
+    for chunk in chunk_symbols(symbols):
+        body += http_get("Sina", API_URL + ",".join(chunk), headers=HEADERS).content
+    with open(fixture_path("sina_hq.txt", "recorded"), "wb") as f:
+        f.write(body)
+
+    payload = http_get("SGX", config.SGX_API_URL, headers=SGX_HEADERS).json()
+    with open(fixture_path("sgx_uc.json", "recorded"), "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", action="store_true", help="실제 응답 녹화 (네트워크 필요)")
+    args = parser.parse_args()
+    if args.record:
+        record_live()
+    else:
+        make_synthetic()
+    print(f"fixture 저장: {FIXTURE_DIR}")
@@ -0,0 +1,201 @@
+"""
+오프라인 벤치마크: fixture를 로컬 stub 서버로 재생하며 주요 경로의 시간을 측정
+
+    python bench/run_bench.py                               # 결과 JSON을 bench/results/ 에 저장
+    python bench/run_bench.py --repeat 200 --out base.json
+    python bench/run_bench.py --baseline base.json          # 기준 결과와 p50 비교
+
+측정 항목
+- sina_parse            : Sina 응답 본문(GBK) 디코딩 + parse_hq_response (필드 8, 10)
+- sina_get_year_prices  : get_year_prices("nf_TA", 8) — stub 서버 HTTP 왕복 포함
+- sina_bulk             : get_bulk_prices(3종목, [8, 10]) — stub 서버 HTTP 왕복 포함
+- sgx_json              : get_year_sgx_http() — stub 서버 HTTP 왕복 포함
+- sgx_dom_rows          : SGX 페이지 DOM 행 -> 월물 매칭 (map_rows_by_month, Chrome 없이)
+- page1_recompute       : Page1 sheet 전체 재계산 (Qt 없이)
+- page1_calculate_all   : Page1.calculate_all_logic (offscreen Qt, PyQt6가 없으면 건너뜀)
+- page1_fx_fill         : USD/CNH 2-Pass 빈칸 보정
+- page3_scenario        : Page3 시나리오 그리드 (가격 offset 81개 x 환율 offset 21개)
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import config
+from bench.make_fixtures import FIXTURE_DIR, fixture_path
+from bench.stub_server import StubServer
+from calc.page1_sheet import build_page1_sheet, fill_fx_gaps
+from calc.scenario import offset_range, scenario_grid
+from request import request_other
+from request.request_other import (decode_hq_body, get_bulk_prices, get_month_symbols, get_year_prices,
+                                   parse_hq_response)
+from request.request_sgx import map_rows_by_month
+from request.request_sgx_http import get_year_sgx_http
+
+PERCENTILES = [50, 90, 99]
+
+
+def load_fixture(name, binary=False):
+    """recorded가 있으면 우선 사용. 반환: (내용, 'recorded' | 'synthetic')"""
+    for kind in ("recorded", "synthetic"):
+        path = fixture_path(name, kind)
+        if os.path.exists(path):
+            with open(path, "rb" if binary else "r", **({} if binary else {"encoding": "utf-8"})) as f:
+                return f.read(), kind
+    raise SystemExit(f"fixture가 없습니다: {name} — 먼저 python bench/make_fixtures.py 를 실행하세요.")
+
+
+def measure(fn, repeat, warmup):
+    """fn을 warmup회 버리고 repeat회 실행한 시간(ms) 목록"""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def summarize(times):
+    arr = np.asarray(times)
+    summary = {"n": len(times), "min": float(arr.min()), "mean": float(arr.mean()), "max": float(arr.max())}
+    for p in PERCENTILES:
+        summary[f"p{p}"] = float(np.percentile(arr, p))
+    return summary
+
+
+def _page1_sheet_with_inputs():
+    sheet = build_page1_sheet(12)
+    rng = np.random.default_rng(0)
+    sheet.values[:, 1:] = rng.uniform(1, 8000, size=(12, sheet.n_cols - 1))
+    return sheet
+
+
+def build_benchmarks(sina_body, sgx_rows):
+    """[(이름, 인자 없는 함수)]"""
+    benches = [
+        ("sina_parse", lambda: parse_hq_response(decode_hq_body(sina_body), [8, 10])),
+        ("sina_get_year_prices", lambda: get_year_prices("nf_TA", 8)),
+        ("sina_bulk", lambda: get_bulk_prices(["nf_TA", "nf_PX", "hf_OIL"], [8, 10])),
+        ("sgx_json", lambda: get_year_sgx_http(mode=None)),
+    ]
+
+    months_info = [month for _, month in get_month_symbols("UC")]
+    benches.append(("sgx_dom_rows", lambda: map_rows_by_month(sgx_rows, months_info)))
+
+    sheet = _page1_sheet_with_inputs()
+    benches.append(("page1_recompute", sheet.recompute_all))
+
+    page1 = _make_page1()
+    if page1 is not None:
+        page1.sheet.values[:] = sheet.values
+        benches.append(("page1_calculate_all", page1.calculate_all_logic))
+
+    fx_curve = [7.1, 0.0, 0.0, 7.12, 0.0, 7.15, 7.16, 0.0, 0.0, 0.0, 7.2, 0.0]
+    benches.append(("page1_fx_fill", lambda: fill_fx_gaps(fx_curve)))
+
+    offsets = offset_range(-20, 20, 0.5)
+    fx_offsets = offset_range(-0.1, 0.1, 0.01)
+    benches.append(("page3_scenario", lambda: scenario_grid("PX-PTA", 5800.0, 120.0, 7.1, offsets, fx_offsets)))
+    return benches
+
+
+_qt_app = None
+
+
+def _make_page1():
+    """offscreen Qt로 Page1 생성 (PyQt6가 없으면 None)"""
+    global _qt_app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtWidgets import QApplication
+        from page.page1 import Page1
+    except ImportError as e:
+        print(f"page1_calculate_all 건너뜀: {e}")
+        return None
+    _qt_app = QApplication.instance() or QApplication([])
+    return Page1()
+
+
+def run(repeat, warmup, only=None):
+    sina_body, sina_kind = load_fixture("sina_hq.txt", binary=True)
+    sgx_body, sgx_kind = load_fixture("sgx_uc.json", binary=True)
+    sgx_rows_text, rows_kind = load_fixture("sgx_rows.json")
+    sgx_rows = json.loads(sgx_rows_text)
+
+    results = {}
+    with StubServer(sina_body, sgx_body) as server:
+        # 실제 호스트 대신 stub 서버로 요청 (캐시/로컬 저장소는 거치지 않음)
+        request_other.API_URL = server.url + "/list="
+        config.SGX_API_URL = server.url + "/sgx"
+        config.SGX_FIXTURE_MODE = None
+
+        for name, fn in build_benchmarks(sina_body, sgx_rows):
+            if only and name not in only:
+                continue
+            results[name] = summarize(measure(fn, repeat, warmup))
+            print(f"{name:<22} p50 {results[name]['p50']:9.3f} ms   p90 {results[name]['p90']:9.3f} ms")
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "repeat": repeat,
+            "warmup": warmup,
+            "unit": "ms",
+            "fixtures": {"sina_hq": sina_kind, "sgx_uc": sgx_kind, "sgx_rows": rows_kind},
+        },
+        "results": results,
+    }
+
+
+def compare(result, baseline):
+    """기준 대비 p50 비율 (1보다 작으면 빨라짐)"""
+    print(f"{'benchmark':<22} {'base p50':>10} {'p50':>10} {'ratio':>7}")
+    for name, summary in result["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<22} {'-':>10} {summary['p50']:10.3f} {'new':>7}")
+            continue
+        ratio = summary["p50"] / base["p50"] if base["p50"] else float("inf")
+        print(f"{name:<22} {base['p50']:10.3f} {summary['p50']:10.3f} {ratio:7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="일부 항목만 실행")
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: bench/results/bench_<시각>.json)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    args = parser.parse_args(argv)
+
+    result = run(args.repeat, args.warmup, args.only)
+
+    out = args.out or os.path.join(
+        BENCH_DIR, "results", f"bench_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=1)
+    print(f"결과 저장: {out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(result, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
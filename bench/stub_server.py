@@ -0,0 +1,71 @@
+"""
+fixture를 그대로 돌려주는 로컬 stub 서버 (127.0.0.1, 네트워크 불필요)
+
+- GET /list=<심볼,심볼,...> : Sina hq 응답 (fixture에 없는 심볼은 빈 줄 var hq_str_X="";)
+- GET /sgx                  : SGX JSON API 응답
+"""
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+SINA_LINE_RE = re.compile(rb'^var hq_str_([^=]+)=', re.M)
+
+
+def index_sina_fixture(body):
+    """GBK 원문 바이트를 디코딩하지 않고 {심볼: 한 줄(bytes)}로 분리"""
+    lines = {}
+    for line in body.splitlines():
+        m = SINA_LINE_RE.match(line)
+        if m:
+            lines[m.group(1).decode("ascii")] = line
+    return lines
+
+
+class StubServer:
+    def __init__(self, sina_body, sgx_body):
+        self.sina_lines = index_sina_fixture(sina_body)
+        self.sgx_body = sgx_body
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 요청마다 ~40ms 지연이 섞임
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.requests += 1
+                if self.path.startswith("/list="):
+                    symbols = unquote(self.path[len("/list="):]).split(",")
+                    body = b"\n".join(
+                        server.sina_lines.get(s, f'var hq_str_{s}="";'.encode("ascii")) for s in symbols
+                    ) + b"\n"
+                    content_type = "application/javascript; charset=GBK"
+                elif self.path.startswith("/sgx"):
+                    body = server.sgx_body
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
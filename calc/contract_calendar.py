@@ -0,0 +1,65 @@
+"""
+거래소별 상장 월물 달력 (네트워크 없이 동작)
+
+지금부터 N개월(곡선 길이) 중 실제로 상장된 월물만 골라, 없는 심볼은 요청하지 않도록 합니다.
+곡선 길이는 config의 PAGE1_MONTHS / PAGE2_MONTHS 등으로 정하며 24~36개월도 지원합니다.
+
+상장 규칙 (단순화: 만기일 이후 당월물 교체는 반영하지 않음)
+- ZCE PTA / PX : 1~12월물, 연속 12개월
+- ICE Brent     : 매월, 연속 96개월 (36개월 곡선은 모두 상장)
+- SGX UC        : 연속 13개월 + 이후 분기월(3, 6, 9, 12월) 36개월까지
+"""
+import datetime
+
+from dateutil.relativedelta import relativedelta
+
+QUARTER_MONTHS = {3, 6, 9, 12}
+
+
+class ContractSpec:
+    """
+    serial: 지금부터 연속으로 상장되는 개월 수
+    far_months: serial 이후에도 상장되는 월 (예: 분기월), horizon까지만
+    horizon: 상장되는 가장 먼 월물 (지금부터 개월 수)
+    """
+
+    def __init__(self, name, exchange, serial, horizon, far_months=()):
+        self.name = name
+        self.exchange = exchange
+        self.serial = serial
+        self.horizon = horizon
+        self.far_months = set(far_months)
+
+    def is_listed(self, offset, month):
+        """offset: 지금부터 몇 개월 뒤 (0 = 당월), month: 1~12"""
+        if offset < self.serial:
+            return True
+        return offset < self.horizon and month in self.far_months
+
+
+# 심볼 prefix별 상장 규칙
+CONTRACTS = {
+    "nf_TA": ContractSpec("PTA", "ZCE", serial=12, horizon=12),
+    "nf_PX": ContractSpec("PX", "ZCE", serial=12, horizon=12),
+    "hf_OIL": ContractSpec("Brent", "ICE", serial=96, horizon=96),
+    "sgx_UC": ContractSpec("USD/CNH", "SGX", serial=13, horizon=36, far_months=QUARTER_MONTHS),
+}
+
+
+def curve_dates(count, now=None):
+    """지금부터 count개월의 각 월 날짜"""
+    now = now or datetime.datetime.now()
+    return [now + relativedelta(months=i) for i in range(count)]
+
+
+def contract_months(prefix, count, now=None):
+    """
+    곡선의 모든 월에 대해 [(심볼, 'yy/mm', 상장 여부)]
+    규칙이 없는 prefix는 모두 상장된 것으로 봅니다.
+    """
+    spec = CONTRACTS.get(prefix)
+    result = []
+    for offset, date in enumerate(curve_dates(count, now)):
+        listed = spec is None or spec.is_listed(offset, date.month)
+        result.append((f"{prefix}{date.strftime('%y%m')}", date.strftime("%y/%m"), listed))
+    return result
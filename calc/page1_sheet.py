@@ -0,0 +1,131 @@
+import datetime
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from calc.sheet import Formula, Sheet
+from calc.spreads import CONST_PX_PTA, CONST_ZCE_SGX, box, cascade, pxn, px_pta_spread, zce_sgx_spread
+
+# Page1 열 번호
+COL_MONTH, COL_BRENT, COL_MOPJ, COL_MOPJ_SPREAD, COL_PX = 0, 1, 2, 3, 4
+COL_PX_SPREAD, COL_PXN, COL_PX_FUTURE, COL_PTA_FUTURE = 5, 6, 7, 8
+COL_PX_PTA, COL_ZCE_SGX, COL_USD_CNH, COL_BOX = 9, 10, 11, 12
+
+HEADERS = [
+    "Month", "BRENT", "Mopj", "MOPJ SPREAD", "PX",
+    "PX SPREAD", "PXN", "PX Futures", "PTA Futures",
+    "PX-PTA SPREAD", "ZCEPX-SGXPX", "USD/CNH", "BOX"
+]
+
+PAGE1_FORMULAS = [
+    # 계단식: 다음 달 Mopj/PX = 이번 달 값 - 이번 달 spread (첫 행은 수동 입력)
+    Formula(COL_MOPJ, [(-1, COL_MOPJ), (-1, COL_MOPJ_SPREAD)], lambda mopj, spread: mopj - spread),
+    Formula(COL_PX, [(-1, COL_PX), (-1, COL_PX_SPREAD)], lambda px, spread: px - spread),
+    # PXN = PX - Mopj
+    Formula(COL_PXN, [(0, COL_PX), (0, COL_MOPJ)], lambda px, mopj: px - mopj),
+    # PX-PTA SPREAD = PTA 선물 - 상수 * PX * 환율
+    Formula(COL_PX_PTA, [(0, COL_PTA_FUTURE), (0, COL_PX), (0, COL_USD_CNH)],
+            lambda pta_future, px, usd_cnh: pta_future - (CONST_PX_PTA * px * usd_cnh)),
+    # ZCEPX-SGXPX = PX 선물 - PX * 상수 * 환율
+    Formula(COL_ZCE_SGX, [(0, COL_PX_FUTURE), (0, COL_PX), (0, COL_USD_CNH)],
+            lambda px_future, px, usd_cnh: px_future - (px * CONST_ZCE_SGX * usd_cnh)),
+    # BOX = 이번 달 PXN - 다음 달 PXN (마지막 행 제외)
+    Formula(COL_BOX, [(0, COL_PXN), (1, COL_PXN)], lambda pxn, next_pxn: pxn - next_pxn),
+]
+
+
+def compute_page1_grid(values):
+    """
+    Page1 표 전체를 벡터 연산으로 한 번에 계산
+    values: (..., months, 13) 배열 — 입력 열(첫 행 Mopj/PX, spread, 선물, 환율)만 채워져 있으면 됨
+    앞쪽 축으로 여러 시나리오를 쌓아 동시에 계산할 수 있습니다.
+    반환: 수식 열이 채워진 새 배열 (마지막 월 BOX는 입력값 그대로)
+    """
+    out = np.array(values, dtype=np.float64, copy=True)
+    mopj = cascade(out[..., 0, COL_MOPJ], out[..., :, COL_MOPJ_SPREAD])
+    px = cascade(out[..., 0, COL_PX], out[..., :, COL_PX_SPREAD])
+    out[..., :, COL_MOPJ] = mopj
+    out[..., :, COL_PX] = px
+
+    out[..., :, COL_PXN] = pxn(px, mopj)
+    out[..., :, COL_PX_PTA] = px_pta_spread(out[..., :, COL_PTA_FUTURE], px, out[..., :, COL_USD_CNH])
+    out[..., :, COL_ZCE_SGX] = zce_sgx_spread(out[..., :, COL_PX_FUTURE], px, out[..., :, COL_USD_CNH])
+    out[..., :-1, COL_BOX] = box(out[..., :, COL_PXN])[..., :-1]
+    return out
+
+
+# 선물 곡선(request/sources.py 종목 이름) -> Page1 열 (Brent, PX 선물, PTA 선물)
+FUTURE_COLUMNS = [("BRENT", COL_BRENT), ("PX", COL_PX_FUTURE), ("PTA", COL_PTA_FUTURE)]
+FUTURE_INSTRUMENTS = [name for name, _ in FUTURE_COLUMNS]
+# Page1이 요청하는 종목/필드 (request/sources.py): Brent/PX/PTA 선물 + USD/CNH
+PAGE1_QUOTES = {**{name: ["price"] for name in FUTURE_INSTRUMENTS}, "USDCNH": ["price"]}
+
+
+def month_labels(n_rows, now=None):
+    """지금부터 n_rows개월의 행 라벨 (26-JAN 형식)"""
+    now = now or datetime.datetime.now()
+    return [(now + relativedelta(months=i)).strftime("%y-%b").upper() for i in range(n_rows)]
+
+
+def saved_input_updates(saved, labels):
+    """{월물 라벨: {열: 값}} 형식으로 저장된 수동 입력 -> {(row, col): 값} (지금 표에 없는 월물은 버림)"""
+    updates = {}
+    for row, label in enumerate(labels):
+        for col, value in saved.get(label, {}).items():
+            updates[(row, int(col))] = float(value)
+    return updates
+
+
+def future_updates(quotes, n_rows):
+    """{종목 이름: {'price': rows}}에서 Page1 입력 셀 {(row, col): 값} 생성 (N/A, 받지 못한 종목은 건너뜀)"""
+    updates = {}
+    for name, col in FUTURE_COLUMNS:
+        data = quotes.get(name, {}).get("price", [])
+        for row in range(n_rows):
+            if row < len(data) and data[row]['price'] != 'N/A':
+                updates[(row, col)] = float(data[row]['price'])
+    return updates
+
+
+def fill_fx_gaps(values):
+    """
+    2-Pass 보정 (앞 칸 우선 채우기 -> 남은 빈칸 뒷 칸 채우기)
+    반환: (보정된 값 리스트, 보정으로 채워진 행 여부 리스트)
+    """
+    values = list(values)
+    n = len(values)
+    check = [False] * n
+
+    # [Pass 1] 순방향 보정: 앞 칸(위)의 값을 아래로 전파 (앞 칸 우선 논리)
+    for row in range(1, n): # 1번 행부터 시작
+        if values[row] == 0 and values[row - 1] != 0 and not check[row - 1]:
+            check[row] = True
+            values[row] = values[row - 1]
+
+    # [Pass 2] 역방향 보정: 여전히 0인 칸은 뒷 칸(아래)의 값을 위로 전파
+    for row in range(n - 2, -1, -1): # 뒤에서 두 번째 행부터 0번 행까지 거꾸로
+        if values[row] == 0 and values[row + 1] != 0 and not check[row + 1]:
+            check[row] = True
+            values[row] = values[row + 1]
+
+    return values, check
+
+
+def sgx_updates(sgx_rows, n_rows):
+    """
+    SGX USD/CNH 곡선 -> USD/CNH 열 입력값 (빈 월물은 2-Pass 보정)
+    반환: ({(row, col): 값}, 보정으로 채워진 행 여부 리스트)
+    """
+    raw = []
+    for row in range(n_rows):
+        if row < len(sgx_rows) and sgx_rows[row]['price'] != 'N/A':
+            raw.append(float(sgx_rows[row]['price']))
+        else:
+            raw.append(0.0)
+    values, filled = fill_fx_gaps(raw)
+    return {(row, COL_USD_CNH): values[row] for row in range(n_rows)}, filled
+
+
+def build_page1_sheet(n_rows=12):
+    # 셀 단위 편집은 의존 그래프로, 전체 재계산은 벡터 연산으로 처리
+    return Sheet(n_rows, len(HEADERS), PAGE1_FORMULAS, batch_fn=compute_page1_grid)
@@ -0,0 +1,107 @@
+"""
+Page2 전일 대비 표 계산 (Qt 없이 동작)
+
+행: (Item, yday, tday, +/-, usd+/-)
+"""
+import datetime
+
+from dateutil.relativedelta import relativedelta
+
+HEADERS = ["Item", "yday", "tday", "+/-", "usd+/-"]
+MONTH_NAMES = ["", "JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+# usd+/- 환산 환율
+USD_RATE = 7.2
+
+# 스프레드 항목 (데이터가 존재하는 경우에만 추가)
+SPREAD_TARGETS = [
+    {"label": "1/2", "m1": 1, "m2": 2},
+    {"label": "1/3", "m1": 1, "m2": 3},
+    {"label": "3/5", "m1": 3, "m2": 5},
+    {"label": "1/5", "m1": 1, "m2": 5},
+    {"label": "5/9", "m1": 5, "m2": 9}
+]
+
+
+def get_target_months(now=None, months=13):
+    """
+    현재 달 기준 향후 months개월(기본 13)을 탐색하여 Main(1,3,5,9) 및 근월물(+1, +2) 추출
+    2월일 경우 내년 1월물까지 포함되도록 기본 범위를 13으로 설정
+    """
+    # 실험용: 2월 상황을 보고 싶다면 now=datetime.datetime(2026, 2, 1) 을 넘기세요.
+    now = now or datetime.datetime.now()
+
+    main_months = {1, 3, 5, 9}
+    valid_targets = []
+
+    # 0(현재달)부터 months-1까지 탐색 (기본: 내년 이맘때까지 13개월)
+    for i in range(months):
+        check_date = now + relativedelta(months=i)
+        y, m = check_date.year, check_date.month
+
+        is_main = m in main_months
+        is_near = i <= 2 # 현재달, 다음달, 다다음달
+
+        if is_main or is_near:
+            # 중복 체크 (연도까지 고려)
+            if not any(t['year'] == y and t['month'] == m for t in valid_targets):
+                valid_targets.append({"year": y, "month": m})
+
+    # 연도와 월 순서로 정렬
+    valid_targets.sort(key=lambda x: (x['year'], x['month']))
+    return valid_targets
+
+
+def merge_data(t_list, y_list):
+    """오늘/어제 곡선을 {(yy, mm): {'tday', 'yday'}}로 합침 (둘 중 하나라도 N/A면 제외)"""
+    merged = {}
+    # API 반환 형식이 'YYYY/MM' 또는 'YY/MM'일 경우를 대비
+    for t, y in zip(t_list, y_list):
+        if t['price'] != "N/A" and y['price'] != "N/A":
+            # key format: (year_2digit, month)
+            parts = t['month'].split('/')
+            y_val = int(parts[0]) % 100 # 뒤 2자리 연도
+            m_val = int(parts[1])
+            merged[(y_val, m_val)] = {'tday': float(t['price']), 'yday': float(y['price'])}
+    return merged
+
+
+def report_row(label, yday, tday):
+    """(Item, yday, tday, +/-, usd+/-)"""
+    diff = tday - yday
+    return (label, yday, tday, diff, diff / USD_RATE)
+
+
+def product_rows(name, data_dict, target_list):
+    """동적 타겟 리스트 기반 월물 행 + 스프레드 행 (형식: PTA 26-JAN, PTA 1/2)"""
+    rows = []
+    active_info = {}
+
+    # 1. 월물별 데이터
+    for t in target_list:
+        yy = t['year'] % 100  # 2026 -> 26
+        mm = t['month']
+
+        if (yy, mm) in data_dict:
+            info = data_dict[(yy, mm)]
+            active_info[mm] = info
+            rows.append(report_row(f"{name} {yy}-{MONTH_NAMES[mm]}", info['yday'], info['tday']))
+
+    # 2. 스프레드 항목
+    for s in SPREAD_TARGETS:
+        m1, m2 = s["m1"], s["m2"]
+        if m1 in active_info and m2 in active_info:
+            v1, v2 = active_info[m1], active_info[m2]
+            rows.append(report_row(f"{name} {s['label']}", v1['yday'] - v2['yday'], v1['tday'] - v2['tday']))
+    return rows
+
+
+# Page2가 요청하는 종목/필드 (request/sources.py)
+PAGE2_QUOTES = {"PTA": ["price", "prev_settle"], "PX": ["price", "prev_settle"]}
+
+
+def build_page2_rows(quotes, now=None, months=13):
+    """{종목 이름: {'price': 오늘, 'prev_settle': 어제}} -> Page2 표 전체 행"""
+    target_list = get_target_months(now, months)
+    pta_data = merge_data(quotes["PTA"]["price"], quotes["PTA"]["prev_settle"])
+    px_data = merge_data(quotes["PX"]["price"], quotes["PX"]["prev_settle"])
+    return product_rows("PTA", pta_data, target_list) + product_rows("PX", px_data, target_list)
@@ -0,0 +1,87 @@
+"""
+Page3 계산기의 민감도(시나리오) 그리드 (Qt 없이 동작)
+
+PX-PTA / ZCE-SGX 역산 수식을 (가격 또는 spread offset) x (USD/CNH offset) 2차원 그리드에 대해
+한 번의 벡터 연산으로 계산합니다.
+"""
+import numpy as np
+
+import config
+from calc.spreads import CONST_PX_PTA, CONST_ZCE_SGX
+
+MODE_CONSTS = {"PX-PTA": CONST_PX_PTA, "ZCE-SGX": CONST_ZCE_SGX}
+# Page3 계산기 구성 (제목, 모드) — 세션 상태도 이 순서로 저장됨
+CALCULATORS = [
+    ("PX-PTA (1)", "PX-PTA"), ("PX-PTA (2)", "PX-PTA"),
+    ("ZCE-SGX (1)", "ZCE-SGX"), ("ZCE-SGX (2)", "ZCE-SGX")
+]
+# 모드별 선물 곡선: PX-PTA는 PTA 선물, ZCE-SGX는 PX 선물
+FUTURE_INSTRUMENT = {"PX-PTA": "PTA", "ZCE-SGX": "PX"}
+# 전체 정보 가져오기: 4개 계산기가 쓰는 선물 곡선(PTA, PX) + USD/CNH (request/sources.py 종목 이름)
+PAGE3_QUOTES = {**{name: ["price"] for name in FUTURE_INSTRUMENT.values()}, "USDCNH": ["price"]}
+
+
+def offset_range(start, stop, step):
+    """start ~ stop (양끝 포함) 구간을 step 간격으로 나눈 배열"""
+    if not all(np.isfinite((start, stop, step))):
+        raise ValueError("start/stop/step은 유한한 숫자여야 합니다.")
+    if step <= 0:
+        raise ValueError("step은 0보다 커야 합니다.")
+    # 아주 큰 값끼리의 차이는 float 범위를 넘을 수 있으므로(inf) 정수로 바꾸기 전에 확인
+    steps = np.floor((stop - start) / step + 1e-9)
+    if steps < 0:
+        raise ValueError("stop은 start보다 크거나 같아야 합니다.")
+    if steps + 1 > config.SCENARIO_MAX_ROWS:
+        raise ValueError(f"구간이 너무 깁니다 (최대 {config.SCENARIO_MAX_ROWS}개). step을 늘리세요.")
+    count = int(steps) + 1
+    # 0.1 같은 간격의 누적 오차가 표시되지 않도록 반올림
+    return np.round(start + step * np.arange(count), 10)
+
+
+def center_mask(offsets, fx_offsets):
+    """(len(fx_offsets), len(offsets)) bool 배열: 가격 offset 0 이면서 환율 offset 0인 칸만 True (기준 시나리오)"""
+    return np.isclose(fx_offsets, 0)[:, np.newaxis] & np.isclose(offsets, 0)[np.newaxis, :]
+
+
+def inverse_target(mode, future, spread, usd):
+    """
+    PX-PTA: f=PTA Future, PX를 역산: PX = (PTA - Spread) / (Const * USD)
+    ZCE-SGX: f=PX Future, PTA를 역산: PTA = (PX * Const * USD) + Spread
+    """
+    const_val = MODE_CONSTS[mode]
+    if mode == "PX-PTA":
+        return (future - spread) / (const_val * usd)
+    return (future * const_val * usd) + spread
+
+
+def implied_spread(mode, future, target, usd):
+    """target 값에서 spread 재계산"""
+    const_val = MODE_CONSTS[mode]
+    if mode == "PX-PTA":
+        return future - (target * const_val * usd)
+    return target - (future * const_val * usd)
+
+
+def scenario_grid(mode, future, spread, usd, offsets, fx_offsets=(0.0,), vary="price"):
+    """
+    vary="price": 환율별 중심값에 가격 offset을 더하고 spread를 재계산
+    vary="spread": spread에 offset을 더해 target을 역산
+    반환: (target, spread, usd) — target/spread는 (len(fx_offsets), len(offsets)), usd는 (len(fx_offsets),)
+    """
+    offsets = np.asarray(offsets, dtype=np.float64)[np.newaxis, :]
+    rows = offsets.shape[1] * len(fx_offsets)
+    if rows > config.SCENARIO_MAX_ROWS:
+        raise ValueError(f"시나리오가 너무 많습니다 ({rows}행, 최대 {config.SCENARIO_MAX_ROWS}행). step을 늘리세요.")
+    usd_values = usd + np.asarray(fx_offsets, dtype=np.float64)
+    # 역산은 환율로 나누므로 0 이하 환율 시나리오는 inf/음수 target이 됨
+    if not np.all(usd_values > 0):
+        raise ValueError(f"환율 offset을 더한 USD/CNH가 0 이하입니다 (최소 {usd_values.min():g}). 환율 offset 구간을 확인하세요.")
+    u = usd_values[:, np.newaxis]
+
+    if vary == "spread":
+        spreads = np.broadcast_to(spread + offsets, (u.shape[0], offsets.shape[1])).copy()
+        target = inverse_target(mode, future, spreads, u)
+    else:
+        target = inverse_target(mode, future, spread, u) + offsets
+        spreads = implied_spread(mode, future, target, u)
+    return target, spreads, usd_values
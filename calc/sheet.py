@@ -0,0 +1,145 @@
+from collections import deque
+
+import numpy as np
+
+
+class Formula:
+    """
+    한 열(col)의 수식 선언
+    inputs: [(행 offset, 열)] — 예) (-1, 2)는 바로 위 행의 2번 열
+    fn: 입력값들을 순서대로 받아 float를 반환하는 함수
+    rows: 수식이 적용되는 행 범위를 (행, 전체 행 수) -> bool로 판단 (None이면 모든 행)
+    """
+
+    def __init__(self, col, inputs, fn, rows=None):
+        self.col = col
+        self.inputs = inputs
+        self.fn = fn
+        self.rows = rows
+
+    def applies_to(self, row, n_rows):
+        if self.rows is not None and not self.rows(row, n_rows):
+            return False
+        return all(0 <= row + dr < n_rows for dr, _ in self.inputs)
+
+
+class Sheet:
+    """
+    스프레드시트식 재계산 엔진 (Qt 없이 동작)
+    값은 float64 배열(values[row, col])에 전체 정밀도로 보관하고,
+    셀 하나가 바뀌면 그 셀에 의존하는 셀만 순서대로 다시 계산합니다.
+    """
+
+    def __init__(self, n_rows, n_cols, formulas, batch_fn=None):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.values = np.zeros((n_rows, n_cols), dtype=np.float64)
+        # 전체 재계산을 한 번에 처리하는 벡터 함수 (values 배열 -> 새 배열), 없으면 셀 단위로 계산
+        self.batch_fn = batch_fn
+
+        # (row, col) -> Formula
+        self.formula_cells = {}
+        for formula in formulas:
+            for row in range(n_rows):
+                if formula.applies_to(row, n_rows):
+                    self.formula_cells[(row, formula.col)] = formula
+
+        # 입력 셀 -> 그 셀을 참조하는 수식 셀 목록
+        self.dependents = {}
+        for (row, col), formula in self.formula_cells.items():
+            for dr, dc in formula.inputs:
+                self.dependents.setdefault((row + dr, dc), []).append((row, col))
+
+        self._order = self._topological_order()
+
+    def _topological_order(self):
+        """수식 셀 전체의 계산 순서 (입력이 먼저 오도록)"""
+        indegree = {cell: 0 for cell in self.formula_cells}
+        for cell, formula in self.formula_cells.items():
+            row, _ = cell
+            for dr, dc in formula.inputs:
+                if (row + dr, dc) in self.formula_cells:
+                    indegree[cell] += 1
+
+        queue = deque(sorted(c for c, d in indegree.items() if d == 0))
+        order = {}
+        while queue:
+            cell = queue.popleft()
+            order[cell] = len(order)
+            for dep in self.dependents.get(cell, []):
+                indegree[dep] -= 1
+                if indegree[dep] == 0:
+                    queue.append(dep)
+
+        if len(order) != len(self.formula_cells):
+            raise ValueError("수식에 순환 참조가 있습니다.")
+        return order
+
+    def is_formula(self, row, col):
+        return (row, col) in self.formula_cells
+
+    def get(self, row, col):
+        if row < 0 or row >= self.n_rows:
+            return 0.0
+        return float(self.values[row, col])
+
+    def _evaluate(self, cell):
+        row, col = cell
+        formula = self.formula_cells[cell]
+        args = [float(self.values[row + dr, dc]) for dr, dc in formula.inputs]
+        self.values[row, col] = formula.fn(*args)
+
+    def _downstream(self, cells):
+        """cells에 (직·간접) 의존하는 수식 셀 전부"""
+        affected = set()
+        stack = list(cells)
+        while stack:
+            cell = stack.pop()
+            for dep in self.dependents.get(cell, []):
+                if dep not in affected:
+                    affected.add(dep)
+                    stack.append(dep)
+        return affected
+
+    def set_many(self, updates):
+        """
+        updates: {(row, col): 값}
+        반환: 값이 실제로 바뀐 셀 목록 (입력 셀 + 재계산된 수식 셀)
+        수식 셀에 값을 넣으면 곧바로 수식 결과로 덮어씁니다.
+        """
+        before = {}
+        for (row, col), value in updates.items():
+            before[(row, col)] = self.values[row, col]
+            self.values[row, col] = value
+
+        affected = self._downstream(updates.keys())
+        affected.update(c for c in updates if c in self.formula_cells)
+        for cell in affected:
+            before.setdefault(cell, self.values[cell])
+
+        for cell in sorted(affected, key=self._order.__getitem__):
+            self._evaluate(cell)
+
+        return [c for c, old in before.items() if self.values[c] != old]
+
+    def set(self, row, col, value):
+        return self.set_many({(row, col): value})
+
+    def recompute_all(self):
+        """모든 수식 셀을 다시 계산하고 바뀐 셀 목록 반환"""
+        if self.batch_fn is not None:
+            new_values = self.batch_fn(self.values)
+            changed = [tuple(int(i) for i in cell) for cell in np.argwhere(new_values != self.values)]
+            self.values[...] = new_values
+            return changed
+
+        changed = []
+        for cell in sorted(self.formula_cells, key=self._order.__getitem__):
+            old = self.values[cell]
+            self._evaluate(cell)
+            if self.values[cell] != old:
+                changed.append(cell)
+        return changed
+
+    def clear(self):
+        self.values.fill(0.0)
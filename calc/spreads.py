@@ -0,0 +1,49 @@
+"""
+Page1 스프레드 수식의 NumPy 벡터 버전 (Qt 없이 동작)
+
+모든 함수는 마지막 축을 월물(contract month)로 보고, 앞쪽 축은 자유롭게 둡니다.
+예) px: (months,), usd_cnh: (scenarios, 1) -> 결과: (scenarios, months)
+몇 개월이든, 몇 개의 시나리오든 한 번에 계산합니다.
+"""
+import numpy as np
+
+# 수식용 상수
+CONST_PX_PTA = 0.655 * 1.13 * 1.02
+CONST_ZCE_SGX = 1.13 * 1.02
+
+
+def cascade(first, spreads):
+    """
+    계단식 곡선: values[0] = first, values[k] = values[k-1] - spreads[k-1]
+    = first - cumsum(spreads)[k-1]
+    first: (...,) / spreads: (..., months) -> (..., months)
+    마지막 월의 spread는 사용되지 않습니다.
+    """
+    first = np.asarray(first, dtype=np.float64)
+    spreads = np.asarray(spreads, dtype=np.float64)
+    shifted = np.zeros(np.broadcast_shapes(first.shape + (1,), spreads.shape))
+    shifted[..., 1:] = np.cumsum(spreads[..., :-1], axis=-1)
+    return first[..., np.newaxis] - shifted
+
+
+def pxn(px, mopj):
+    """PXN = PX - Mopj"""
+    return np.subtract(px, mopj, dtype=np.float64)
+
+
+def px_pta_spread(pta_future, px, usd_cnh):
+    """PX-PTA SPREAD = PTA 선물 - 상수 * PX * 환율"""
+    return np.asarray(pta_future, dtype=np.float64) - CONST_PX_PTA * np.multiply(px, usd_cnh)
+
+
+def zce_sgx_spread(px_future, px, usd_cnh):
+    """ZCEPX-SGXPX = PX 선물 - PX * 상수 * 환율"""
+    return np.asarray(px_future, dtype=np.float64) - CONST_ZCE_SGX * np.multiply(px, usd_cnh)
+
+
+def box(pxn_values):
+    """BOX = 이번 달 PXN - 다음 달 PXN (마지막 월은 0)"""
+    pxn_values = np.asarray(pxn_values, dtype=np.float64)
+    out = np.zeros_like(pxn_values)
+    out[..., :-1] = pxn_values[..., :-1] - pxn_values[..., 1:]
+    return out
@@ -1,4 +1,5 @@
 # config.py
+import math
 
 # 공통 헤더 스타일 (기본 연녹색)
 HEADER_STYLE = """
@@ -12,4 +13,93 @@ HEADER_STYLE = """
 
 # 기타 전용 설정값들
 APP_TITLE = "Market Data Monitor v1.0"
-WINDOW_SIZE = (1200, 800)
\ No newline at end of file
+WINDOW_SIZE = (1200, 800)
+
+# 시세 캐시 유효시간(초): 이 시간 안에 다시 요청하면 네트워크를 타지 않음
+QUOTE_CACHE_TTL = 10
+
+# HTTP 연결 설정 (request/http_session.py)
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 5
+HTTP_MAX_RETRIES = 1
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_POOL_SIZE = 8
+# 재시도 사이 대기 합계(초) (urllib3: 첫 재시도는 바로, 그 다음부터 factor x 2^(n-1)초)
+HTTP_BACKOFF_TOTAL = sum(HTTP_BACKOFF_FACTOR * 2 ** (n - 1) for n in range(2, HTTP_MAX_RETRIES + 1))
+# 요청 하나가 실패로 끝나기까지의 최대 시간(초). urllib3 Retry는 연결 시간 초과도 재시도함
+# - 연결 자체가 안 될 때(예: 꺼진 proxy): 시도마다 연결 시간 초과 -> 지금 설정으로 6.1초
+# - 응답이 없을 때: 시도마다 연결 + 읽기 시간 초과 -> 16.1초
+HTTP_CONNECT_BUDGET = (HTTP_MAX_RETRIES + 1) * HTTP_CONNECT_TIMEOUT + HTTP_BACKOFF_TOTAL
+HTTP_RETRY_BUDGET = (HTTP_MAX_RETRIES + 1) * (HTTP_CONNECT_TIMEOUT + HTTP_READ_TIMEOUT) + HTTP_BACKOFF_TOTAL
+
+# upstream 호스트별 요청 제한 (초당 요청 수, 순간 최대 요청 수) — request/rate_limit.py
+# 자동 새로고침/여러 페이지가 겹쳐도 이 이상은 보내지 않음. 목록에 없는 호스트는 제한 없음
+HOST_RATE_LIMITS = {
+    "hq.sinajs.cn": (1, 3),
+    "api.sgx.com": (0.2, 2),
+    "www.sgx.com": (0.1, 1),
+}
+# 403/429(차단) 응답 후 그 호스트로 요청을 쉬는 시간(초). 쉬는 동안의 요청은 기다리지 않고 바로 실패
+HOST_BLOCK_BACKOFF = 30
+
+# source별 최대 대기시간(초): 늦은 source만 포기하고 나머지 결과는 그대로 반영
+# Sina는 요청 하나(URL 2000자까지)이므로 최악의 경우 = proxy 연결 실패 + upstream 재시도 + 토큰 대기(1/초당 요청 수)
+# 이보다 짧으면 재시도가 끝나기 전에 포기하게 됨 -> 지금 설정으로 24초
+SOURCE_TIMEOUTS = {
+    "Sina": math.ceil(HTTP_CONNECT_BUDGET + HTTP_RETRY_BUDGET + 1 / HOST_RATE_LIMITS["hq.sinajs.cn"][0]),
+    "SGX": 40,
+    "DEFAULT": 30,
+}
+
+# 같은 PC/LAN의 여러 앱이 공유하는 시세 proxy (python quote_proxy.py). None이면 직접 요청
+# 예: "http://192.168.0.10:8765" — 연결이 안 되면 QUOTE_PROXY_RETRY초 동안 직접 요청
+QUOTE_PROXY_URL = None
+QUOTE_PROXY_RETRY = 30
+# proxy 쪽 설정: 대기 주소/포트, 같은 시세를 다시 upstream에 묻지 않는 시간(초)
+QUOTE_PROXY_HOST = "0.0.0.0"
+QUOTE_PROXY_PORT = 8765
+QUOTE_PROXY_TTL = 5
+
+# 시세 배포 서버 (python quote_server.py): 서버 하나만 Sina/SGX를 가져오고 앱들은 구독만 함
+# 앱 쪽: "host:port"로 설정하면 구독 (None이면 각자 가져오기). 끊기면 QUOTE_SERVER_RETRY초마다 재연결
+QUOTE_SERVER_ADDRESS = None
+QUOTE_SERVER_RETRY = 10
+# 서버 쪽: 대기 주소/포트, 가져오기 주기(초) — QUOTE_CACHE_TTL보다 짧아야 앱이 직접 가져오지 않음
+QUOTE_SERVER_HOST = "0.0.0.0"
+QUOTE_SERVER_PORT = 8766
+QUOTE_SERVER_INTERVAL = 5
+# 가져오기(SGX는 최대 수십 초)와 별도로 보내는 heartbeat 주기. 클라이언트는 이 3배 동안 아무것도 못 받으면 재연결
+QUOTE_SERVER_HEARTBEAT = 5
+
+# SGX USD/CNH: Chrome 대신 JSON API 우선 사용 (실패 시 Selenium)
+SGX_HTTP_ENABLED = True
+SGX_API_URL = "https://api.sgx.com/derivatives/v1.0/contract-code/UC?order=asc&orderby=delivery-month&category=futures&session=-1&showTAICTrades=false"
+# None: 실제 호출 / "record": 호출 후 응답 저장 / "replay": 저장된 응답으로 오프라인 실행
+SGX_FIXTURE_MODE = None
+SGX_FIXTURE_PATH = "fixtures/sgx_uc.json"
+# Selenium 사용 시: 테이블 내용이 이 시간(초) 동안 그대로면 페이지를 새로고침
+SGX_PAGE_MAX_AGE = 60
+
+# Page1 자동 갱신 기본 주기(초)
+AUTO_REFRESH_INTERVAL = 30
+
+# 가져온 시세를 모두 쌓아두는 로컬 저장소 (SQLite, request/quote_store.py)
+# 상대 경로는 exe(소스 실행이면 프로젝트) 폴더 기준, 그 폴더에 쓸 수 없으면 사용자 데이터 폴더 기준 (app_paths.py)
+QUOTE_STORE_ENABLED = True
+QUOTE_STORE_PATH = "data/quotes.db"
+
+# 시작 시 이전 세션 값(저장된 시세 + 입력값)을 먼저 보여주고 백그라운드에서 새로고침
+WARM_START_ENABLED = True
+SESSION_STATE_PATH = "data/session.json"
+
+# headless.py 리포트 저장 폴더
+HEADLESS_OUTPUT_DIR = "reports"
+
+# Page3 시나리오 표 최대 행 수 (offset 수 x 환율 offset 수). 잘못된 step(예: 0.0001)으로 메모리/화면이 멈추지 않도록
+SCENARIO_MAX_ROWS = 10000
+
+# 곡선 길이(개월): 상장 월물 달력(calc/contract_calendar.py) 기준으로 24~36개월도 가능
+# 상장되지 않은 월물은 요청하지 않고 N/A로 표시 (예: ZCE PTA/PX는 12개월까지만 상장)
+PAGE1_MONTHS = 12
+# Page2는 이 기간 안의 주요 월물(1, 3, 5, 9월)과 근월물을 보여줌
+PAGE2_MONTHS = 13
@@ -0,0 +1,177 @@
+"""
+헤드리스 리포트: 화면(PyQt) 없이 가져오기 -> 계산 -> CSV/JSON 저장
+
+    python headless.py                          # 한 번 실행, reports/ 에 CSV 저장
+    python headless.py --format json --pages 1 2
+    python headless.py --interval 300           # 5분마다 반복
+
+Page1 수동 입력(Mopj, PX, spread)과 Page3 계산기 입력은 GUI가 종료할 때 저장한 세션 상태를 사용합니다.
+"""
+import argparse
+import csv
+import datetime
+import json
+import os
+import sys
+import time
+
+import config
+from calc.page1_sheet import HEADERS as PAGE1_HEADERS
+from calc.page1_sheet import (PAGE1_QUOTES, build_page1_sheet, future_updates, month_labels, saved_input_updates,
+                              sgx_updates)
+from calc.page2_report import HEADERS as PAGE2_HEADERS
+from calc.page2_report import PAGE2_QUOTES, build_page2_rows
+from calc.scenario import CALCULATORS, FUTURE_INSTRUMENT, PAGE3_QUOTES, offset_range, scenario_grid
+from app_paths import data_path
+from request.sources import fetch_quotes
+from session_state import load_session_state
+
+PAGE3_HEADERS = ["Calculator", "Month", "Target", "Spread", "Future", "USD/CNH"]
+MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+
+# Page3 콤보박스는 12개월 곡선에서 월을 고름 (GUI와 같은 기준)
+PAGE3_MONTHS = 12
+# 페이지별 곡선 길이 (여러 페이지를 함께 뽑으면 가장 긴 곡선 1회로 가져옴)
+PAGE_MONTHS = {1: config.PAGE1_MONTHS, 2: config.PAGE2_MONTHS, 3: PAGE3_MONTHS}
+
+# 페이지별로 필요한 종목/필드 (request/sources.py)
+PAGE_QUOTES = {1: PAGE1_QUOTES, 2: PAGE2_QUOTES, 3: PAGE3_QUOTES}
+
+
+def fetch_market(pages, force=False):
+    """선택한 페이지에 필요한 종목을 합쳐 source별 1회씩 (Sina 묶음 1회 + 필요하면 SGX 1회) 가져옴"""
+    wants = {}
+    for page in pages:
+        for name, fields in PAGE_QUOTES[page].items():
+            wants.setdefault(name, [])
+            wants[name] += [f for f in fields if f not in wants[name]]
+    months = max(PAGE_MONTHS[page] for page in pages)
+    return fetch_quotes(
+        wants, months=months, force=force,
+        on_error=lambda source, e: print(f"{source} 가져오기 실패: {e}", file=sys.stderr),
+    )
+
+
+def build_page1(market, state):
+    """Page1 표 전체: [라벨, 값 12개] 행 목록 (config.PAGE1_MONTHS개월)"""
+    sheet = build_page1_sheet(config.PAGE1_MONTHS)
+    labels = month_labels(sheet.n_rows)
+    updates = saved_input_updates(state.get("page1", {}).get("inputs", {}), labels)
+    updates.update(future_updates(market, sheet.n_rows))
+    if "USDCNH" in market:
+        updates.update(sgx_updates(market["USDCNH"]["price"], sheet.n_rows)[0])
+    sheet.set_many(updates)
+    sheet.recompute_all()
+    return [[labels[row]] + [float(v) for v in sheet.values[row, 1:]] for row in range(sheet.n_rows)]
+
+
+def build_page2(market):
+    if any(name not in market for name in PAGE2_QUOTES):
+        return []
+    return [list(row) for row in build_page2_rows(market, months=config.PAGE2_MONTHS)]
+
+
+def _month_price(curve, month):
+    """곡선에서 'jan' 같은 월의 가격 (Page3 콤보박스 자동 선택과 같은 기준). 없으면 None"""
+    month_idx = str(MONTHS.index(month) + 1).zfill(2)
+    price = None
+    for item in curve:
+        if item['month'].split('/')[-1] == month_idx and item['price'] != "N/A":
+            price = float(item['price'])
+    return price
+
+
+def build_page3(market, state):
+    """세션에 저장된 계산기 입력 + 새 시세로 시나리오 그리드 계산 (spread가 없는 계산기는 건너뜀)"""
+    rows = []
+    if any(name not in market for name in PAGE3_QUOTES):
+        return rows
+    for (title, mode), calc in zip(CALCULATORS, state.get("page3", [])):
+        try:
+            spread = float(calc.get("spread", ""))
+        except ValueError:
+            continue
+        month = calc.get("month", "jan")
+        future = _month_price(market[FUTURE_INSTRUMENT[mode]]["price"][:PAGE3_MONTHS], month)
+        usd = _month_price(market["USDCNH"]["price"][:PAGE3_MONTHS], month)
+        if future is None or not usd:
+            print(f"{title}: {month} 시세가 없어 건너뜀", file=sys.stderr)
+            continue
+
+        # Page3는 입력칸 글자를 그대로 저장하므로 빈 값/입력 중이던 값이 올 수 있음
+        vary = "spread" if calc.get("vary", 0) == 1 else "price"
+        try:
+            offsets = offset_range(*(float(x) for x in calc.get("offsets", ["-2", "2", "0.5"])))
+            fx_offsets = offset_range(*(float(x) for x in calc.get("fx_offsets", ["0", "0", "0.01"])))
+            target, spreads, usd_values = scenario_grid(mode, future, spread, usd, offsets, fx_offsets, vary=vary)
+        except (ValueError, ArithmeticError) as e:
+            print(f"{title}: offset 입력이 올바르지 않아 건너뜀 ({e})", file=sys.stderr)
+            continue
+        for i, u in enumerate(usd_values):
+            for j in range(len(offsets)):
+                rows.append([title, month, float(target[i, j]), float(spreads[i, j]), future, float(u)])
+    return rows
+
+
+def _atomic_write(path, write_fn, newline=None, encoding='utf-8'):
+    """다른 작업이 읽는 도중에 반쯤 쓴 파일을 보지 않도록 임시 파일에 쓰고 교체"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', newline=newline, encoding=encoding) as f:
+        write_fn(f)
+    os.replace(tmp_path, path)
+
+
+def write_report(tables, out_dir, fmt):
+    """tables: {이름: (헤더, 행 목록)} -> 저장한 파일 경로 목록"""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    if fmt == "json":
+        payload = {
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            **{name: [dict(zip(headers, row)) for row in rows] for name, (headers, rows) in tables.items()},
+        }
+        path = os.path.join(out_dir, "report.json")
+        _atomic_write(path, lambda f: json.dump(payload, f, ensure_ascii=False, indent=1))
+        paths.append(path)
+    else:
+        for name, (headers, rows) in tables.items():
+            path = os.path.join(out_dir, f"{name}.csv")
+            # Page1 CSV 내보내기와 같은 인코딩 (엑셀 호환)
+            _atomic_write(path, lambda f: csv.writer(f).writerows([headers] + rows), newline='', encoding='utf-8-sig')
+            paths.append(path)
+    return paths
+
+
+def run_once(pages, out_dir, fmt, force=False):
+    market = fetch_market(pages, force)
+    state = load_session_state()
+    tables = {}
+    if 1 in pages:
+        tables["page1"] = (PAGE1_HEADERS, build_page1(market, state))
+    if 2 in pages:
+        tables["page2"] = (PAGE2_HEADERS, build_page2(market))
+    if 3 in pages:
+        tables["page3"] = (PAGE3_HEADERS, build_page3(market, state))
+    return write_report(tables, out_dir, fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="화면 없이 Page1/2/3 표를 CSV/JSON으로 저장")
+    parser.add_argument("--pages", type=int, nargs="+", choices=[1, 2, 3], default=[1, 2, 3])
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--out", default=data_path(config.HEADLESS_OUTPUT_DIR), help="저장 폴더 (기본: exe/프로젝트 폴더의 reports)")
+    parser.add_argument("--interval", type=float, default=0, help="반복 주기(초). 0이면 한 번만 실행")
+    parser.add_argument("--force", action="store_true", help="시세 캐시를 무시하고 새로 가져오기")
+    args = parser.parse_args(argv)
+
+    while True:
+        started = time.monotonic()
+        for path in run_once(args.pages, args.out, args.format, args.force):
+            print(f"저장: {path}")
+        if args.interval <= 0:
+            return 0
+        time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
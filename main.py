@@ -1,20 +1,30 @@
 import sys
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QTableWidget, QTableWidgetItem, 
-                             QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QStackedWidget)
-from PyQt6.QtGui import QColor, QFont
-from PyQt6.QtCore import Qt
-
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
-
-from page.page1 import Page1
-from page.page2 import Page2
-from page.page3 import Page3
-from request.request_other import get_year_prices
-# from request_sgx import get_year_sgx , turn_off_driver
+import importlib
+
+# --startup-report: 이후 모든 import 시간을 측정 (python -X importtime과 비슷한 리포트)
+import startup_report
+if "--startup-report" in sys.argv:
+    startup_report.install()
+
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton,
+                             QStackedWidget, QMessageBox)
+from PyQt6.QtCore import QTimer, pyqtSignal
+
+import config
+from request.request_sgx import turn_off_driver, warm_up_driver
+from session_state import load_session_state, save_session_state
 # 공통 스타일: 엑셀 느낌의 헤더 스타일
 
+# 페이지는 처음 열 때 import/생성 (Page3는 계산기 4개라 시작 시 만들지 않음)
+# 문자열로 import하므로 PyInstaller가 찾지 못함 -> build.yml에서 --hidden-import로 포함
+PAGES = [("page.page1", "Page1"), ("page.page2", "Page2"), ("page.page3", "Page3")]
+# 시세 서버에서 새 값이 오면 다시 그리는 페이지 (Page3는 사용자가 고른 값을 덮어쓰지 않도록 제외)
+PUSH_PAGES = [0, 1]
+
 class MainApp(QMainWindow):
+    # 수신 스레드 -> GUI 스레드로 넘기기 위한 시그널 (바뀐 종목)
+    quotes_pushed = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Market Analysis Tool")
@@ -35,25 +45,123 @@ class MainApp(QMainWindow):
         nav_layout.addWidget(self.btn_page3)
         main_layout.addLayout(nav_layout)
 
-        # 페이지를 담을 스택 위젯 생성
+        # 페이지를 담을 스택 위젯 생성 (처음 열기 전까지는 빈 자리표시 위젯)
         self.stack = QStackedWidget()
-        self.page1 = Page1()
-        self.page2 = Page2()
-        self.page3 = Page3()
-        self.stack.addWidget(self.page1)
-        self.stack.addWidget(self.page2)
-        self.stack.addWidget(self.page3)
+        self.pages = [None] * len(PAGES)
+        for _ in PAGES:
+            self.stack.addWidget(QWidget())
         main_layout.addWidget(self.stack)
 
+        self.warm_start = False
+        self.session_state = {}
+        self.subscriber = None
+        self.quotes_pushed.connect(self.on_quotes_pushed)
+
         # 버튼 클릭 이벤트 연결
-        self.btn_page1.clicked.connect(lambda: self.stack.setCurrentIndex(0))
-        self.btn_page2.clicked.connect(lambda: self.stack.setCurrentIndex(1))
-        self.btn_page3.clicked.connect(lambda: self.stack.setCurrentIndex(2))
+        self.btn_page1.clicked.connect(lambda: self.show_page(0))
+        self.btn_page2.clicked.connect(lambda: self.show_page(1))
+        self.btn_page3.clicked.connect(lambda: self.show_page(2))
+
+    @property
+    def page1(self):
+        return self.get_page(0)
+
+    @property
+    def page2(self):
+        return self.get_page(1)
+
+    @property
+    def page3(self):
+        return self.get_page(2)
+
+    def get_page(self, index):
+        """페이지를 처음 요청할 때 모듈 import + 생성하고 자리표시 위젯과 교체"""
+        if self.pages[index] is None:
+            module_name, class_name = PAGES[index]
+            page = getattr(importlib.import_module(module_name), class_name)()
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.pages[index] = page
+            if self.warm_start:
+                self.restore_page(index)
+                # 이벤트 루프로 돌아간 뒤 새 시세로 교체
+                QTimer.singleShot(0, page.load_all_market_data)
+        return self.pages[index]
+
+    def show_page(self, index):
+        self.stack.setCurrentWidget(self.get_page(index))
+
+    def restore_session(self):
+        """이후 생성되는 페이지마다 이전 세션 값을 먼저 표시하고 백그라운드에서 새로고침"""
+        self.session_state = load_session_state()
+        self.warm_start = True
+        for index, page in enumerate(self.pages):
+            if page is not None:
+                self.restore_page(index)
+
+    def restore_page(self, index):
+        """이전 세션 입력값 + 로컬 저장소의 마지막 시세를 네트워크 없이 바로 표시 (회색 = 이전 값)"""
+        page = self.pages[index]
+        if hasattr(page, "restore_state"):
+            page.restore_state(self.session_state.get(f"page{index + 1}"))
+        if hasattr(page, "restore_quotes"):
+            page.restore_quotes()
+
+    def subscribe_quotes(self, address):
+        """시세 서버 구독: 받은 값은 캐시에 들어가므로 페이지의 가져오기는 네트워크를 타지 않음"""
+        from request.quote_client import QuoteSubscriber
+        self.subscriber = QuoteSubscriber(address, on_update=self.quotes_pushed.emit).start()
+
+    def on_quotes_pushed(self, changes):
+        """서버가 보낸 값으로만 다시 그림 (load_all_market_data를 부르면 서버의 SGX 가져오기가 실패해
+        USDCNH 캐시가 만료됐을 때 모든 앱이 각자 SGX로 가게 됨)"""
+        quotes = self.subscriber.current_quotes()
+        for index in PUSH_PAGES:
+            if self.pages[index] is not None:
+                self.pages[index].show_pushed_quotes(quotes)
+
+    def save_session(self):
+        # 이번에 열지 않은 페이지는 이전에 저장된 값을 그대로 유지
+        state = dict(self.session_state)
+        for index, page in enumerate(self.pages):
+            if page is not None and hasattr(page, "export_state"):
+                state[f"page{index + 1}"] = page.export_state()
+        save_session_state(state)
 
 if __name__ == "__main__":
+    report_mode = "--startup-report" in sys.argv
+    startup_report.mark("imports")
     app = QApplication(sys.argv)
     window = MainApp()
+    # sys.exit 이후 코드는 실행되지 않으므로 Qt 종료 훅에서 driver 정리
+    app.aboutToQuit.connect(turn_off_driver)
+    # 리포트 모드에서는 네트워크/세션 파일을 건드리지 않음
+    if config.WARM_START_ENABLED and not report_mode:
+        window.restore_session()
+        app.aboutToQuit.connect(window.save_session)
+    # 시세 서버를 구독하면 Sina/SGX(Chrome)는 서버에서만 돌림
+    subscribed = bool(config.QUOTE_SERVER_ADDRESS) and not report_mode
+    if subscribed:
+        window.subscribe_quotes(config.QUOTE_SERVER_ADDRESS)
+        app.aboutToQuit.connect(window.subscriber.stop)
+    window.show_page(0)
+    startup_report.mark("window")
     window.show()
-    
+    # JSON 경로를 쓰지 않을 때만 창이 그려진 뒤 백그라운드에서 Chrome 미리 띄우기
+    if not config.SGX_HTTP_ENABLED and not report_mode and not subscribed:
+        QTimer.singleShot(0, warm_up_driver)
+
+    if report_mode:
+        # 첫 화면이 그려진 뒤(이벤트 루프 첫 순회) 리포트 출력 후 종료
+        def finish_report():
+            startup_report.mark("first paint")
+            text, path = startup_report.report()
+            # --windowed exe는 콘솔이 없으므로 창으로도 보여줌
+            if sys.stdout is None:
+                QMessageBox.information(window, "시작 시간 리포트", text + (f"\n\n저장: {path}" if path else ""))
+            app.quit()
+        QTimer.singleShot(0, finish_report)
+
     sys.exit(app.exec())
-    turn_off_driver()
\ No newline at end of file
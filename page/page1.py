@@ -1,42 +1,60 @@
 import datetime
 import csv
 from PyQt6.QtWidgets import *
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QColor
 from PyQt6.QtCore import Qt , QTimer
 from dateutil.relativedelta import relativedelta
 
 import config
-from request.request_other import get_year_prices 
-from request.request_sgx import get_year_sgx
+from request.sources import source_tasks, source_timeouts, stored_quotes
+from calc.page1_sheet import (CONST_PX_PTA, CONST_ZCE_SGX, HEADERS, build_page1_sheet,
+                              COL_MOPJ, COL_MOPJ_SPREAD, COL_PX, COL_PX_SPREAD, FUTURE_INSTRUMENTS, PAGE1_QUOTES,
+                              future_updates, month_labels, saved_input_updates, sgx_updates)
+from page.table_models import SheetTableModel
 from screenshot import take_screenshot
+from session_state import stale_label
+from worker import ProgressLabel, start_worker
+
+# 세션 간에 유지하는 수동 입력 열 (Mopj, MOPJ SPREAD, PX, PX SPREAD)
+INPUT_COLS = [COL_MOPJ, COL_MOPJ_SPREAD, COL_PX, COL_PX_SPREAD]
+# 복원한 이전 세션 시세 글자색 (새로 가져오면 해제)
+STALE_COLOR = "#9E9E9E"
 
 class Page1(QWidget):
     def __init__(self):
         super().__init__()
-        self.CONST_PX_PTA = 0.655 * 1.13 * 1.02
-        self.CONST_ZCE_SGX = 1.13 * 1.02
+        self.CONST_PX_PTA = CONST_PX_PTA
+        self.CONST_ZCE_SGX = CONST_ZCE_SGX
+        self._worker = None
         
         layout = QVBoxLayout()
 
-        self.headers = [
-            "Month", "BRENT", "Mopj", "MOPJ SPREAD", "PX", 
-            "PX SPREAD", "PXN", "PX Futures", "PTA Futures", 
-            "PX-PTA SPREAD", "ZCEPX-SGXPX", "USD/CNH", "BOX"
-        ]
+        self.headers = HEADERS
+        # 실제 값(float64)은 sheet가 보관하고, 모델은 표시할 때만 포맷
+        # PX Futures(7)와 PTA Futures(8)는 소수점 0자리 적용
+        # 행 수 = 곡선 길이 (config.PAGE1_MONTHS)
+        self.n_rows = config.PAGE1_MONTHS
+        self.sheet = build_page1_sheet(self.n_rows)
+        self.model = SheetTableModel(self.sheet, self.headers, precisions={7: 0, 8: 0})
         
-        self.table = QTableWidget(12, len(self.headers))
-        self.table.setHorizontalHeaderLabels(self.headers)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # UI 초기화 및 스타일 적용
-        self.init_table_defaults()
         self.init_month_labels() # 강조 로직 포함
         
-        self.table.itemChanged.connect(self.on_item_changed)
         layout.addWidget(self.table)
 
         btn_layout = QHBoxLayout()
         self.btn_load = QPushButton("Market 데이터 로드")
-        self.btn_load.clicked.connect(self.load_all_market_data)
+        self.btn_load.clicked.connect(lambda: self.load_all_market_data())
+        
+        self.btn_refresh = QPushButton("강제 새로고침")
+        self.btn_refresh.clicked.connect(lambda: self.load_all_market_data(force=True))
+        
+        self.btn_cancel = QPushButton("로드 취소")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_loading)
         
         self.btn_reset = QPushButton("모든 값 초기화")
         self.btn_reset.clicked.connect(self.reset_all_data)
@@ -48,200 +66,207 @@ class Page1(QWidget):
         self.btn_capture.clicked.connect(lambda: take_screenshot(self, "Page1"))
         
         btn_layout.addWidget(self.btn_load)
+        btn_layout.addWidget(self.btn_refresh)
+        btn_layout.addWidget(self.btn_cancel)
         btn_layout.addWidget(self.btn_reset)
         btn_layout.addWidget(self.btn_excel)
         btn_layout.addWidget(self.btn_capture)
         layout.addLayout(btn_layout)
         
-        self.setLayout(layout)
+        # 자동 갱신(스트리밍) 모드: 주기적으로 가져와 바뀐 셀만 갱신
+        # 시세 캐시 TTL보다 짧은 주기는 캐시된 값을 받으므로 upstream 부하가 늘지 않음
+        stream_layout = QHBoxLayout()
+        self.chk_auto = QCheckBox("자동 갱신")
+        self.spin_interval = QSpinBox()
+        self.spin_interval.setRange(5, 3600)
+        self.spin_interval.setSuffix(" 초")
+        self.spin_interval.setValue(config.AUTO_REFRESH_INTERVAL)
+        self.spin_interval.valueChanged.connect(
+            lambda v: self.auto_timer.setInterval(v * 1000))
+        self.auto_timer = QTimer(self)
+        self.auto_timer.timeout.connect(self.on_auto_refresh_tick)
+        self.chk_auto.toggled.connect(self.toggle_auto_refresh)
 
-    def init_table_defaults(self):
-        for row in range(12):
-            for col in [3, 5]: 
-                self.set_val(row, col, 0)
+        # source별 로딩 상태 표시
+        self.progress_label = ProgressLabel()
+        stream_layout.addWidget(self.chk_auto)
+        stream_layout.addWidget(self.spin_interval)
+        stream_layout.addWidget(self.progress_label)
+        stream_layout.addStretch()
+        layout.addLayout(stream_layout)
+        
+        self.setLayout(layout)
 
     def init_month_labels(self):
         """날짜 형식 수정(26-JAN) 및 행별 강조(Bold/Color) 적용"""
         now = datetime.datetime.now()
-        bold_font = QFont()
-        bold_font.setBold(True)
         
         # 강조할 월 리스트 (숫자 기준)
         bold_months = [1, 3, 5, 7, 9, 11]
         color_months = [1, 5, 9]
 
-        for i in range(12):
+        # 1. 날짜 형식 수정: 26-JAN
+        labels = month_labels(self.sheet.n_rows, now)
+        bold_rows = []
+        row_backgrounds = {}
+        for i in range(self.sheet.n_rows):
             target_date = now + relativedelta(months=i)
             month_int = target_date.month
-            
-            # 1. 날짜 형식 수정: 26-JAN
-            month_str = target_date.strftime("%y-%b").upper()
-            item = QTableWidgetItem(month_str)
-            item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item)
 
             # 2. 월별 강조 로직
             # 홀수 달 볼드 처리
             if month_int in bold_months:
-                for col in range(len(self.headers)):
-                    if not self.table.item(i, col):
-                        self.table.setItem(i, col, QTableWidgetItem(""))
-                    self.table.item(i, col).setFont(bold_font)
-            
+                bold_rows.append(i)
             # 1, 5, 9월 색상 강조 (연한 파랑/하늘색)
             if month_int in color_months:
-                for col in range(len(self.headers)):
-                    if not self.table.item(i, col):
-                        self.table.setItem(i, col, QTableWidgetItem(""))
-                    self.table.item(i, col).setBackground(QColor("#D9EAD3"))
-
-    def set_val(self, row, col, val, precision=2, is_editable=True):
-        """특정 컬럼(PX/PTA Futures)에 대해 소수점 제거 적용"""
-        self.table.blockSignals(True)
-        
-        # PX Futures(7)와 PTA Futures(8)는 소수점 0자리 적용
-        if col in [7, 8]:
-            precision = 0
-            
-        item = self.table.item(row, col)
-        if not item:
-            item = QTableWidgetItem()
-            self.table.setItem(row, col, item)
-        
-        item.setText(f"{val:,.{precision}f}")
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        if not is_editable:
-            item.setBackground(QColor("#F0F4F8"))
-        self.table.blockSignals(False)
+                row_backgrounds[i] = QColor("#D9EAD3")
 
-    def on_item_changed(self, item):
-        col = item.column()
-        if col in [1, 2, 3, 4, 5, 7, 8, 11]:
-            self.calculate_all_logic()
+        self.model.set_row_style(labels, bold_rows, row_backgrounds)
+
+    def set_inputs(self, updates):
+        """{(row, col): 값}을 sheet에 반영하고, 값이 바뀐 셀(의존 셀 포함)을 반환"""
+        return self.model.set_values(updates)
 
     def calculate_all_logic(self):
-        """계단식 로직 및 수식 계산"""
-        for row in range(12):
-            if row > 0:
-                self.set_val(row, 2, self.get_val(row-1, 2) - self.get_val(row-1, 3)) 
-                self.set_val(row, 4, self.get_val(row-1, 4) - self.get_val(row-1, 5)) 
+        """계단식 로직 및 수식 계산 (전체 재계산)"""
+        self.sheet.recompute_all()
+        self.model.refresh_all()
+
+    def get_val(self, row, col):
+        return self.sheet.get(row, col)
 
-            mopj = self.get_val(row, 2)
-            px = self.get_val(row, 4)
-            px_future = self.get_val(row, 7)
-            pta_future = self.get_val(row, 8)
-            usd_cnh = self.get_val(row, 11)
+    def load_all_market_data(self, force=False):
+        """API 로드를 백그라운드에서 시작 (force=True이면 캐시를 무시하고 새로 가져옴)
+        결과는 source별로 도착하는 대로 테이블에 반영됩니다."""
+        if self._worker is not None:
+            return
 
-            self.set_val(row, 6, px - mopj)
-            self.set_val(row, 9, pta_future - (self.CONST_PX_PTA * px * usd_cnh))
-            self.set_val(row, 10, px_future - (px * self.CONST_ZCE_SGX * usd_cnh))
+        # Sina 3종목은 한 번의 요청으로 묶고, SGX는 따로 (source별 task)
+        tasks = source_tasks(PAGE1_QUOTES, months=self.n_rows, force=force)
+        self.progress_label.reset([name for name, _ in tasks])
+        self.btn_load.setEnabled(False)
+        self.btn_refresh.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+        self._worker = start_worker(
+            tasks,
+            on_result=self.on_fetch_result,
+            on_progress=self.progress_label.set_status,
+            on_error=self.progress_label.set_error,
+            on_finished=self.on_fetch_finished,
+            timeouts=source_timeouts(PAGE1_QUOTES),
+        )
 
-        for row in range(11):
-            self.set_val(row, 12, self.get_val(row, 6) - self.get_val(row+1, 6))
+    def cancel_loading(self):
+        if self._worker is not None:
+            self._worker.cancel()
 
-    def get_val(self, row, col):
-        if row < 0 or row >= 12: return 0.0
-        item = self.table.item(row, col)
-        if not item or not item.text() or item.text() == "N/A": return 0.0
-        try:
-            return float(item.text().replace(',', ''))
-        except ValueError:
-            return 0.0
-
-    def load_all_market_data(self):
-        """API 로드 및 2-Pass 보정 (앞 칸 우선 채우기 -> 남은 빈칸 뒷 칸 채우기)"""
-        self.table.blockSignals(True)
-        
-        # 1. API 데이터 기본 로드 (기존 소스 동일)
-        pta_data = get_year_prices("nf_TA", 8)
-        px_future_data = get_year_prices("nf_PX", 8)
-        brent_oil = get_year_prices("hf_OIL", 8)
-        sgx_value = get_year_sgx()
-
-        for row in range(12):
-            if row < len(brent_oil) and brent_oil[row]['price'] != 'N/A':
-                self.set_val(row, 1, float(brent_oil[row]['price']))
-            if row < len(px_future_data) and px_future_data[row]['price'] != 'N/A':
-                self.set_val(row, 7, float(px_future_data[row]['price']))
-            if row < len(pta_data) and pta_data[row]['price'] != 'N/A':
-                self.set_val(row, 8, float(pta_data[row]['price']))
-            
-            if row < len(sgx_value) and sgx_value[row]['price'] != 'N/A':
-                self.set_val(row, 11, float(sgx_value[row]['price']))
-                item = self.table.item(row, 11)
-                if item: item.setForeground(QColor("black"))
-            else:
-                self.set_val(row, 11, 0)
-
-        # 2. [Pass 1] 순방향 보정: 앞 칸(위)의 값을 아래로 전파 (앞 칸 우선 논리)
-        check = [False for i in range(1,13)]
-
-        for row in range(1, 12): # 1번 행부터 시작
-            if self.get_val(row, 11) == 0 :
-                prev_v = self.get_val(row - 1, 11)
-                if prev_v != 0 and check[row-1] == False:
-                    check[row] = True
-                    self.set_val(row, 11, prev_v)
-                    item = self.table.item(row, 11)
-                    if item: item.setForeground(QColor("blue"))
-
-        # 3. [Pass 2] 역방향 보정: 여전히 0인 칸은 뒷 칸(아래)의 값을 위로 전파
-        for row in range(10, -1, -1): # 10번 행부터 0번 행까지 거꾸로
-            if self.get_val(row, 11) == 0:
-                next_v = self.get_val(row + 1, 11)
-                if next_v != 0 and check[row+1] == False:
-                    check[row] = True
-                    self.set_val(row, 11, next_v)
-                    item = self.table.item(row, 11)
-                    if item: item.setForeground(QColor("blue"))
-
-        self.table.blockSignals(False)
-        self.calculate_all_logic()
-        print("2-Pass 환율 보정 완료 (앞 칸 우선순위 보장)")
+    def on_fetch_finished(self):
+        self._worker = None
+        self.btn_load.setEnabled(True)
+        self.btn_refresh.setEnabled(True)
+        self.btn_cancel.setEnabled(False)
+
+    def on_fetch_result(self, source, quotes):
+        # 취소 이후 늦게 도착한 결과는 버림
+        if self._worker is None or self._worker.is_cancelled():
+            return
+        # 값이 바뀐 셀과 그에 의존하는 수식 셀만 다시 계산/표시
+        self.flash_cells(self.apply_quotes(quotes))
+
+    def show_pushed_quotes(self, quotes):
+        """시세 서버가 보낸 전체 값 반영 (네트워크 요청 없음), 바뀐 셀만 깜빡임"""
+        self.flash_cells(self.apply_quotes(quotes))
+
+    def apply_quotes(self, quotes):
+        """{종목 이름: {필드: rows}} 중 이 페이지 종목만 반영, 바뀐 셀 목록 반환"""
+        changed = []
+        if any(name in quotes for name in FUTURE_INSTRUMENTS):
+            changed += self.apply_future_data(quotes)
+        if "USDCNH" in quotes:
+            changed += self.apply_sgx_data(quotes["USDCNH"]["price"])
+        return changed
+
+    def apply_future_data(self, quotes):
+        """Brent/PX/PTA 선물 가격 반영, 바뀐 셀 목록 반환"""
+        updates = future_updates(quotes, self.n_rows)
+        # 이전 세션 표시(회색) 해제
+        self.model.set_cell_foreground([(row, col) for row in range(self.n_rows) for col in (1, 7, 8)], None)
+        return self.set_inputs(updates)
+
+    def apply_sgx_data(self, sgx_value):
+        """USD/CNH 반영 및 2-Pass 보정, 바뀐 셀 목록 반환"""
+        updates, filled = sgx_updates(sgx_value, self.n_rows)
+
+        changed = self.set_inputs(updates)
+        # 보정으로 채운 값은 파란색으로 구분
+        self.model.set_cell_foreground([(row, 11) for row in range(self.n_rows) if not filled[row]], None)
+        self.model.set_cell_foreground([(row, 11) for row in range(self.n_rows) if filled[row]], "blue")
+        return changed
+
+    # --- 이전 세션 복원 (warm start) ---
+    def export_state(self):
+        """수동 입력 열을 월물 라벨(26-JAN) 기준으로 저장: 달이 바뀌어도 같은 월물에 복원됨"""
+        return {
+            "inputs": {
+                self.model.row_labels[row]: {str(col): self.sheet.get(row, col) for col in INPUT_COLS}
+                for row in range(self.sheet.n_rows)
+            }
+        }
+
+    def restore_state(self, state):
+        updates = saved_input_updates((state or {}).get("inputs", {}), self.model.row_labels)
+        if updates:
+            self.set_inputs(updates)
+
+    def restore_quotes(self):
+        """로컬 저장소의 마지막 시세를 회색(이전 값)으로 표시. 복원한 값이 있으면 True"""
+        quotes, times = stored_quotes(PAGE1_QUOTES, self.n_rows)
+        if not quotes:
+            return False
+        self.apply_quotes(quotes)
+        if any(name in quotes for name in FUTURE_INSTRUMENTS):
+            self.model.set_cell_foreground([(row, col) for row in range(self.n_rows) for col in (1, 7, 8)], STALE_COLOR)
+        if "USDCNH" in quotes:
+            self.model.set_cell_foreground([(row, 11) for row in range(self.n_rows)], STALE_COLOR)
+        # 가장 오래된 종목 기준으로 표시
+        self.progress_label.set_stale(stale_label(min(times.values())))
+        return True
+
+    def flash_cells(self, cells, duration=600):
+        """바뀐 셀만 잠깐 노란색으로 깜빡인 뒤 원래 배경색으로 복구"""
+        cells = list(cells)
+        if cells:
+            self.model.set_cell_background(cells, "#FFF176")
+            QTimer.singleShot(duration, lambda: self.model.set_cell_background(cells, None))
+
+    def toggle_auto_refresh(self, enabled):
+        if enabled:
+            self.auto_timer.start(self.spin_interval.value() * 1000)
+            self.load_all_market_data()
+        else:
+            self.auto_timer.stop()
+
+    def on_auto_refresh_tick(self):
+        # 이전 로드가 아직 진행 중이면 이번 주기는 건너뜀
+        if self._worker is None:
+            self.load_all_market_data()
 
     def reset_all_data(self):
         """모든 데이터를 초기화하고 Spread 열을 0.5초간 노란색으로 깜빡임"""
-        self.table.blockSignals(True)
-        
         # 1. 모든 값 0으로 초기화
-        for row in range(12):
-            for col in range(1, len(self.headers)):
-                self.set_val(row, col, 0)
+        self.sheet.clear()
+        self.model.cell_foregrounds.clear()
         
-        # 2. 기본값 및 라벨 재설정 (스타일 포함)
-        self.init_table_defaults()
+        # 2. 라벨 재설정 (스타일 포함)
         self.init_month_labels() 
         
         # 3. Spread 열(3번, 5번 컬럼)을 노란색으로 변경 (하이라이트 시작)
-        for row in range(12):
-            for col in [3, 5]: # MOPJ SPREAD, PX SPREAD
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QColor("yellow"))
-        
-        self.table.blockSignals(False)
+        # MOPJ SPREAD, PX SPREAD
+        spread_cells = [(row, col) for row in range(self.sheet.n_rows) for col in [3, 5]]
+        self.model.set_cell_background(spread_cells, "yellow")
 
-        # 4. 0.5초(500ms) 후 색상을 원래대로 돌리는 타이머 작동
-        # 기존에 작성하신 init_month_labels가 배경색(강조색)을 다시 잡아주므로 이를 활용합니다.
-        QTimer.singleShot(500, self.restore_table_style)
-
-    def restore_table_style(self):
-        """깜빡임이 끝난 후 테이블 스타일을 원래대로 복구"""
-        self.table.blockSignals(True)
-        
-        # Spread 열의 노란색을 지우기 위해 배경색 초기화 (기본 흰색)
-        for row in range(12):
-            for col in [3, 5]:
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QColor("white"))
-        
-        # 1, 5, 9월물 등에 적용된 배경색 강조를 다시 입힘
-        self.init_month_labels()
-        
-        self.table.blockSignals(False)
+        # 4. 0.5초(500ms) 후 원래 배경색(월별 강조색 포함)으로 복구
+        QTimer.singleShot(500, lambda: self.model.set_cell_background(spread_cells, None))
 
     def export_to_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save CSV", "", "CSV Files (*.csv)")
@@ -250,8 +275,8 @@ class Page1(QWidget):
                 with open(path, 'w', newline='', encoding='utf-8-sig') as f:
                     writer = csv.writer(f)
                     writer.writerow(self.headers)
-                    for row in range(12):
-                        row_data = [self.table.item(row, col).text() if self.table.item(row, col) else "" for col in range(len(self.headers))]
+                    for row in range(self.sheet.n_rows):
+                        row_data = [self.model.display_text(row, col) for col in range(len(self.headers))]
                         writer.writerow(row_data)
                 QMessageBox.information(self, "성공", "파일이 생성되었습니다.")
             except Exception as e:
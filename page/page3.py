@@ -1,30 +1,43 @@
 import sys
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QLabel, QHeaderView, QComboBox, 
+                             QTableView, QLabel, QHeaderView, QComboBox, 
                              QPushButton, QLineEdit, QMessageBox, QGridLayout)
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+
+from calc.scenario import CALCULATORS, FUTURE_INSTRUMENT, PAGE3_QUOTES, center_mask, offset_range, scenario_grid
+from calc.spreads import CONST_PX_PTA, CONST_ZCE_SGX
+from page.table_models import ScenarioTableModel
+from session_state import stale_label
+from worker import ProgressLabel, start_worker
 
 # 기존 사용자 모듈 로드
 try:
-    from request.request_other import get_year_prices
-    from request.request_sgx import get_year_sgx
+    from request.sources import source_tasks, source_timeouts, stored_quotes
     from screenshot import take_screenshot
 except ImportError:
     # 테스트용 더미 함수
-    def get_year_prices(code, count): return []
-    def get_year_sgx(): return []
+    def source_tasks(wants, months=12, force=False): return []
+    def source_timeouts(wants): return None
+    def stored_quotes(wants, months=12): return {}, {}
     def take_screenshot(a, b): pass
 
+
+def price_curve(quotes, name):
+    """받은 곡선 또는 None(가져오기 실패/요청 안 함)"""
+    return quotes[name]["price"] if name in quotes else None
+
 class Page3(QWidget):
     def __init__(self):
         super().__init__()
         self.months = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
         # 수식용 상수
-        self.CONST_PX_PTA = 0.655 * 1.13 * 1.02
-        self.CONST_ZCE_SGX = 1.13 * 1.02
+        self.CONST_PX_PTA = CONST_PX_PTA
+        self.CONST_ZCE_SGX = CONST_ZCE_SGX
         
         self.calculators = [] 
+        # 전체 정보 가져오기 상태 (4개 계산기가 한 번 가져온 곡선을 공유)
+        self.fetch_all_worker = None
+        self.fetch_all_data = {}
         self.init_ui()
 
     def init_ui(self):
@@ -32,17 +45,23 @@ class Page3(QWidget):
         grid_layout = QGridLayout()
 
         # 4개 계산기 구성 (제목, 모드)
-        calc_configs = [
-            ("PX-PTA (1)", "PX-PTA"), ("PX-PTA (2)", "PX-PTA"),
-            ("ZCE-SGX (1)", "ZCE-SGX"), ("ZCE-SGX (2)", "ZCE-SGX")
-        ]
-
-        for i, (title, mode) in enumerate(calc_configs):
+        for i, (title, mode) in enumerate(CALCULATORS):
             calc_widget = self.create_calculator_unit(title, mode)
             grid_layout.addWidget(calc_widget, i // 2, i % 2)
 
         main_layout.addLayout(grid_layout)
 
+        # 전체 정보 가져오기: PTA/PX 곡선과 SGX 환율 곡선을 한 번만 가져와 4개 계산기에 모두 채움
+        fetch_all_row = QHBoxLayout()
+        self.btn_fetch_all = QPushButton("전체 정보 가져오기")
+        self.btn_fetch_all.setStyleSheet("background-color: #1976D2; color: white; padding: 8px; font-weight: bold;")
+        self.btn_fetch_all.clicked.connect(self.on_fetch_all_clicked)
+        self.fetch_all_progress = ProgressLabel()
+        fetch_all_row.addWidget(self.btn_fetch_all)
+        fetch_all_row.addWidget(self.fetch_all_progress)
+        fetch_all_row.addStretch()
+        main_layout.addLayout(fetch_all_row)
+
         # 하단 캡처 버튼
         self.btn_capture = QPushButton("화면 캡쳐 (save image)")
         self.btn_capture.setStyleSheet("background-color: #607D8B; color: white; padding: 12px; font-weight: bold; margin-top: 10px;")
@@ -107,27 +126,40 @@ class Page3(QWidget):
         calc_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; height: 28px;")
         btn_row.addWidget(fetch_btn)
         btn_row.addWidget(calc_btn)
+        progress_label = ProgressLabel()
 
         # 4. 결과 테이블
         # ZCE-SGX는 PX 입력을 받아 PTA를 시뮬레이션하고, PX-PTA는 PTA 입력을 받아 PX를 시뮬레이션함
         target_col_name = "PX" if mode == "PX-PTA" else "PTA"
         res_headers = ["month", target_col_name, "spread", f_label.split()[0], "usd/chn"]
-        result_table = QTableWidget(9, 5)
-        result_table.setHorizontalHeaderLabels(res_headers)
+        result_model = ScenarioTableModel(res_headers)
+        result_model.set_month(month_combo.currentText())
+        result_table = QTableView()
+        result_table.setModel(result_model)
         result_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         result_table.verticalHeader().setVisible(False)
 
         # Month 자동 동기화
-        month_combo.currentTextChanged.connect(lambda val, rt=result_table: self.sync_month_column(val, rt))
-        for r in range(9):
-            result_table.setItem(r, 0, QTableWidgetItem(month_combo.currentText()))
+        month_combo.currentTextChanged.connect(result_model.set_month)
+
+        # 5. 시나리오 범위: (가격 또는 spread offset) x (USD/CNH offset)
+        range_row = QHBoxLayout()
+        vary_cb = QComboBox()
+        vary_cb.addItems(["가격 offset", "spread offset"])
+        range_row.addWidget(vary_cb)
+        offset_edits = self._create_range_edits(range_row, ["-2", "2", "0.5"])
+        range_row.addWidget(QLabel("환율 offset"))
+        fx_edits = self._create_range_edits(range_row, ["0", "0", "0.01"])
 
         # 데이터 저장 및 시그널 연결
         calc_id = len(self.calculators)
         self.calculators.append({
-            'mode': mode, 'header': header_table, 'result': result_table,
+            'mode': mode, 'header': header_table, 'result': result_model,
+            'vary_cb': vary_cb, 'offset_edits': offset_edits, 'fx_edits': fx_edits,
             'month_cb': month_combo, 'spread_le': spread_edit,
-            'future_cb': future_cb, 'usd_cb': usd_cb
+            'future_cb': future_cb, 'usd_cb': usd_cb,
+            'fetch_btn': fetch_btn, 'progress': progress_label,
+            'worker': None, 'fetched': {}
         })
 
         fetch_btn.clicked.connect(lambda _, cid=calc_id: self.on_fetch_clicked(cid))
@@ -135,7 +167,9 @@ class Page3(QWidget):
         reset_btn.clicked.connect(lambda _, cid=calc_id: self.on_reset_clicked(cid))
 
         layout.addWidget(header_table)
+        layout.addLayout(range_row)
         layout.addLayout(btn_row)
+        layout.addWidget(progress_label)
         layout.addWidget(QLabel(f"▶ {title_text} 시뮬레이션 결과"))
         layout.addWidget(result_table)
         container.setLayout(layout)
@@ -147,15 +181,24 @@ class Page3(QWidget):
         calc['spread_le'].clear()
         calc['future_cb'].setEditText("")
         calc['usd_cb'].setEditText("")
-        for r in range(calc['result'].rowCount()):
-            for c in range(1, 5):
-                calc['result'].setItem(r, c, QTableWidgetItem(""))
-
-    def sync_month_column(self, value, table):
-        for row in range(table.rowCount()):
-            item = QTableWidgetItem(value)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.setItem(row, 0, item)
+        calc['result'].clear()
+
+    def _create_range_edits(self, row_layout, defaults):
+        """시작 ~ 끝 / 간격 입력칸 3개 생성"""
+        edits = []
+        for i, default in enumerate(defaults):
+            edit = QLineEdit(default)
+            edit.setFixedWidth(45)
+            edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            edits.append(edit)
+            row_layout.addWidget(edit)
+            if i == 0: row_layout.addWidget(QLabel("~"))
+            if i == 1: row_layout.addWidget(QLabel("step"))
+        return edits
+
+    def _read_range(self, edits):
+        start, stop, step = (float(e.text()) for e in edits)
+        return offset_range(start, stop, step)
 
     def parse_value(self, text):
         """'9494-JAN' 형식에서 숫자 추출"""
@@ -164,69 +207,169 @@ class Page3(QWidget):
         except: return 0.0
 
     def on_fetch_clicked(self, cid):
+        """정보 가져오기를 백그라운드에서 시작. 로딩 중 다시 누르면 취소"""
         calc = self.calculators[cid]
+        if calc['worker'] is not None:
+            calc['worker'].cancel()
+            return
+
         mode = calc['mode']
+        # 1. 데이터 가져오기
+        # PX-PTA 모드일 때는 PTA 데이터, ZCE-SGX 모드일 때는 PX 데이터를 가져옴
+        # 다른 계산기/페이지에서 방금 가져온 값이면 캐시에서 바로 사용
+        wants = {FUTURE_INSTRUMENT[mode]: ["price"], "USDCNH": ["price"]}
+        tasks = source_tasks(wants)
+        calc['fetched'] = {}
+        calc['progress'].reset([name for name, _ in tasks])
+        calc['fetch_btn'].setText("취소")
+        calc['worker'] = start_worker(
+            tasks,
+            on_result=lambda source, data, c=calc: c['fetched'].update(data),
+            on_progress=calc['progress'].set_status,
+            on_error=calc['progress'].set_error,
+            on_finished=lambda c=calc: self.on_fetch_finished(c),
+            timeouts=source_timeouts(wants),
+        )
+
+    def on_fetch_finished(self, calc):
+        cancelled = calc['worker'].is_cancelled()
+        calc['worker'] = None
+        calc['fetch_btn'].setText("정보 가져오기")
+        if cancelled:
+            return
+        fetched = calc['fetched']
+        self.fill_calculator(calc, price_curve(fetched, FUTURE_INSTRUMENT[calc['mode']]), price_curve(fetched, "USDCNH"))
+
+    def on_fetch_all_clicked(self):
+        """로딩 중 다시 누르면 취소. 버튼은 새로고침 용도이므로 캐시를 건너뛰고 새로 가져옴"""
+        if self.fetch_all_worker is not None:
+            self.fetch_all_worker.cancel()
+            return
+        self.load_all_market_data(force=True)
+
+    def load_all_market_data(self, force=False):
+        """4개 계산기를 한 번에 채움. Sina 1회(PTA+PX 묶음) + SGX 1회만 요청 (동시에 들어온 같은 요청은 캐시에서 하나로 합쳐짐)"""
+        if self.fetch_all_worker is not None:
+            return
+
+        tasks = source_tasks(PAGE3_QUOTES, force=force)
+        self.fetch_all_data = {}
+        self.fetch_all_progress.reset([name for name, _ in tasks])
+        self.btn_fetch_all.setText("취소")
+        self.fetch_all_worker = start_worker(
+            tasks,
+            on_result=lambda source, data: self.fetch_all_data.update(data),
+            on_progress=self.fetch_all_progress.set_status,
+            on_error=self.fetch_all_progress.set_error,
+            on_finished=self.on_fetch_all_finished,
+            timeouts=source_timeouts(PAGE3_QUOTES),
+        )
+
+    def on_fetch_all_finished(self):
+        cancelled = self.fetch_all_worker.is_cancelled()
+        self.fetch_all_worker = None
+        self.btn_fetch_all.setText("전체 정보 가져오기")
+        if cancelled:
+            return
+
+        usd_data = price_curve(self.fetch_all_data, "USDCNH")
+        for calc in self.calculators:
+            future_data = price_curve(self.fetch_all_data, FUTURE_INSTRUMENT[calc['mode']])
+            self.fill_calculator(calc, future_data, usd_data)
+
+    def _populate_combos(self, calc, future_data, usd_data):
+        """
+        콤보박스 아이템 생성, 선택 월물에 해당하는 (future, usd) 텍스트 반환
+        data가 None(가져오기 실패)인 콤보박스는 기존 목록/값을 그대로 둠
+        """
         selected_month = calc['month_cb'].currentText().lower()
         month_idx = str(self.months.index(selected_month) + 1).zfill(2)
-        
-        try:
-            # 1. 데이터 가져오기
-            # PX-PTA 모드일 때는 PTA(nf_TA) 데이터, ZCE-SGX 모드일 때는 PX(nf_PX) 데이터를 가져옴
-            if mode == "PX-PTA":
-                future_data = get_year_prices("nf_TA", 8)
-            else:
-                future_data = get_year_prices("nf_PX", 8) # 알려주신 PX 코드 반영
-            
-            usd_data = get_year_sgx()
-
-            # 2. 콤보박스 아이템 생성
-            calc['future_cb'].clear()
-            calc['usd_cb'].clear()
-            
-            f_target_text = ""
-            u_target_text = ""
 
-            # Future 칸 처리
-            for item in future_data:
+        targets = []
+        for combo, data in [(calc['future_cb'], future_data), (calc['usd_cb'], usd_data)]:
+            target_text = ""
+            if data is None:
+                targets.append(target_text)
+                continue
+            combo.clear()
+            for item in data:
                 p = item.get('price', '0')
                 m_n = item.get('month', '').split('/')[-1]
                 m_str = self.months[int(m_n)-1].upper() if m_n.isdigit() else "???"
                 display_txt = f"{p}-{m_str}"
-                calc['future_cb'].addItem(display_txt)
-                if m_n == month_idx: f_target_text = display_txt
+                combo.addItem(display_txt)
+                if m_n == month_idx: target_text = display_txt
+            targets.append(target_text)
+        return targets
 
-            # USD/CHN 칸 처리
-            for item in usd_data:
-                p = item.get('price', '0')
-                m_n = item.get('month', '').split('/')[-1]
-                m_str = self.months[int(m_n)-1].upper() if m_n.isdigit() else "???"
-                display_txt = f"{p}-{m_str}"
-                calc['usd_cb'].addItem(display_txt)
-                if m_n == month_idx: u_target_text = display_txt
+    def fill_calculator(self, calc, future_data, usd_data):
+        """가져온 곡선으로 콤보박스를 채우고 선택 월물 값을 자동 입력"""
+        try:
+            f_target_text, u_target_text = self._populate_combos(calc, future_data, usd_data)
 
-            # 3. 값 자동 입력
+            # 값 자동 입력
             if f_target_text: calc['future_cb'].setEditText(f_target_text)
             if u_target_text: calc['usd_cb'].setEditText(u_target_text)
 
-            # 4. Blink 효과 적용
+            # Blink 효과 적용 (이전 세션 회색 표시도 함께 해제됨)
             flash_style = "background-color: #FFF176; border: 1px solid #FBC02D; font-weight: bold;"
-            calc['future_cb'].setStyleSheet(flash_style)
-            calc['usd_cb'].setStyleSheet(flash_style)
+            flashed = [calc[key] for key, data in [('future_cb', future_data), ('usd_cb', usd_data)] if data is not None]
+            for combo in flashed:
+                combo.setStyleSheet(flash_style)
             
             # 0.6초 후 스타일 초기화
-            QTimer.singleShot(600, lambda: self.reset_flash_style(calc))
+            QTimer.singleShot(600, lambda: self.reset_flash_style(flashed))
 
         except Exception as e:
             print(f"Fetch Error: {e}")
 
-    def reset_flash_style(self, calc):
-        calc['future_cb'].setStyleSheet("")
-        calc['usd_cb'].setStyleSheet("")
+    # --- 이전 세션 복원 (warm start) ---
+    def export_state(self):
+        return [
+            {
+                "month": calc['month_cb'].currentText(),
+                "spread": calc['spread_le'].text(),
+                "future": calc['future_cb'].currentText(),
+                "usd": calc['usd_cb'].currentText(),
+                "vary": calc['vary_cb'].currentIndex(),
+                "offsets": [e.text() for e in calc['offset_edits']],
+                "fx_offsets": [e.text() for e in calc['fx_edits']],
+            }
+            for calc in self.calculators
+        ]
+
+    def restore_state(self, states):
+        """
+        저장된 입력값을 복원. 콤보박스 목록은 로컬 저장소의 마지막 곡선으로 채우고,
+        선물/환율 값은 새로 가져오기 전까지 회색으로 표시
+        """
+        stored, times = stored_quotes(PAGE3_QUOTES)
+        sgx = price_curve(stored, "USDCNH")
+        for calc, state in zip(self.calculators, states or []):
+            calc['month_cb'].setCurrentText(state.get("month", calc['month_cb'].currentText()))
+            calc['spread_le'].setText(state.get("spread", ""))
+            calc['vary_cb'].setCurrentIndex(state.get("vary", 0))
+            for edit, text in zip(calc['offset_edits'], state.get("offsets", [])): edit.setText(text)
+            for edit, text in zip(calc['fx_edits'], state.get("fx_offsets", [])): edit.setText(text)
+
+            future_data = price_curve(stored, FUTURE_INSTRUMENT[calc['mode']])
+            self._populate_combos(calc, future_data, sgx)
+            calc['future_cb'].setEditText(state.get("future", ""))
+            calc['usd_cb'].setEditText(state.get("usd", ""))
+            stale_style = "color: #9E9E9E; font-style: italic;"
+            calc['future_cb'].setStyleSheet(stale_style)
+            calc['usd_cb'].setStyleSheet(stale_style)
+
+        if states and times:
+            self.fetch_all_progress.set_stale(stale_label(min(times.values())))
+
+    def reset_flash_style(self, combos):
+        for combo in combos:
+            combo.setStyleSheet("")
 
     def on_calculate_clicked(self, cid):
         calc = self.calculators[cid]
         mode = calc['mode']
-        const_val = self.CONST_PX_PTA if mode == "PX-PTA" else self.CONST_ZCE_SGX
         
         try:
             m = calc['month_cb'].currentText()
@@ -236,40 +379,18 @@ class Page3(QWidget):
 
             if u == 0: return
 
-            # 역산 수식
-            if mode == "PX-PTA":
-                # f=PTA Future, PX를 역산: PX = (PTA - Spread) / (Const * USD)
-                center_val = (f - s) / (const_val * u)
-            else:
-                # f=PX Future, PTA를 역산: PTA = (PX * Const * USD) + Spread
-                center_val = (f * const_val * u) + s
-
-            offsets = [-2.0, -1.5, -1.0, -0.5, 0, 0.5, 1.0, 1.5, 2.0]
-
-            for row, offset in enumerate(offsets):
-                curr_val = center_val + offset
-                # Spread 재계산
-                if mode == "PX-PTA":
-                    calc_s = f - (curr_val * const_val * u)
-                else:
-                    calc_s = curr_val - (f * const_val * u)
-
-                calc['result'].setItem(row, 0, QTableWidgetItem(m))
-                calc['result'].setItem(row, 1, QTableWidgetItem(f"{curr_val:.1f}"))
-                calc['result'].setItem(row, 2, QTableWidgetItem(f"{calc_s:.2f}"))
-                calc['result'].setItem(row, 3, QTableWidgetItem(f"{f:,.0f}"))
-                calc['result'].setItem(row, 4, QTableWidgetItem(f"{u:.4f}"))
-
-                for col in range(5):
-                    it = calc['result'].item(row, col)
-                    it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    if offset == 0:
-                        it.setBackground(QColor("#E8F5E9"))
-                        font = it.font()
-                        font.setBold(True)
-                        it.setFont(font)
-        except:
-            QMessageBox.critical(self, "오류", "입력값을 확인하세요.")
+            offsets = self._read_range(calc['offset_edits'])
+            fx_offsets = self._read_range(calc['fx_edits'])
+            vary = "spread" if calc['vary_cb'].currentIndex() == 1 else "price"
+
+            # 역산 수식을 (offset x 환율 offset) 그리드 전체에 대해 한 번에 계산
+            target, spreads, usd_values = scenario_grid(mode, f, s, u, offsets, fx_offsets, vary=vary)
+            # 가격 offset 0 + 환율 offset 0인 행만 강조
+            center = center_mask(offsets, fx_offsets)
+            calc['result'].set_result(m, f, target, spreads, usd_values, center)
+        except (ValueError, ArithmeticError) as e:
+            # 입력값 오류만 안내하고, 표 모델 등 그 외 오류는 그대로 올려 보냄
+            QMessageBox.critical(self, "오류", f"입력값을 확인하세요.\n{e}")
 
 if __name__ == "__main__":
     from PyQt6.QtWidgets import QApplication
@@ -0,0 +1,255 @@
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor, QFont
+
+
+class SheetTableModel(QAbstractTableModel):
+    """
+    calc.sheet.Sheet(float64 배열)을 그대로 보여주는 테이블 모델
+    값은 전체 정밀도로 sheet에 두고, 소수점 자리수 포맷은 data()에서 표시할 때만 적용합니다.
+    0번 열은 월물 라벨 (수정 불가)
+    """
+
+    def __init__(self, sheet, headers, precisions=None):
+        super().__init__()
+        self.sheet = sheet
+        self.headers = headers
+        # 열별 표시 소수점 자리수 (기본 2자리)
+        self.precisions = precisions or {}
+        self.row_labels = [""] * sheet.n_rows
+        self.bold_rows = set()
+        self.row_backgrounds = {}
+        # 셀 단위 강조 (깜빡임, 보정값 글자색 등)
+        self.cell_backgrounds = {}
+        self.cell_foregrounds = {}
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    # --- Qt 모델 인터페이스 ---
+    def rowCount(self, parent=QModelIndex()):
+        return self.sheet.n_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(row, col)
+        if role == Qt.ItemDataRole.EditRole:
+            # 편집할 때는 반올림 없이 전체 값을 보여줌
+            return "" if col == 0 else repr(self.sheet.get(row, col))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.FontRole and row in self.bold_rows:
+            return self._bold_font
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.cell_backgrounds.get((row, col), self.row_backgrounds.get(row))
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.cell_foregrounds.get((row, col))
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() != 0:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() == 0:
+            return False
+        text = str(value).replace(',', '').strip()
+        try:
+            val = float(text) if text not in ("", "N/A") else 0.0
+        except ValueError:
+            val = 0.0
+        self.set_values({(index.row(), index.column()): val})
+        return True
+
+    # --- 표시 ---
+    def display_text(self, row, col):
+        if col == 0:
+            return self.row_labels[row]
+        precision = self.precisions.get(col, 2)
+        return f"{self.sheet.get(row, col):,.{precision}f}"
+
+    def _emit_cells(self, cells):
+        """바뀐 셀을 감싸는 영역만 다시 그리도록 알림"""
+        cells = list(cells)
+        if not cells:
+            return
+        rows = [r for r, _ in cells]
+        cols = [c for _, c in cells]
+        self.dataChanged.emit(self.index(min(rows), min(cols)), self.index(max(rows), max(cols)))
+
+    def refresh_all(self):
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    # --- 값/스타일 변경 ---
+    def set_values(self, updates):
+        """{(row, col): 값}을 sheet에 반영하고, 값이 바뀐 셀(의존 셀 포함)을 반환"""
+        changed = self.sheet.set_many(updates)
+        self._emit_cells(changed)
+        return changed
+
+    def set_row_style(self, labels, bold_rows, row_backgrounds):
+        self.row_labels = labels
+        self.bold_rows = set(bold_rows)
+        self.row_backgrounds = dict(row_backgrounds)
+        self.refresh_all()
+
+    def set_cell_background(self, cells, color):
+        """color가 None이면 셀 강조 해제"""
+        for cell in cells:
+            if color is None:
+                self.cell_backgrounds.pop(cell, None)
+            else:
+                self.cell_backgrounds[cell] = QColor(color)
+        self._emit_cells(cells)
+
+    def set_cell_foreground(self, cells, color):
+        for cell in cells:
+            if color is None:
+                self.cell_foregrounds.pop(cell, None)
+            else:
+                self.cell_foregrounds[cell] = QColor(color)
+        self._emit_cells(cells)
+
+
+class ScenarioTableModel(QAbstractTableModel):
+    """
+    Page3 시뮬레이션 결과 모델
+    결과는 NumPy 배열로만 보관하고 행마다 위젯 아이템을 만들지 않으므로 수천 행도 가볍게 스크롤됩니다.
+    열: month, target(PX/PTA), spread, future, usd/chn
+    """
+
+    def __init__(self, headers):
+        super().__init__()
+        self.headers = headers
+        self.month = ""
+        self.future = 0.0
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._set_arrays(np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype=bool))
+
+    def _set_arrays(self, target, spread, usd, center):
+        self.target = target
+        self.spread = spread
+        self.usd = usd
+        self.center = center
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.target)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0: return self.month
+            if col == 1: return f"{self.target[row]:.1f}"
+            if col == 2: return f"{self.spread[row]:.2f}"
+            if col == 3: return f"{self.future:,.0f}"
+            return f"{self.usd[row]:.4f}"
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        # offset 0 (중심값) 행 강조
+        if role == Qt.ItemDataRole.BackgroundRole and self.center[row]:
+            return QColor("#E8F5E9")
+        if role == Qt.ItemDataRole.FontRole and self.center[row]:
+            return self._bold_font
+        return None
+
+    def set_result(self, month, future, target, spread, usd, center):
+        """
+        target/spread/center: (환율 시나리오 수, offset 수) 2차원 배열
+        usd: (환율 시나리오 수,) — 행은 환율 시나리오별로 offset 순서대로 펼쳐짐
+        """
+        self.beginResetModel()
+        self.month = month
+        self.future = future
+        self._set_arrays(
+            np.ravel(target), np.ravel(spread),
+            np.repeat(usd, np.shape(target)[1]), np.ravel(center),
+        )
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._set_arrays(np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype=bool))
+        self.endResetModel()
+
+    def set_month(self, month):
+        self.month = month
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, 0))
+
+
+class ReportTableModel(QAbstractTableModel):
+    """
+    Page2 전일 대비 표 모델: 행 = (Item, yday, tday, +/-, usd+/-)
+    곡선이 길어져 행이 늘어도 셀마다 위젯 아이템을 만들지 않습니다.
+    """
+
+    def __init__(self, headers):
+        super().__init__()
+        self.headers = headers
+        self.rows = []
+        # 이전 세션 값이면 yday/tday를 회색으로 표시하고 툴팁에 기준 시각 표시
+        self.stale_text = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        value = self.rows[row][col]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0: return value
+            if col in (1, 2): return f"{value:,.2f}"
+            return f"{value:+.2f}"
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole and col == 0:
+            return QColor("#D9EAD3")
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # +/-, usd+/-: 상승 빨강 / 하락 파랑
+            if col in (3, 4) and value != 0:
+                return QColor("red") if value > 0 else QColor("blue")
+            if col in (1, 2) and self.stale_text:
+                return QColor("#9E9E9E")
+        if role == Qt.ItemDataRole.ToolTipRole and col in (1, 2):
+            return self.stale_text
+        return None
+
+    def set_rows(self, rows, stale_text=None):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.stale_text = stale_text
+        self.endResetModel()
@@ -0,0 +1,170 @@
+"""
+여러 앱(같은 PC/LAN)이 함께 쓰는 시세 proxy/cache
+
+    python quote_proxy.py                    # 0.0.0.0:8765
+    python quote_proxy.py --port 8765 --ttl 5
+
+각 PC의 config.QUOTE_PROXY_URL = "http://<proxy PC>:8765" 로 설정하면 Sina/SGX 요청이 이 프로세스를 거칩니다.
+앱이 몇 개든 upstream에는 TTL마다 한 번씩만 요청합니다.
+
+- GET /<호스트><경로>  예: /hq.sinajs.cn/list=nf_TA2611,nf_PX2611 -> https://hq.sinajs.cn/list=...
+- config.HOST_RATE_LIMITS에 있는 호스트만 전달 (아무 주소나 대신 요청하는 열린 proxy가 되지 않도록)
+- Sina list= 요청은 심볼 단위로 캐시: 앱마다 다른 조합을 물어도 캐시에 없는 심볼만 묶어서 upstream에 요청
+- 그 외(SGX JSON 등)는 URL 단위로 캐시
+- upstream 요청은 http_get을 그대로 쓰므로 같은 요청 합치기 + 호스트별 token bucket이 적용됨
+- 호스트가 차단 중이거나 토큰이 없으면 기다리지 않고 바로 429(Retry-After)로 응답
+  (proxy에서 잠들면 앱의 읽기 시간 초과가 먼저 나서 모든 앱이 upstream으로 직접 몰림)
+"""
+import argparse
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import config
+from request.http_session import QuoteFetchError, http_get
+from request.rate_limit import host_wait_time
+
+# 한 줄: var hq_str_<심볼>="...";  (GBK 원문 바이트를 디코딩하지 않고 그대로 보관)
+SINA_LINE_RE = re.compile(rb'var hq_str_([^=\s]+)="[^"\n]*";?')
+SINA_CONTENT_TYPE = "application/javascript; charset=GBK"
+# upstream으로 넘겨주는 요청 헤더 (Sina는 Referer가 없으면 거부)
+FORWARD_HEADERS = ["Referer", "Origin", "User-Agent", "Accept"]
+
+
+class ProxyBusy(QuoteFetchError):
+    """upstream으로 지금 보낼 수 없음 (호스트 차단 중/토큰 없음) -> 429 + Retry-After"""
+
+    def __init__(self, url, message, retry_after):
+        super().__init__("Proxy", url, message, status=429)
+        self.retry_after = retry_after
+
+
+class QuoteProxy:
+    def __init__(self, ttl):
+        self.ttl = ttl
+        # 심볼 -> (저장 시각, 한 줄 bytes)
+        self._sina_lines = {}
+        # url -> (저장 시각, 본문, Content-Type)
+        self._bodies = {}
+        self._lock = threading.Lock()
+        # 동시에 들어온 Sina 요청이 같은 심볼을 따로 묻지 않도록 Sina 요청은 하나씩 처리
+        self._sina_lock = threading.Lock()
+        self.upstream_requests = 0
+
+    def _fresh(self, entry, now):
+        return entry is not None and now - entry[0] <= self.ttl
+
+    def _upstream(self, url, headers):
+        wait, blocked = host_wait_time(url)
+        if wait > 0:
+            reason = "upstream 차단 후 대기 중" if blocked else "요청 제한"
+            raise ProxyBusy(url, f"{reason}, {wait:.1f}초 후 다시 요청하세요", wait)
+        self.upstream_requests += 1
+        return http_get("Proxy", url, headers=headers)
+
+    def sina(self, host, path, headers):
+        symbols = [s for s in unquote(path[len("/list="):]).split(",") if s]
+        with self._sina_lock:
+            now = time.monotonic()
+            with self._lock:
+                missing = [s for s in symbols if not self._fresh(self._sina_lines.get(s), now)]
+            if missing:
+                response = self._upstream(f"https://{host}/list=" + ",".join(missing), headers)
+                lines = {m.group(1).decode("ascii", "replace"): m.group(0) for m in SINA_LINE_RE.finditer(response.content)}
+                # 시세가 하나도 없는 응답(차단 등)은 캐시하지 않고 실패로 전달
+                if not lines:
+                    raise QuoteFetchError("Proxy", host + path, "upstream 응답에 시세가 없습니다", status=502)
+                now = time.monotonic()
+                with self._lock:
+                    for s in missing:
+                        self._sina_lines[s] = (now, lines.get(s, f'var hq_str_{s}="";'.encode("ascii")))
+            with self._lock:
+                body = b"\n".join(self._sina_lines[s][1] for s in symbols) + b"\n"
+        return body, SINA_CONTENT_TYPE
+
+    def generic(self, url, headers):
+        with self._lock:
+            entry = self._bodies.get(url)
+        if self._fresh(entry, time.monotonic()):
+            return entry[1], entry[2]
+        response = self._upstream(url, headers)
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        with self._lock:
+            self._bodies[url] = (time.monotonic(), response.content, content_type)
+        return response.content, content_type
+
+    def handle(self, path, headers):
+        """'/호스트/경로' -> (본문, Content-Type). 허용하지 않는 호스트면 None"""
+        host, _, rest = path.lstrip("/").partition("/")
+        if host not in config.HOST_RATE_LIMITS:
+            return None
+        rest = "/" + rest
+        if rest.startswith("/list="):
+            return self.sina(host, rest, headers)
+        return self.generic(f"https://{host}{rest}", headers)
+
+
+def make_server(proxy, host, port):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            headers = {name: self.headers[name] for name in FORWARD_HEADERS if self.headers.get(name)}
+            try:
+                result = proxy.handle(self.path, headers)
+            except ProxyBusy as e:
+                self.send_response(429)
+                self.send_header("Retry-After", str(max(1, round(e.retry_after))))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            except QuoteFetchError as e:
+                # upstream 상태 코드를 그대로 전달 (연결 실패 등은 502)
+                self.send_error(e.status or 502, explain=e.message)
+                return
+            if result is None:
+                self.send_error(403, explain="허용되지 않은 호스트")
+                return
+            body, content_type = result
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 앱이 함께 쓰는 Sina/SGX 시세 proxy")
+    parser.add_argument("--host", default=config.QUOTE_PROXY_HOST)
+    parser.add_argument("--port", type=int, default=config.QUOTE_PROXY_PORT)
+    parser.add_argument("--ttl", type=float, default=config.QUOTE_PROXY_TTL, help="같은 시세를 다시 묻지 않는 시간(초)")
+    args = parser.parse_args(argv)
+
+    # proxy 자신은 항상 upstream으로 직접 요청
+    config.QUOTE_PROXY_URL = None
+    proxy = QuoteProxy(args.ttl)
+    httpd = make_server(proxy, args.host, args.port)
+    print(f"시세 proxy 시작: http://{args.host}:{httpd.server_address[1]} (TTL {args.ttl}s)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        print(f"종료 (upstream 요청 {proxy.upstream_requests}회)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
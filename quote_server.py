@@ -0,0 +1,203 @@
+"""
+로컬 시세 배포 서버 (asyncio, localhost/LAN)
+
+    python quote_server.py                          # 0.0.0.0:8766, 5초마다 가져오기
+    python quote_server.py --interval 10 --port 8766
+
+이 프로세스 하나만 Sina 요청/SGX(Chrome)를 돌리고, 각 PC의 앱은 config.QUOTE_SERVER_ADDRESS로 구독합니다.
+트레이더가 열 명이어도 upstream 요청과 Chrome은 하나씩입니다.
+
+프로토콜: TCP, 한 줄에 JSON 하나 (JSON-lines, UTF-8)
+- 클라이언트 -> 서버 (선택): {"type": "subscribe", "instruments": ["PTA", "USDCNH"]}  (없으면 전체)
+- 서버 -> 클라이언트:
+  {"type": "snapshot", "seq": n, "ts": 시각, "months": 개월, "interval": 가져오기 주기, "heartbeat": heartbeat 주기,
+   "quotes": {종목: {필드: rows}}}  구독 직후 1회
+  {"type": "delta", "seq": n, "ts": 시각, "quotes": {종목: {필드: 바뀐 rows}}, "fresh": [이번에 가져온 종목],
+   "errors": {source: 메시지}}  가져올 때마다 (바뀐 값이 없어도 보냄)
+  {"type": "heartbeat", "seq": n, "ts": 시각}  가져오기와 별도로 heartbeat 주기마다
+  (SGX 가져오기는 수십 초 걸릴 수 있으므로 클라이언트는 delta가 아니라 heartbeat로 연결 끊김을 판단)
+
+네트워크 없이 확인: bench/stub_server.py를 띄우고 --sina-url로 지정, SGX는 --sgx-replay로 저장된 응답 사용
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+import config
+from calc.page1_sheet import PAGE1_QUOTES
+from calc.page2_report import PAGE2_QUOTES
+from calc.scenario import PAGE3_QUOTES
+from request.sources import fetch_quotes
+
+# 느린 클라이언트 한 명 때문에 메모리가 쌓이지 않도록: 보내지 못한 메시지가 이만큼이면 연결을 끊음
+# (다시 연결하면 snapshot부터 받으므로 값이 어긋나지 않음)
+CLIENT_QUEUE_SIZE = 20
+
+
+def all_page_quotes():
+    """모든 페이지가 쓰는 종목/필드 합집합"""
+    wants = {}
+    for page_quotes in (PAGE1_QUOTES, PAGE2_QUOTES, PAGE3_QUOTES):
+        for name, fields in page_quotes.items():
+            wants.setdefault(name, [])
+            wants[name] += [f for f in fields if f not in wants[name]]
+    return wants
+
+
+def diff_quotes(old, new):
+    """{종목: {필드: rows}} 두 개를 비교해 값이 바뀐 월물 행만"""
+    changes = {}
+    for name, fields in new.items():
+        for field, rows in fields.items():
+            before = {row["month"]: row["price"] for row in old.get(name, {}).get(field, [])}
+            changed = [row for row in rows if before.get(row["month"]) != row["price"]]
+            if changed:
+                changes.setdefault(name, {})[field] = changed
+    return changes
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class QuoteServer:
+    def __init__(self, wants, months, interval, fetch=fetch_quotes, heartbeat=None):
+        self.wants = wants
+        self.months = months
+        self.interval = interval
+        self.heartbeat = heartbeat if heartbeat is not None else config.QUOTE_SERVER_HEARTBEAT
+        # fetch(wants, months=, force=, on_error=) — 테스트에서는 가짜 함수로 교체
+        self.fetch = fetch
+        self.quotes = {}
+        self.seq = 0
+        self.ts = None
+        # 클라이언트별 (보낼 메시지 queue, 구독 종목 set 또는 None=전체)
+        self.clients = {}
+        # serve() 시작 후 실제로 열린 (host, port) (port 0으로 띄운 테스트용)
+        self.address = None
+
+    def _message(self, message, instruments):
+        """구독 종목만 남긴 메시지"""
+        if instruments is None or "quotes" not in message:
+            return message
+        filtered = dict(message, quotes={k: v for k, v in message["quotes"].items() if k in instruments})
+        if "fresh" in filtered:
+            filtered["fresh"] = [name for name in filtered["fresh"] if name in instruments]
+        return filtered
+
+    def publish(self, message):
+        for writer, (queue, instruments) in list(self.clients.items()):
+            try:
+                queue.put_nowait(self._message(message, instruments))
+            except asyncio.QueueFull:
+                print("느린 클라이언트 연결 종료 (다시 연결하면 snapshot부터 받음)")
+                writer.close()
+                self.clients.pop(writer, None)
+
+    async def poll_once(self):
+        errors = {}
+        loop = asyncio.get_running_loop()
+        # 가져오기는 블로킹(requests/Selenium)이라 스레드에서 실행
+        fetched = await loop.run_in_executor(None, lambda: self.fetch(
+            self.wants, months=self.months, force=True,
+            on_error=lambda source, e: errors.__setitem__(source, str(e)),
+        ))
+        changes = diff_quotes(self.quotes, fetched)
+        # 실패한 source의 종목은 마지막 값을 유지
+        self.quotes.update(fetched)
+        self.seq += 1
+        self.ts = time.time()
+        self.publish({
+            "type": "delta", "seq": self.seq, "ts": self.ts,
+            "quotes": changes, "fresh": sorted(fetched), "errors": errors,
+        })
+        return changes
+
+    async def poll_forever(self):
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                print(f"시세 가져오기 실패: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def heartbeat_forever(self):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            self.publish({"type": "heartbeat", "seq": self.seq, "ts": time.time()})
+
+    async def handle_client(self, reader, writer):
+        peer = writer.get_extra_info("peername")
+        instruments = None
+        # 연결 직후 짧게 subscribe 메시지를 기다림 (없으면 전체 구독)
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=1.0)
+            request = json.loads(line) if line.strip() else {}
+            if request.get("type") == "subscribe" and request.get("instruments"):
+                instruments = set(request["instruments"])
+        except (asyncio.TimeoutError, ValueError):
+            pass
+
+        queue = asyncio.Queue(CLIENT_QUEUE_SIZE)
+        queue.put_nowait(self._message({
+            "type": "snapshot", "seq": self.seq, "ts": self.ts, "months": self.months,
+            "interval": self.interval, "heartbeat": self.heartbeat, "quotes": dict(self.quotes),
+        }, instruments))
+        self.clients[writer] = (queue, instruments)
+        print(f"구독 시작: {peer} ({', '.join(sorted(instruments)) if instruments else '전체'})")
+        try:
+            while True:
+                message = await queue.get()
+                writer.write(encode(message))
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+            print(f"구독 종료: {peer}")
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        self.address = server.sockets[0].getsockname()[:2]
+        print(f"시세 배포 서버 시작: {host}:{self.address[1]} "
+              f"({self.interval}s 주기, heartbeat {self.heartbeat}s, {self.months}개월)")
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.poll_forever(), self.heartbeat_forever())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 앱에 시세를 배포하는 로컬 서버 (TCP JSON-lines)")
+    parser.add_argument("--host", default=config.QUOTE_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=config.QUOTE_SERVER_PORT)
+    parser.add_argument("--interval", type=float, default=config.QUOTE_SERVER_INTERVAL, help="가져오기 주기(초)")
+    parser.add_argument("--heartbeat", type=float, default=config.QUOTE_SERVER_HEARTBEAT, help="heartbeat 주기(초)")
+    parser.add_argument("--months", type=int, default=max(config.PAGE1_MONTHS, config.PAGE2_MONTHS, 12))
+    parser.add_argument("--sina-url", help="Sina 대신 요청할 주소 (예: stub 서버 http://127.0.0.1:8000/list=)")
+    parser.add_argument("--sgx-replay", metavar="PATH", help="SGX는 저장된 JSON 응답으로 (네트워크 없음)")
+    args = parser.parse_args(argv)
+
+    if args.sina_url:
+        import request.request_other as request_other
+        request_other.API_URL = args.sina_url
+    if args.sgx_replay:
+        config.SGX_HTTP_ENABLED = True
+        config.SGX_FIXTURE_MODE = "replay"
+        config.SGX_FIXTURE_PATH = args.sgx_replay
+
+    server = QuoteServer(all_page_quotes(), args.months, args.interval, heartbeat=args.heartbeat)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        from request.request_sgx import turn_off_driver
+        turn_off_driver()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import config
+
+# 취소 여부를 확인하는 주기(초)
+POLL_INTERVAL = 0.1
+
+
+def fetch_concurrently(tasks, timeouts=None, on_result=None, on_error=None, is_cancelled=None):
+    """
+    여러 source(Sina HTTP, SGX 등)를 동시에 가져옵니다.
+    tasks: [(source 이름, 인자 없는 함수)]
+    timeouts: {source: 초} — 없으면 config.SOURCE_TIMEOUTS, 그래도 없으면 DEFAULT 값
+    on_result(source, data) / on_error(source, exception)는 도착하는 순서대로 호출됩니다.
+    반환: {source: data} (실패/시간초과 source는 제외)
+    """
+    timeouts = timeouts or config.SOURCE_TIMEOUTS
+    results = {}
+    if not tasks:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(tasks))
+    start = time.monotonic()
+    pending = {}
+    limits = {}
+    for source, fn in tasks:
+        future = executor.submit(fn)
+        pending[future] = source
+        limits[future] = timeouts.get(source, config.SOURCE_TIMEOUTS["DEFAULT"])
+
+    try:
+        while pending:
+            if is_cancelled and is_cancelled():
+                break
+
+            done, _ = wait(list(pending), timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    data = future.result()
+                except Exception as e:
+                    if on_error: on_error(source, e)
+                    continue
+                results[source] = data
+                if on_result: on_result(source, data)
+
+            # source별 시간 초과: 늦은 source만 포기하고 나머지는 계속 기다림
+            now = time.monotonic()
+            for future in [f for f in pending if now - start >= limits[f]]:
+                source = pending.pop(future)
+                if on_error: on_error(source, TimeoutError(f"{source} 응답 시간 초과 ({limits[future]}s)"))
+    finally:
+        # 시간 초과된 요청이 끝날 때까지 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
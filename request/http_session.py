@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+import config
+from request.rate_limit import host_of, host_wait_time, penalize_host, wait_for_host
+
+# requests/urllib3는 첫 요청 때 import (창이 먼저 뜨도록 시작 경로에서 제외)
+
+# upstream이 요청 제한/차단 시 돌려주는 상태 코드
+BLOCKED_STATUSES = (403, 429)
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteFetchError(Exception):
+    """시세 요청 실패 (어느 source/URL에서 왜 실패했는지 함께 전달)"""
+
+    def __init__(self, source, url, message, status=None, connect_failed=False):
+        super().__init__(f"[{source}] {message}")
+        self.source = source
+        self.url = url
+        self.message = message
+        self.status = status
+        # 서버에 연결 자체를 못 한 경우 (연결 거부/연결 시간 초과). 읽기 시간 초과는 False
+        self.connect_failed = connect_failed
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    프로세스 전체에서 하나의 Session을 재사용합니다.
+    같은 호스트로 가는 요청은 keep-alive 연결을 다시 써서 TCP/TLS 핸드셰이크를 생략합니다.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=config.HTTP_MAX_RETRIES,
+                backoff_factor=config.HTTP_BACKOFF_FACTOR,  # 0.5 -> 0s, 1s, 2s ... (config.HTTP_BACKOFF_TOTAL)
+                # 403/429(요청 제한)는 재시도하지 않음: urllib3가 다시 보내면 token bucket을 건너뛰게 됨
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+                # Retry-After(예: proxy의 30초)만큼 잠들면 source timeout을 넘기므로 무시
+                respect_retry_after_header=False,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=config.HTTP_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _is_connect_error(e):
+    """requests.ConnectionError 중 서버에 연결 자체를 못 한 경우인지 (연결 거부/연결 시간 초과/DNS 실패)"""
+    from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+    reason = getattr(e.args[0], "reason", e.args[0]) if e.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _get(source, url, headers):
+    import requests
+
+    timeout = (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout)
+    except requests.ConnectTimeout as e:
+        raise QuoteFetchError(source, url, f"연결 시간 초과: {e}", connect_failed=True) from e
+    except requests.Timeout as e:
+        raise QuoteFetchError(source, url, f"응답 시간 초과: {e}") from e
+    except requests.ConnectionError as e:
+        # 재시도가 끝나면 읽기 시간 초과도 ConnectionError로 감싸져 오므로 원인으로 구분
+        connect_failed = _is_connect_error(e)
+        message = f"연결 실패: {e}" if connect_failed else f"응답 실패: {e}"
+        raise QuoteFetchError(source, url, message, connect_failed=connect_failed) from e
+    except requests.RequestException as e:
+        raise QuoteFetchError(source, url, f"요청 실패: {e}") from e
+
+    if response.status_code != 200:
+        raise QuoteFetchError(source, url, f"HTTP {response.status_code}", status=response.status_code)
+    # 같은 요청을 기다리던 다른 스레드와 공유하므로 본문을 여기서 모두 읽어둠
+    response.content
+    return response
+
+
+# 공유 proxy에 연결하지 못하면 이 시각까지는 upstream으로 바로 요청
+_proxy_down_until = 0.0
+
+
+def proxy_url(url):
+    """config.QUOTE_PROXY_URL이 설정되어 있으면 요청 제한 대상 호스트의 url을 proxy 경로로 바꿈, 아니면 None"""
+    if not config.QUOTE_PROXY_URL or host_of(url) not in config.HOST_RATE_LIMITS:
+        return None
+    if time.monotonic() < _proxy_down_until:
+        return None
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{config.QUOTE_PROXY_URL.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+def _fetch(source, url, headers):
+    """공유 proxy가 있으면 proxy로, 없거나 연결이 안 되면 호스트별 제한을 지키며 upstream으로"""
+    global _proxy_down_until
+
+    via_proxy = proxy_url(url)
+    if via_proxy is not None:
+        try:
+            return _get(source, via_proxy, headers)
+        except QuoteFetchError as e:
+            # proxy에 연결조차 못 한 경우만 proxy 장애로 봄
+            # (upstream 오류 전달/요청 제한 응답/읽기 시간 초과는 그대로 실패 처리: 모든 앱이 upstream으로 몰리지 않도록)
+            if not e.connect_failed:
+                raise
+            logger.warning("시세 proxy 연결 실패, %s초 동안 직접 요청: %s", config.QUOTE_PROXY_RETRY, e.message)
+            _proxy_down_until = time.monotonic() + config.QUOTE_PROXY_RETRY
+
+    # 차단 응답 후 쉬는 중이면 HOST_BLOCK_BACKOFF까지 잠들지 않고 바로 실패 (source timeout 안에 끝나도록)
+    wait, blocked = host_wait_time(url)
+    if blocked:
+        raise QuoteFetchError(source, url, f"요청 제한으로 차단 중, {wait:.0f}초 후 다시 시도하세요", status=429)
+    wait_for_host(url)
+    try:
+        return _get(source, url, headers)
+    except QuoteFetchError as e:
+        if e.status in BLOCKED_STATUSES:
+            penalize_host(url)
+        raise
+
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def http_get(source, url, headers=None):
+    """
+    연결/읽기 timeout과 재시도가 적용된 GET
+    실패 시 빈 값 대신 QuoteFetchError를 올려 호출 측에서 구분할 수 있게 합니다.
+    같은 url 요청이 이미 진행 중이면 새로 보내지 않고 그 응답(또는 오류)을 같이 받습니다.
+    """
+    with _inflight_lock:
+        future = _inflight.get(url)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[url] = future
+
+    if not owner:
+        return future.result()
+
+    try:
+        response = _fetch(source, url, headers)
+        future.set_result(response)
+        return response
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(url, None)
@@ -0,0 +1,213 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import config
+from calc.contract_calendar import contract_months
+from request.quote_store import get_quote_store, record_quotes
+from request.request_other import get_bulk_prices, get_month_symbols
+from request.request_sgx import get_year_sgx
+
+SGX_PREFIX = "sgx_UC"
+SGX_FIELD = "price"
+
+
+class QuoteCache:
+    """
+    프로세스 전체에서 공유하는 시세 캐시
+    key: (심볼 prefix, 월물 'yy/mm', 필드) -> (저장 시각, 값)
+    같은 요청이 동시에 들어오면 한 번만 가져오고 나머지는 그 결과를 기다립니다.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """유효기간 내의 값이면 반환, 아니면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def put_many(self, values):
+        """values: {key: 값}"""
+        now = time.monotonic()
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (now, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def fetch_once(self, fetch_key, fetch_fn):
+        """
+        fetch_key가 같은 요청이 이미 진행 중이면 그 결과를 공유하고,
+        아니면 fetch_fn()을 직접 실행합니다.
+        """
+        with self._lock:
+            future = self._inflight.get(fetch_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[fetch_key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch_fn()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(fetch_key, None)
+
+
+quote_cache = QuoteCache(config.QUOTE_CACHE_TTL)
+
+
+def _rows_from_cache(prefix, price_index, months=12):
+    """
+    캐시에 곡선(months개월)이 모두 살아있으면 get_year_prices 형식으로, 아니면 None
+    상장되지 않은 월물은 요청하지 않으므로 캐시 없이 N/A
+    """
+    rows = []
+    for _, month, listed in contract_months(prefix, months):
+        if not listed:
+            rows.append({"month": month, "price": "N/A"})
+            continue
+        price = quote_cache.get((prefix, month, price_index))
+        if price is None:
+            return None
+        rows.append({"month": month, "price": price})
+    return rows
+
+
+def _fetch_sina(prefixes, price_indices, months):
+    """실제 요청 + 로컬 저장소 기록 (같은 요청이 합쳐지면 한 번만 기록됨)"""
+    fetched = get_bulk_prices(prefixes, price_indices, months)
+    record_quotes("Sina", {
+        (prefix, row['month'], idx): row['price']
+        for prefix in prefixes for idx in price_indices for row in fetched[prefix][idx]
+    })
+    return fetched
+
+
+def _fetch_sgx(months):
+    rows = get_year_sgx(months)
+    record_quotes("SGX", {(SGX_PREFIX, row['month'], SGX_FIELD): row['price'] for row in rows})
+    return rows
+
+
+def get_cached_prices(base_symbol_prefixes, price_indices, force=False, months=12):
+    """
+    get_bulk_prices와 같은 형식을 반환하되, TTL 내에 가져온 값은 네트워크를 타지 않습니다.
+    force=True이면 캐시를 무시하고 새로 가져옵니다. months: 곡선 길이(개월)
+    """
+    results = {p: {} for p in base_symbol_prefixes}
+    missing = []
+    for prefix in base_symbol_prefixes:
+        for idx in price_indices:
+            rows = None if force else _rows_from_cache(prefix, idx, months)
+            if rows is None:
+                if prefix not in missing:
+                    missing.append(prefix)
+            else:
+                results[prefix][idx] = rows
+
+    if missing:
+        fetch_key = ("sina", tuple(missing), tuple(price_indices), months)
+        fetched = quote_cache.fetch_once(fetch_key, lambda: _fetch_sina(missing, price_indices, months))
+        values = {}
+        for prefix in missing:
+            for idx in price_indices:
+                rows = fetched[prefix][idx]
+                results[prefix][idx] = rows
+                # 응답에서 빠진 월물(N/A)은 캐시에 남기지 않음: 일시적인 누락이 TTL 동안 고정되지 않도록
+                for row in rows:
+                    if row['price'] != "N/A":
+                        values[(prefix, row['month'], idx)] = row['price']
+        quote_cache.put_many(values)
+
+    return results
+
+
+def get_cached_sgx(force=False, months=12):
+    """get_year_sgx와 같은 형식을 반환하되, TTL 내라면 Selenium을 다시 타지 않습니다."""
+    if not force:
+        rows = _rows_from_cache(SGX_PREFIX, SGX_FIELD, months)
+        if rows is not None:
+            return rows
+
+    rows = quote_cache.fetch_once(("sgx", months), lambda: _fetch_sgx(months))
+    # 테이블 로딩 실패(전부 N/A)는 캐시하지 않음
+    if any(row['price'] != "N/A" for row in rows):
+        quote_cache.put_many({(SGX_PREFIX, row['month'], SGX_FIELD): row['price'] for row in rows})
+    return rows
+
+
+def _format_stored(value):
+    """저장소의 float 값을 Sina/SGX 응답과 같은 문자열로 (6120.0 -> '6120')"""
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _stored_rows(store, prefix, field, count=12):
+    """월물마다 인덱스로 최신 1건만 조회하므로 이력이 쌓여도 빠름. 반환: (rows, 마지막 기록 시각)"""
+    rows = []
+    times = []
+    for symbol, month in get_month_symbols(prefix, count):
+        entry = store.value_at(symbol, field, float("inf"))
+        if entry is None:
+            rows.append({"month": month, "price": "N/A"})
+        else:
+            times.append(entry[0])
+            rows.append({"month": month, "price": _format_stored(entry[1])})
+    return rows, (max(times) if times else None)
+
+
+def get_stored_curve(prefix, field, months=12):
+    """임의 prefix/필드의 저장된 마지막 곡선. 반환: (rows, 마지막 기록 시각), 저장소가 꺼져 있으면 (None, None)"""
+    store = get_quote_store()
+    if store is None:
+        return None, None
+    return _stored_rows(store, prefix, field, months)
+
+
+def get_stored_prices(base_symbol_prefixes, price_indices, months=12):
+    """
+    로컬 저장소의 마지막 값으로 get_bulk_prices와 같은 형식을 만듦 (네트워크 없음, 오프라인 시작용)
+    반환: (결과, 마지막 기록 시각) — 저장된 값이 없으면 (None, None)
+    """
+    store = get_quote_store()
+    if store is None:
+        return None, None
+    results = {p: {} for p in base_symbol_prefixes}
+    times = []
+    for prefix in base_symbol_prefixes:
+        for idx in price_indices:
+            rows, ts = _stored_rows(store, prefix, idx, months)
+            results[prefix][idx] = rows
+            if ts is not None:
+                times.append(ts)
+    if not times:
+        return None, None
+    return results, max(times)
+
+
+def get_stored_sgx(months=12):
+    """get_year_sgx 형식의 저장된 마지막 값. 없으면 (None, None)"""
+    store = get_quote_store()
+    if store is None:
+        return None, None
+    rows, ts = _stored_rows(store, SGX_PREFIX, SGX_FIELD, months)
+    if ts is None:
+        return None, None
+    return rows, ts
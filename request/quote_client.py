@@ -0,0 +1,135 @@
+"""
+quote_server.py 구독 클라이언트
+
+서버가 보내주는 snapshot/delta를 받아 시세 캐시(quote_cache)에 미리 넣어둡니다.
+새 값이 오면 앱은 받은 값(current_quotes)으로만 다시 그리고, 사용자가 새로고침해도 캐시에서 바로 나가므로
+upstream(Sina/SGX)에 요청하지 않습니다.
+서버가 죽거나 연결이 끊기면 캐시가 TTL 뒤 만료되어 자동으로 직접 가져오기로 돌아가고, 뒤에서 계속 재연결을 시도합니다.
+"""
+import json
+import socket
+import threading
+
+import config
+from request.quote_cache import quote_cache
+from request.quote_store import record_quotes
+from request.sources import get_instrument, get_source
+
+
+def parse_address(address):
+    """'host:port' -> (host, port)"""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def listen_timeout(snapshot):
+    """서버가 snapshot에 알려준 heartbeat(없으면 가져오기) 주기의 3배 동안 아무것도 없으면 끊긴 것으로 봄"""
+    period = snapshot.get("heartbeat") or snapshot.get("interval") or config.QUOTE_SERVER_HEARTBEAT
+    return period * 3
+
+
+def cache_values(quotes, names):
+    """{종목: {필드: rows}} 중 names 종목 -> 캐시 key 형식 {(prefix, 'yy/mm', source 필드): 값}"""
+    values = {}
+    for name in names:
+        if name not in quotes:
+            continue
+        instrument = get_instrument(name)
+        source = get_source(instrument.source)
+        for field, rows in quotes[name].items():
+            source_field = source.source_field(field)
+            for row in rows:
+                values[(instrument.prefix, row["month"], source_field)] = row["price"]
+    return values
+
+
+class QuoteSubscriber:
+    """
+    백그라운드 스레드에서 서버에 연결해 메시지를 받음
+    on_update(changes): 값이 바뀐 종목이 있을 때 {종목: {필드: 바뀐 rows}}로 호출 (수신 스레드에서 호출됨)
+    전체 값은 current_quotes()로 읽음
+    """
+
+    def __init__(self, address, instruments=None, on_update=None, retry=None):
+        self.host, self.port = parse_address(address)
+        self.instruments = instruments
+        self.on_update = on_update
+        self.retry = retry if retry is not None else config.QUOTE_SERVER_RETRY
+        self.quotes = {}
+        self.connected = False
+        # quotes는 수신 스레드에서 바뀌므로 GUI 스레드는 current_quotes()로 복사본을 읽음
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sock = None
+        self._thread = threading.Thread(target=self._run, name="QuoteSubscriber", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except (OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    print(f"시세 서버 연결 끊김 ({self.host}:{self.port}): {e}, {self.retry}초 후 재연결")
+            self.connected = False
+            self._stop.wait(self.retry)
+
+    def _listen(self):
+        with socket.create_connection((self.host, self.port), timeout=config.HTTP_CONNECT_TIMEOUT) as sock:
+            self._sock = sock
+            # snapshot을 받기 전까지는 이 앱의 설정 기준, 받은 뒤에는 서버가 알려준 주기 기준
+            sock.settimeout(config.QUOTE_SERVER_HEARTBEAT * 3)
+            request = {"type": "subscribe", "instruments": self.instruments} if self.instruments else {}
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as stream:
+                for line in stream:
+                    message = json.loads(line)
+                    if message.get("type") == "snapshot":
+                        sock.settimeout(listen_timeout(message))
+                    self.handle(message)
+            self._sock = None
+
+    def current_quotes(self):
+        """지금까지 받은 전체 시세 {종목: {필드: rows}} 복사본"""
+        with self._lock:
+            return {name: dict(fields) for name, fields in self.quotes.items()}
+
+    def handle(self, message):
+        """snapshot/delta 하나를 반영 (캐시 + 로컬 저장소), 바뀐 값이 있으면 on_update 호출"""
+        if message.get("type") == "heartbeat":
+            return
+        quotes = message.get("quotes", {})
+        changes = quotes
+        with self._lock:
+            if message.get("type") == "snapshot":
+                self.connected = True
+                self.quotes = {name: dict(fields) for name, fields in quotes.items()}
+                # snapshot은 서버가 마지막으로 가져온 값이므로 받은 종목 전부 새 값으로 취급
+                fresh = list(quotes) if message.get("ts") else []
+            else:
+                for name, fields in quotes.items():
+                    for field, rows in fields.items():
+                        by_month = {row["month"]: row for row in self.quotes.setdefault(name, {}).get(field, [])}
+                        by_month.update({row["month"]: row for row in rows})
+                        self.quotes[name][field] = sorted(by_month.values(), key=lambda row: row["month"])
+                fresh = message.get("fresh", [])
+            values = cache_values(self.quotes, fresh)
+
+        # 이번에 서버가 실제로 가져온 종목만 캐시 유효기간을 새로 시작 (실패한 source는 그대로 만료되게 둠)
+        quote_cache.put_many(values)
+        if changes:
+            record_quotes("Server", cache_values(changes, list(changes)))
+            if self.on_update:
+                self.on_update(changes)
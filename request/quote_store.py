@@ -0,0 +1,144 @@
+"""
+시세 스냅샷 로컬 저장소 (SQLite, WAL 모드, 추가 전용)
+
+가져온 값은 모두 (ts, source, contract, field, value) 한 줄씩 쌓기만 하고 수정/삭제하지 않습니다.
+- 월물별 최신값 / 특정 시각 기준 값: value_at() — (contract, field, ts) 인덱스로 한 행만 찾음
+- 장중 이력: history()
+contract는 Sina 심볼과 같은 형식 (예: nf_TA2605, sgx_UC2605) 입니다.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+import time
+
+import config
+from app_paths import data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    ts       REAL NOT NULL,
+    source   TEXT NOT NULL,
+    contract TEXT NOT NULL,
+    field    TEXT NOT NULL,
+    value    REAL NOT NULL
+);
+-- 월물별 최신값 / 시각 T 기준 값 조회용
+CREATE INDEX IF NOT EXISTS idx_quotes_contract_field_ts ON quotes (contract, field, ts);
+-- 시각 구간별 스냅샷 조회용
+CREATE INDEX IF NOT EXISTS idx_quotes_ts ON quotes (ts);
+"""
+
+
+def contract_symbol(prefix, month):
+    """('nf_TA', '26/05') -> 'nf_TA2605'"""
+    return prefix + month.replace('/', '')
+
+
+def to_number(value):
+    """'9,494' 같은 시세 문자열을 float로. N/A 등 숫자가 아니면 None"""
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+
+class QuoteStore:
+    def __init__(self, path):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # 워커 스레드에서 기록하고 UI 스레드에서 읽으므로 연결 하나를 lock으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def record(self, source, values, ts=None):
+        """
+        values: {(prefix, 'yy/mm', field): 값} — 캐시 key와 같은 형식
+        숫자가 아닌 값(N/A)은 건너뛰고, 한 스냅샷은 executemany 한 번(트랜잭션 하나)으로 기록
+        반환: 기록한 행 수
+        """
+        ts = time.time() if ts is None else ts
+        rows = []
+        for (prefix, month, field), value in values.items():
+            number = to_number(value)
+            if number is not None:
+                rows.append((ts, source, contract_symbol(prefix, month), str(field), number))
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO quotes (ts, source, contract, field, value) VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def value_at(self, contract, field, ts):
+        """시각 ts 이전(포함)에 기록된 마지막 값. 없으면 None, 있으면 (기록 시각, 값)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, value FROM quotes WHERE contract = ? AND field = ? AND ts <= ? "
+                "ORDER BY ts DESC LIMIT 1",
+                (contract, str(field), ts),
+            ).fetchone()
+
+    def history(self, contract, field, since=None, until=None):
+        """[(ts, value)] 시간순"""
+        since = float("-inf") if since is None else since
+        until = float("inf") if until is None else until
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, value FROM quotes WHERE contract = ? AND field = ? AND ts BETWEEN ? AND ? "
+                "ORDER BY ts",
+                (contract, str(field), since, until),
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_quote_store():
+    """저장소를 처음 쓸 때 연결. 꺼져 있거나 열 수 없으면 None"""
+    global _store
+    if not config.QUOTE_STORE_ENABLED:
+        return None
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = QuoteStore(data_path(config.QUOTE_STORE_PATH))
+            except (sqlite3.Error, OSError) as e:
+                # OSError: data 폴더를 만들 수 없는 경우 (쓰기 권한 없음 등)
+                print(f"시세 저장소 열기 실패: {e}")
+                return None
+        return _store
+
+
+def record_quotes(source, values):
+    """저장 실패가 시세 조회를 막지 않도록 오류는 출력만 함"""
+    store = get_quote_store()
+    if store is None:
+        return 0
+    try:
+        return store.record(source, values)
+    except sqlite3.Error as e:
+        print(f"시세 저장 실패 ({source}): {e}")
+        return 0
+
+
+def close_quote_store():
+    global _store
+    with _store_lock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+atexit.register(close_quote_store)
@@ -0,0 +1,99 @@
+"""
+upstream 호스트별 요청 제한 (token bucket)
+
+자동 새로고침이나 여러 페이지가 한꺼번에 요청해도 호스트마다 초당 rate개(순간 최대 burst개)를 넘지 않게 합니다.
+허용량은 config.HOST_RATE_LIMITS에서 정하고, 없는 호스트(로컬 proxy, stub 서버 등)는 제한하지 않습니다.
+429/403 같은 차단 응답을 받으면 penalize()로 한동안 그 호스트에 요청을 보내지 않습니다.
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+
+import config
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        # penalize() 이후 이 시각까지는 토큰을 주지 않음
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            return wait
+
+    def wait_time(self):
+        """토큰을 쓰지 않고, 지금 요청하면 기다려야 하는 시간(초)만 계산. 반환: (초, 차단 중 여부)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            blocked = self._blocked_until - now
+            if blocked > 0:
+                return blocked, True
+            return max(0.0, (1 - self._tokens) / self.rate), False
+
+    def acquire(self):
+        """토큰을 받을 때까지 대기. 반환: 기다린 시간(초)"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds):
+        """차단 응답을 받은 뒤 seconds초 동안 이 호스트로 요청하지 않음"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def host_of(url):
+    return urlsplit(url).hostname or ""
+
+
+def host_limiter(url):
+    """url의 호스트에 해당하는 TokenBucket. 제한이 설정되지 않은 호스트면 None"""
+    host = host_of(url)
+    limit = config.HOST_RATE_LIMITS.get(host)
+    if limit is None:
+        return None
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, burst = limit
+            bucket = _buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+
+def wait_for_host(url):
+    """url로 요청하기 전에 호출. 반환: 기다린 시간(초)"""
+    bucket = host_limiter(url)
+    return bucket.acquire() if bucket is not None else 0.0
+
+
+def host_wait_time(url):
+    """url의 호스트로 지금 요청하면 기다려야 하는 시간(초)과 차단 중 여부. 제한 없는 호스트면 (0, False)"""
+    bucket = host_limiter(url)
+    return bucket.wait_time() if bucket is not None else (0.0, False)
+
+
+def penalize_host(url, seconds=None):
+    bucket = host_limiter(url)
+    if bucket is not None:
+        bucket.penalize(config.HOST_BLOCK_BACKOFF if seconds is None else seconds)
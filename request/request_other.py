@@ -1,53 +1,111 @@
-import requests
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+import re
 
-def get_year_prices(base_symbol_prefix, price_index):
+from calc.contract_calendar import contract_months
+from request.http_session import QuoteFetchError, http_get
+
+API_URL = "https://hq.sinajs.cn/list="
+HEADERS = {"Referer": "http://finance.sina.com.cn", "User-Agent": "Mozilla/5.0"}
+# URL이 너무 길어지면 Sina가 잘라버리므로 일정 길이마다 요청을 나눔
+MAX_URL_LENGTH = 2000
+
+
+def get_month_symbols(base_symbol_prefix, count=12):
+    """지금부터 count개월간의 (심볼, 'yy/mm') 목록 생성 (상장 여부와 무관하게 모든 월)"""
+    return [(symbol, month) for symbol, month, _ in contract_months(base_symbol_prefix, count)]
+
+
+def chunk_symbols(symbols, max_length=MAX_URL_LENGTH):
+    """콤마로 결합한 URL 길이가 max_length를 넘지 않도록 심볼 목록을 분할"""
+    chunks = []
+    current = []
+    length = len(API_URL)
+    for symbol in symbols:
+        extra = len(symbol) + (1 if current else 0)
+        if current and length + extra > max_length:
+            chunks.append(current)
+            current = []
+            length = len(API_URL)
+            extra = len(symbol)
+        current.append(symbol)
+        length += extra
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# 한 줄: var hq_str_<심볼>="필드,필드,...";  (따옴표가 닫히지 않은 잘린 줄은 무시)
+HQ_LINE_RE = re.compile(r'var hq_str_([^=\s]+)="([^"\n]*)"')
+# Sina 응답은 GBK. GB18030은 GBK의 상위 집합이라 드문 한자도 깨지지 않음
+RESPONSE_ENCODING = "gb18030"
+
+
+def decode_hq_body(content):
+    """응답 바이트를 직접 디코딩 (Content-Type에 charset이 빠지면 requests가 latin-1로 읽어 한자가 깨짐)"""
+    return content.decode(RESPONSE_ENCODING, errors="replace")
+
+
+def parse_hq_response(text, price_indices):
+    """
+    응답 전체를 정규식 한 번으로 훑어 {심볼: 필드 리스트} 로 반환
+    - 줄 순서가 아니라 'var hq_str_<심볼>=' 의 심볼로 구분하므로 줄이 빠지거나 순서가 바뀌어도 월물이 섞이지 않음
+    - 필드는 요청한 index 중 가장 큰 것까지만 나눔 (뒤쪽 필드는 나누지 않고 한 덩어리로 남음)
+    데이터가 없는 월물은 빈 리스트
+    """
+    maxsplit = max(price_indices) + 1
+    return {
+        symbol: content.split(',', maxsplit) if content else []
+        for symbol, content in HQ_LINE_RE.findall(text)
+    }
+
+
+def hq_field(fields, idx):
+    """필드 리스트에서 idx 위치 값, 없거나 빈 값이면 'N/A'"""
+    if idx < len(fields) and fields[idx]:
+        return fields[idx]
+    return "N/A"
+
+
+def get_bulk_prices(base_symbol_prefixes, price_indices, months=12):
+    """
+    여러 심볼 계열과 여러 필드를 한 번의 요청(길면 분할)으로 가져옵니다.
+    base_symbol_prefixes: ['nf_TA', 'nf_PX', 'hf_OIL'] 등
+    price_indices: [8, 10] 등 (8: 현재가, 10: 전날 정산가)
+    months: 곡선 길이(개월). 상장되지 않은 월물은 요청하지 않고 N/A로 채웁니다.
+    반환: {prefix: {price_index: [{"month": "yy/mm", "price": "..."}]}} — 월마다 한 행
+    """
+    months_by_prefix = {p: contract_months(p, months) for p in base_symbol_prefixes}
+    symbols = [sym for p in base_symbol_prefixes for sym, _, listed in months_by_prefix[p] if listed]
+
+    # 실패 시 빈 리스트 대신 QuoteFetchError가 그대로 올라감 (0으로 표시되는 것 방지)
+    records = {}
+    for chunk in chunk_symbols(symbols):
+        url = API_URL + ','.join(chunk)
+        response = http_get("Sina", url, headers=HEADERS)
+        parsed = parse_hq_response(decode_hq_body(response.content), price_indices)
+        # 요청 제한/차단 시 200과 함께 시세 없는 본문이 오기도 함 -> 전부 N/A(0) 대신 실패로 처리
+        if not parsed:
+            raise QuoteFetchError("Sina", url, "응답에 시세가 없습니다 (요청 제한/차단 가능)")
+        records.update(parsed)
+
+    results = {}
+    for prefix in base_symbol_prefixes:
+        results[prefix] = {}
+        for idx in price_indices:
+            rows = []
+            for symbol, month, _ in months_by_prefix[prefix]:
+                # 응답에 없거나 비어있는 월물(비상장 포함)은 N/A
+                rows.append({"month": month, "price": hq_field(records.get(symbol, []), idx)})
+            results[prefix][idx] = rows
+    return results
+
+
+def get_year_prices(base_symbol_prefix, price_index, months=12):
     """
     base_symbol_prefix: 'nf_TA' (PTA), 'nf_PX' (PX) 등
     price_index: 데이터에서 현재가가 위치한 인덱스 (PTA/PX는 8번, Brent는 0번 등)
     price_index : 전날 종가? 
     """
-    current_date = datetime.now()
-    months_info = []
-    symbols = []
-
-    # 1. 지금부터 12개월간의 심볼 생성
-    for i in range(12):
-        target_date = current_date + relativedelta(months=i)
-        yy = target_date.strftime("%y") # '26'
-        mm = target_date.strftime("%m") # '05'
-        
-        symbol = f"{base_symbol_prefix}{yy}{mm}"
-        symbols.append(symbol)
-        months_info.append(f"{yy}/{mm}")
-
-    # 2. API 호출 (콤마로 심볼 결합)
-    api_url = f"https://hq.sinajs.cn/list={','.join(symbols)}"
-    headers = {"Referer": "http://finance.sina.com.cn", "User-Agent": "Mozilla/5.0"}
-    
-    try:
-        response = requests.get(api_url, headers=headers)
-        lines = response.text.strip().split('\n')
-        
-        results = []
-        for i, line in enumerate(lines):
-            if '"' in line:
-                content = line.split('"')[1]
-                if not content: # 데이터가 없는 월물인 경우
-                    results.append({"month": months_info[i], "price": "N/A"})
-                    continue
-                
-                data_list = content.split(',')
-                # 현재가 추출 (PTA/PX 등 내수선물은 8번이 현재가임)
-                price = data_list[price_index]
-                results.append({"month": months_info[i], "price": price})
-        
-        return results
-
-    except Exception as e:
-        print(f"Error: {e}")
-        return []
+    return get_bulk_prices([base_symbol_prefix], [price_index], months)[base_symbol_prefix][price_index]
 
 
 
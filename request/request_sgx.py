@@ -1,29 +1,34 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service # Service 객체 추가
-from selenium.webdriver.common.by import By            # 요소 탐색용
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# selenium은 무거우므로 Chrome을 실제로 띄울 때(JSON 경로 실패 등)만 import
 import sys
 import os 
+import atexit
+import threading
 import time
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
 import platform
 
-options = webdriver.ChromeOptions()
+import config
+from request.http_session import QuoteFetchError
+from request.rate_limit import wait_for_host
+from request.request_sgx_http import get_year_sgx_http, only_listed, parse_contract_month, sgx_months_info
 
-# headless 옵션 설정
-options.add_argument('headless')
-options.add_argument("no-sandbox")
+def build_chrome_options():
+    from selenium import webdriver
 
-# 브라우저 윈도우 사이즈
-options.add_argument('window-size=1920x1080')
+    options = webdriver.ChromeOptions()
 
+    # headless 옵션 설정
+    options.add_argument('headless')
+    options.add_argument("no-sandbox")
 
-# 사람처럼 보이게 하는 옵션들
-options.add_argument("disable-gpu")
-options.add_argument("lang=ko_KR")
-options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_12_6) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/61.0.3163.100 Safari/537.36')
+    # 브라우저 윈도우 사이즈
+    options.add_argument('window-size=1920x1080')
+
+
+    # 사람처럼 보이게 하는 옵션들
+    options.add_argument("disable-gpu")
+    options.add_argument("lang=ko_KR")
+    options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_12_6) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/61.0.3163.100 Safari/537.36')
+    return options
 
 # 1. [경고 해결] Service 객체를 통해 드라이버 위치 지정
 
@@ -43,71 +48,216 @@ def get_driver_path():
     
     return os.path.join(base_path, driver_name)
 
-# 사용 예시
-chrome_driver_path = get_driver_path()
-s = Service(chrome_driver_path)
-driver = webdriver.Chrome(service=s, options=options)
+SGX_URL = 'https://www.sgx.com/derivatives/delayed-prices-futures?category=fx&cc=UC'
+FIRST_ROW_XPATH = '//*[@id="page-container"]/template-base/div/div/sgx-widgets-wrapper/widget-derivatives-futures-prices/section[1]/div[1]/sgx-table/div/sgx-table-list/sgx-table-row[1]'
+
+# 각 행의 (라벨 텍스트, 첫 번째 숫자 셀 텍스트)를 한 번에 반환
+EXTRACT_ROWS_JS = """
+const rows = document.querySelectorAll('widget-derivatives-futures-prices sgx-table-list sgx-table-row');
+return Array.from(rows).map(row => {
+    const label = row.querySelector('sgx-table-cell-text, sgx-table-cell-link, sgx-table-cell');
+    const price = row.querySelector('sgx-table-cell-number');
+    return [
+        (label ? label.textContent : row.textContent).trim(),
+        price ? price.textContent.trim() : ''
+    ];
+});
+"""
+
+class SgxSession:
+    """
+    SGX 페이지를 열어둔 채 재사용하는 장기 세션
+    - Chrome은 최초 사용 시점에 생성 (창이 먼저 뜨도록)
+    - 페이지가 스스로 갱신되면 그대로 읽고, 일정 시간 테이블 변화가 없으면 refresh()로만 다시 읽음
+    - Chrome이 죽었으면 앱 재시작 없이 새 driver를 띄움
+    """
+
+    def __init__(self, url=SGX_URL, max_age=None):
+        self.url = url
+        self.max_age = max_age if max_age is not None else config.SGX_PAGE_MAX_AGE
+        self._driver = None
+        # 백그라운드 warm-up과 데이터 로드가 같은 driver를 동시에 조작하지 않도록
+        self._lock = threading.RLock()
+        self._signature = None
+        self._changed_at = 0.0
+
+    def _start(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service # Service 객체 추가
+
+        s = Service(get_driver_path())
+        driver = webdriver.Chrome(service=s, options=build_chrome_options())
+        # 명시적 대기만 사용 (암시적 대기는 빠진 요소마다 5초씩 멈춤)
+        driver.implicitly_wait(0)
+        # SGX UC(USD/CNH) 선물 페이지 접속 (호스트별 요청 제한 적용)
+        wait_for_host(self.url)
+        driver.get(self.url)
+        self._driver = driver
+        self._signature = None
+        self._changed_at = time.monotonic()
+
+    def _is_alive(self):
+        if self._driver is None:
+            return False
+        from selenium.common.exceptions import WebDriverException
+        try:
+            self._driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def get_driver(self):
+        """driver를 반환합니다. 없거나 죽었으면 이 시점에 새로 띄웁니다."""
+        with self._lock:
+            if self._driver is not None and not self._is_alive():
+                print("SGX driver 응답 없음, 새로 시작합니다.")
+                self.close()
+            if self._driver is None:
+                self._start()
+            return self._driver
+
+    def is_stale(self):
+        """마지막으로 테이블 내용이 바뀐 뒤 max_age초가 지났는지"""
+        return time.monotonic() - self._changed_at > self.max_age
+
+    def refresh(self):
+        """전체 재접속(get) 대신 현재 페이지만 새로고침"""
+        with self._lock:
+            driver = self.get_driver()
+            wait_for_host(self.url)
+            driver.refresh()
+            self._changed_at = time.monotonic()
+            wait_table_ready(driver)
+
+    def read_rows(self):
+        """
+        테이블 전체 [[라벨, 가격], ...]를 읽습니다.
+        오래된 데이터면 먼저 refresh하고, 도중에 Chrome이 죽으면 한 번 재시작 후 다시 시도합니다.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    driver = self.get_driver()
+                    if self.is_stale():
+                        self.refresh()
+                    wait_table_ready(driver)
+                    rows = driver.execute_script(EXTRACT_ROWS_JS) or []
+                    break
+                except WebDriverException as e:
+                    if attempt == 1 or self._is_alive():
+                        raise
+                    print(f"SGX driver 오류, 재시작 후 재시도: {e}")
+                    self.close()
+
+            # 페이지가 스스로 값을 갱신했는지 판단하기 위한 내용 서명
+            signature = tuple(tuple(row) for row in rows)
+            if signature != self._signature:
+                self._signature = signature
+                self._changed_at = time.monotonic()
+            return rows
+
+    def close(self):
+        """driver가 실제로 떠 있을 때만 종료 (여러 번 호출되어도 안전)"""
+        with self._lock:
+            if self._driver is None:
+                return
+            print('SGX driver를 종료합니다.')
+            try:
+                self._driver.quit()
+            except Exception as e:
+                print(f"driver 종료 중 오류: {e}")
+            self._driver = None
+
+
+sgx_session = SgxSession()
+
 
-# SGX UC(USD/CNH) 선물 페이지 접속
-driver.get('https://www.sgx.com/derivatives/delayed-prices-futures?category=fx&cc=UC')
+def get_driver():
+    return sgx_session.get_driver()
 
-# 데이터 로딩을 위해 넉넉히 대기 (동적 페이지 특성상 필요)
-driver.implicitly_wait(5) 
-time.sleep(5) # 추가 안정화 시간
 
+def wait_table_ready(driver, timeout=15):
+    """고정 sleep 대신 테이블 첫 행이 DOM에 나타날 때까지만 대기"""
+    from selenium.webdriver.common.by import By            # 요소 탐색용
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
 
-def get_year_sgx():
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, FIRST_ROW_XPATH)))
+
+
+def _warm_up():
+    try:
+        wait_table_ready(get_driver())
+        print("--- SGX driver 준비 완료 ---")
+    except Exception as e:
+        print(f"SGX driver warm-up 실패: {e}")
+
+
+def warm_up_driver():
+    """창이 뜬 뒤 백그라운드에서 미리 Chrome을 띄워 첫 로드 대기시간을 줄입니다."""
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+
+def get_year_sgx(months=12):
+    """
+    SGX USD/CNH months개월 가격 [{"month": "yy/mm", "price": "..."}] (비상장 월물은 N/A)
+    Chrome 없이 JSON API를 먼저 시도하고, 실패한 경우에만 Selenium으로 페이지를 읽습니다.
+    """
+    if config.SGX_HTTP_ENABLED:
+        try:
+            return get_year_sgx_http(months=months)
+        except QuoteFetchError as e:
+            print(f"SGX JSON 경로 실패, Selenium으로 재시도: {e}")
+    return get_year_sgx_selenium(months)
+
+
+def get_year_sgx_selenium(months=12):
     """
     SGX USD/CNH 데이터를 추출하며, 동적 로딩 대기 및 예외 처리를 포함합니다.
     Input/Output 포맷은 이전과 동일하게 유지됩니다.
     """
     print("--- SGX 정보 추출 시작 ---")
-    
-    current_date = datetime.now()
-    months_info = []
-    results = []
 
-    # 1. 12개월 라벨 미리 생성
-    for i in range(12):
-        target_date = current_date + relativedelta(months=i)
-        months_info.append(target_date.strftime("%y/%m"))
+    # 1. 곡선 라벨 미리 생성 (상장 달력 기준)
+    months_info, listed = sgx_months_info(months)
 
-    # 2. 첫 번째 요소가 나타날 때까지 명시적 대기 (최대 15초)
-    # 테이블 자체가 로드되지 않았을 때를 대비한 안전장치입니다.
+    # 2. 열어둔 페이지에서 테이블 전체를 한 번의 execute_script로 읽음
+    # (첫 행이 나타날 때까지 명시적 대기, 오래된 데이터면 refresh)
     try:
-        first_xpath = '//*[@id="page-container"]/template-base/div/div/sgx-widgets-wrapper/widget-derivatives-futures-prices/section[1]/div[1]/sgx-table/div/sgx-table-list/sgx-table-row[1]'
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.XPATH, first_xpath)))
+        rows = sgx_session.read_rows()
     except Exception as e:
-        print(f"테이블 로딩 시간 초과: {e}")
+        print(f"테이블 로딩/추출 실패: {e}")
         return [{"month": m, "price": "N/A"} for m in months_info]
 
-    # 3. 데이터 추출 루프
-    for i in range(12):
-        idx = (i * 2) + 1
-        xpath = f'//*[@id="page-container"]/template-base/div/div/sgx-widgets-wrapper/widget-derivatives-futures-prices/section[1]/div[1]/sgx-table/div/sgx-table-list/sgx-table-row[{idx}]/sgx-table-cell-number[1]'
-        
-        try:
-            # 개별 요소 탐색 (암시적 대기 활용)
-            target = driver.find_element(By.XPATH, xpath)
-            
-            # .text가 비어있는 경우가 많으므로 textContent를 우선순위로 가져옴
-            value = target.get_attribute('textContent').strip() or target.text.strip()
-
-            # 특수 문자 '﹣' (Full-width hyphen) 및 빈 값 처리
-            if value in ['﹣', '', '-', 'None']:
-                results.append({"month": months_info[i], "price": "N/A"})
-            else:
-                results.append({"month": months_info[i], "price": value})
-                
-        except Exception:
-            # 요소를 찾지 못할 경우에도 리스트 길이를 맞추기 위해 N/A 삽입
-            results.append({"month": months_info[i], "price": "N/A"})
-
-    return results
+    return only_listed(map_rows_by_month(rows, months_info), listed)
+
+
+def map_rows_by_month(rows, months_info):
+    """
+    execute_script 결과 [[라벨, 가격], ...]를 월물 기준으로 매칭
+    행 위치(idx = i*2+1)를 가정하지 않으므로 빠지거나 순서가 바뀐 행도 올바른 월에 들어갑니다.
+    """
+    prices = {}
+    for label, value in rows or []:
+        month = parse_contract_month(label or "")
+        value = (value or "").strip()
+        # 특수 문자 '﹣' (Full-width hyphen) 및 빈 값 처리
+        if month is None or value in ['﹣', '', '-', 'None'] or month in prices:
+            continue
+        prices[month] = value.replace(',', '')
+    return [{"month": m, "price": prices.get(m, "N/A")} for m in months_info]
 
 def turn_off_driver():
-    print('프로그램 종료, driver를 종료합니다.')
-    driver.quit()
+    sgx_session.close()
+
+
+# Qt 종료 훅을 거치지 않고 끝나는 경우(스크립트 실행 등)에도 Chrome이 남지 않도록
+atexit.register(turn_off_driver)
 
 
 
@@ -0,0 +1,135 @@
+import json
+import os
+import re
+import config
+from calc.contract_calendar import contract_months
+from request.http_session import QuoteFetchError, http_get
+
+# SGX 페이지가 내부적으로 호출하는 지연시세 JSON API (UC = USD/CNH 선물)
+HEADERS = {
+    "Referer": "https://www.sgx.com/",
+    "Origin": "https://www.sgx.com",
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json",
+}
+
+# 응답 레코드에서 월물/가격을 찾을 필드 후보 (앞에 있을수록 우선)
+MONTH_KEYS = ["delivery-month", "contract-month", "month"]
+CODE_KEYS = ["contract-code", "symbol"]
+PRICE_KEYS = ["last-price", "daily-settlement-price", "settlement-price", "close-price"]
+
+# 선물 월물 코드 (F=1월 ... Z=12월)
+MONTH_CODES = "FGHJKMNQUVXZ"
+EMPTY_VALUES = ['﹣', '', '-', 'None', None]
+
+
+MONTH_NAMES = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+
+
+def parse_contract_month(text):
+    """
+    월물 표기에서 'yy/mm' 라벨 추출, 인식하지 못하면 None
+    지원 형식: 202605, 2026-05, UCK26, UC K26, May 26, MAY-2026
+    """
+    text = text.strip().upper()
+    m = re.match(r"^(\d{4})-?(\d{2})\b", text)
+    if m:
+        return f"{m.group(1)[2:]}/{m.group(2)}"
+    m = re.search(r"\b(" + "|".join(MONTH_NAMES) + r")[A-Z]*[\s\-']*(\d{4}|\d{2})\b", text)
+    if m:
+        return f"{m.group(2)[-2:]}/{MONTH_NAMES.index(m.group(1)) + 1:02d}"
+    m = re.search(r"([FGHJKMNQUVXZ])(\d{2})\b", text)
+    if m:
+        return f"{m.group(2)}/{MONTH_CODES.index(m.group(1)) + 1:02d}"
+    return None
+
+
+def _month_label(record):
+    """레코드에서 'yy/mm' 라벨 추출"""
+    for key in MONTH_KEYS + CODE_KEYS:
+        label = parse_contract_month(str(record.get(key) or ""))
+        if label:
+            return label
+    return None
+
+
+def _price(record):
+    for key in PRICE_KEYS:
+        value = record.get(key)
+        if value not in EMPTY_VALUES:
+            return str(value).replace(',', '').strip()
+    return None
+
+
+def parse_sgx_json(payload, months_info):
+    """
+    JSON 응답을 get_year_sgx와 같은 [{"month", "price"}] 형식으로 변환
+    행 순서가 아니라 월물 기준으로 매칭하므로 빠진 월물은 N/A가 됩니다.
+    """
+    records = payload.get("data", payload) if isinstance(payload, dict) else payload
+    prices = {}
+    for record in records or []:
+        if not isinstance(record, dict):
+            continue
+        label = _month_label(record)
+        price = _price(record)
+        if label and price and label not in prices:
+            prices[label] = price
+    return [{"month": m, "price": prices.get(m, "N/A")} for m in months_info]
+
+
+def _load_payload(mode, path):
+    """
+    fixture 모드
+    - None: 실제 API 호출
+    - "record": 실제 API 호출 후 응답을 path에 저장
+    - "replay": 네트워크 없이 path에 저장된 응답 사용
+    """
+    if mode == "replay":
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise QuoteFetchError("SGX", path, f"fixture 읽기 실패: {e}") from e
+
+    response = http_get("SGX", config.SGX_API_URL, headers=HEADERS)
+    try:
+        payload = response.json()
+    except ValueError as e:
+        raise QuoteFetchError("SGX", config.SGX_API_URL, f"JSON 파싱 실패: {e}") from e
+
+    if mode == "record":
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+    return payload
+
+
+def sgx_months_info(months):
+    """곡선의 'yy/mm' 목록과 그중 상장된 월물 집합 (SGX UC 상장 달력 기준)"""
+    calendar = contract_months("sgx_UC", months)
+    return [month for _, month, _ in calendar], {month for _, month, listed in calendar if listed}
+
+
+def only_listed(rows, listed):
+    """비상장 월물은 값이 있어도 N/A (월물 라벨을 잘못 읽은 값이 섞이지 않도록)"""
+    return [row if row["month"] in listed else {"month": row["month"], "price": "N/A"} for row in rows]
+
+
+def get_year_sgx_http(mode=None, path=None, months=12):
+    """
+    Chrome 없이 JSON API로 months개월 USD/CNH 가격을 가져옵니다.
+    가격이 하나도 없으면 QuoteFetchError를 올려 Selenium 경로로 넘어가게 합니다.
+    """
+    mode = mode if mode is not None else config.SGX_FIXTURE_MODE
+    path = path or config.SGX_FIXTURE_PATH
+
+    months_info, listed = sgx_months_info(months)
+    results = only_listed(parse_sgx_json(_load_payload(mode, path), months_info), listed)
+    if all(row["price"] == "N/A" for row in results):
+        raise QuoteFetchError("SGX", config.SGX_API_URL, "응답에 유효한 가격이 없습니다.")
+    return results
+
+
+if __name__ == '__main__':
+    print(get_year_sgx_http())
@@ -0,0 +1,260 @@
+"""
+시세 source 등록부 (adapter) + 스케줄러
+
+페이지는 Sina 심볼/응답 index 대신 이름으로 요청합니다.
+    wants = {"PTA": ["price", "prev_settle"], "USDCNH": ["price"]}
+    tasks = source_tasks(wants, months=12)   # start_worker / fetch_concurrently에 그대로 넘김
+결과 형식: {종목 이름: {필드 이름: [{'month': 'yy/mm', 'price': '...'}]}}
+
+- adapter(QuoteSource): 심볼 규칙(symbol_prefix), 필드 이름 -> source 필드, 묶음 요청 가능 여부(batch),
+  upstream 호스트(요청 제한은 config.HOST_RATE_LIMITS), 최대 대기시간(timeout)을 선언합니다.
+- 종목(Instrument): 이름 -> (adapter, 심볼 root). 예: PTA -> sina_cn + 'TA' -> nf_TA2605 ...
+- 같은 label(진행 표시/timeout 단위)의 종목은 한 번의 요청으로 묶어서 가져옵니다.
+
+새 feed(MOPJ, PX-CFR 등) 추가: 기존 adapter로 되면 register_instrument만,
+새 응답 형식이면 QuoteSource를 상속해 fetch/stored를 구현하고 register_source 하면 됩니다.
+API가 없는 값은 manual source에 set_manual_quote로 넣어 같은 방식으로 읽습니다.
+"""
+from abc import ABC, abstractmethod
+
+import config
+from request.fetch_orchestrator import fetch_concurrently
+from request.quote_cache import get_cached_prices, get_cached_sgx, get_stored_curve, get_stored_prices, get_stored_sgx
+from request.quote_store import get_quote_store
+
+
+class QuoteSource(ABC):
+    """
+    시세 source adapter 기본 클래스 (fetch/stored를 구현하지 않은 adapter는 만들 때 TypeError)
+    label이 같은 adapter끼리는 한 번의 fetch로 묶입니다 (batch=True일 때).
+    """
+
+    def __init__(self, name, label, symbol_prefix, fields, batch=False, host=None, timeout=None):
+        self.name = name
+        self.label = label
+        self.symbol_prefix = symbol_prefix
+        # 필드 이름 -> source 내부 필드 (Sina: 응답 index, SGX: 'price')
+        self.fields = fields
+        self.batch = batch
+        # upstream 호스트 (None: 네트워크 없음). 요청 제한은 config.HOST_RATE_LIMITS[host]이고 같은 호스트의 adapter가 함께 씀
+        self.host = host
+        self.timeout = timeout or config.SOURCE_TIMEOUTS.get(label, config.SOURCE_TIMEOUTS["DEFAULT"])
+
+    def prefix(self, root):
+        """심볼 root -> 월물 앞에 붙는 prefix ('TA' -> 'nf_TA')"""
+        return self.symbol_prefix + root
+
+    def source_field(self, field):
+        if field not in self.fields:
+            raise KeyError(f"{self.name}: 지원하지 않는 필드 '{field}' (가능: {', '.join(self.fields)})")
+        return self.fields[field]
+
+    @abstractmethod
+    def fetch(self, items, months, force=False):
+        """items: [(prefix, [source 필드])] -> {prefix: {source 필드: rows}}"""
+
+    @abstractmethod
+    def stored(self, items, months):
+        """로컬 저장소의 마지막 값 (네트워크 없음). 반환: ({prefix: {source 필드: rows}}, 마지막 기록 시각) 또는 (None, None)"""
+
+
+class SinaSource(QuoteSource):
+    """hq.sinajs.cn: 여러 심볼을 한 번의 요청으로 가져옴 (국내/해외 선물 공통)"""
+
+    def fetch(self, items, months, force=False):
+        prefixes = [prefix for prefix, _ in items]
+        indices = sorted({idx for _, fields in items for idx in fields})
+        return get_cached_prices(prefixes, indices, force=force, months=months)
+
+    def stored(self, items, months):
+        prefixes = [prefix for prefix, _ in items]
+        indices = sorted({idx for _, fields in items for idx in fields})
+        return get_stored_prices(prefixes, indices, months)
+
+
+class SgxSource(QuoteSource):
+    """SGX USD/CNH: 곡선 전체가 한 표 (JSON API 우선, 실패 시 Selenium)"""
+
+    def fetch(self, items, months, force=False):
+        rows = get_cached_sgx(force=force, months=months)
+        return {prefix: {field: rows for field in fields} for prefix, fields in items}
+
+    def stored(self, items, months):
+        rows, ts = get_stored_sgx(months)
+        if rows is None:
+            return None, None
+        return {prefix: {field: rows for field in fields} for prefix, fields in items}, ts
+
+
+class ManualSource(QuoteSource):
+    """API가 없는 값 (직접 입력). set_manual_quote로 기록한 마지막 값을 읽음, 네트워크 없음"""
+
+    def fetch(self, items, months, force=False):
+        results, _ = self.stored(items, months)
+        return results or {prefix: {field: [] for field in fields} for prefix, fields in items}
+
+    def stored(self, items, months):
+        results = {}
+        times = []
+        for prefix, fields in items:
+            results[prefix] = {}
+            for field in fields:
+                rows, ts = get_stored_curve(prefix, field, months)
+                results[prefix][field] = rows or []
+                if ts is not None:
+                    times.append(ts)
+        if not times:
+            return None, None
+        return results, max(times)
+
+
+class Instrument:
+    def __init__(self, name, source, root):
+        self.name = name
+        self.source = source
+        self.root = root
+
+    @property
+    def prefix(self):
+        return get_source(self.source).prefix(self.root)
+
+
+SOURCES = {}
+INSTRUMENTS = {}
+
+
+def register_source(source):
+    SOURCES[source.name] = source
+    return source
+
+
+def register_instrument(name, source, root):
+    INSTRUMENTS[name] = Instrument(name, source, root)
+    return INSTRUMENTS[name]
+
+
+def get_source(name):
+    return SOURCES[name]
+
+
+def get_instrument(name):
+    if name not in INSTRUMENTS:
+        raise KeyError(f"등록되지 않은 종목: {name}")
+    return INSTRUMENTS[name]
+
+
+# Sina 국내 선물: index 8 = 현재가, 10 = 전일 정산가
+register_source(SinaSource("sina_cn", "Sina", "nf_", {"price": 8, "prev_settle": 10}, batch=True, host="hq.sinajs.cn"))
+# Sina 해외 선물 (기존 Page1과 같은 index 사용)
+register_source(SinaSource("sina_global", "Sina", "hf_", {"price": 8}, batch=True, host="hq.sinajs.cn"))
+register_source(SgxSource("sgx_fx", "SGX", "sgx_", {"price": "price"}, host="api.sgx.com"))
+register_source(ManualSource("manual", "Manual", "manual_", {"price": "price"}))
+
+register_instrument("PTA", "sina_cn", "TA")
+register_instrument("PX", "sina_cn", "PX")
+register_instrument("BRENT", "sina_global", "OIL")
+register_instrument("USDCNH", "sgx_fx", "UC")
+# API가 없는 값: set_manual_quote("MOPJ", "26/05", 650.0)로 넣으면 다른 종목처럼 wants로 읽힘
+register_instrument("MOPJ", "manual", "MOPJ")
+
+
+def set_manual_quote(name, month, value, field="price"):
+    """
+    manual 종목 값 입력 (로컬 저장소에 기록되어 다음 fetch/재시작 때도 읽힘)
+    manual 값은 저장소에만 있으므로 저장소를 쓸 수 없거나 숫자가 아니면 조용히 버리지 않고 예외를 냄
+    """
+    instrument = get_instrument(name)
+    source = get_source(instrument.source)
+    store = get_quote_store()
+    if store is None:
+        raise RuntimeError(f"{name}: 시세 저장소를 쓸 수 없어 수동 입력 값을 저장하지 못했습니다 (config.QUOTE_STORE_ENABLED 확인)")
+    if not store.record("Manual", {(instrument.prefix, month, source.source_field(field)): value}):
+        raise ValueError(f"{name} {month}: 숫자가 아닌 값은 저장할 수 없습니다 ({value!r})")
+
+
+def _group_by_label(wants):
+    """
+    wants: {종목 이름: [필드 이름]} -> {label: [(adapter, prefix, 종목 이름, {필드 이름: source 필드})]}
+    batch가 아닌 adapter는 label 안에서도 종목마다 따로 요청
+    """
+    groups = {}
+    for name, fields in wants.items():
+        instrument = get_instrument(name)
+        source = get_source(instrument.source)
+        field_map = {field: source.source_field(field) for field in fields}
+        groups.setdefault(source.label, []).append((source, instrument.prefix, name, field_map))
+    return groups
+
+
+def _batches(entries):
+    """
+    같은 label 안에서 한 번에 요청할 묶음: batch adapter는 adapter 종류(클래스)마다 하나로, 나머지는 종목마다
+    (묶음은 첫 adapter의 fetch로 요청하므로 응답 형식이 같은 adapter끼리만 묶음. 예: sina_cn + sina_global)
+    """
+    batched = {}
+    for e in entries:
+        if e[0].batch:
+            batched.setdefault(type(e[0]), []).append(e)
+    return list(batched.values()) + [[e] for e in entries if not e[0].batch]
+
+
+def _to_names(entries, raw):
+    """{prefix: {source 필드: rows}} -> {종목 이름: {필드 이름: rows}}"""
+    return {
+        name: {field: raw[prefix][source_field] for field, source_field in field_map.items()}
+        for _, prefix, name, field_map in entries if prefix in raw
+    }
+
+
+def _fetch_label(entries, months, force):
+    quotes = {}
+    for batch in _batches(entries):
+        items = [(prefix, list(field_map.values())) for _, prefix, _, field_map in batch]
+        quotes.update(_to_names(batch, batch[0][0].fetch(items, months, force=force)))
+    return quotes
+
+
+def source_tasks(wants, months=12, force=False):
+    """wants -> [(label, 인자 없는 함수)]. 각 함수는 {종목 이름: {필드 이름: rows}}를 반환"""
+    return [
+        (label, lambda entries=entries: _fetch_label(entries, months, force))
+        for label, entries in _group_by_label(wants).items()
+    ]
+
+
+def source_timeouts(wants):
+    """
+    fetch_concurrently용 {label: 초}
+    label 안의 묶음은 차례로 요청하므로 묶음별 timeout(묶음 안에서 가장 긴 adapter timeout)의 합
+    """
+    timeouts = {"DEFAULT": config.SOURCE_TIMEOUTS["DEFAULT"]}
+    for label, entries in _group_by_label(wants).items():
+        timeouts[label] = sum(max(source.timeout for source, _, _, _ in batch) for batch in _batches(entries))
+    return timeouts
+
+
+def fetch_quotes(wants, months=12, force=False, on_error=None):
+    """모든 source를 동시에 가져와 하나로 합침 (실패한 source의 종목은 빠짐)"""
+    results = fetch_concurrently(source_tasks(wants, months, force), timeouts=source_timeouts(wants), on_error=on_error)
+    quotes = {}
+    for data in results.values():
+        quotes.update(data)
+    return quotes
+
+
+def stored_quotes(wants, months=12):
+    """
+    로컬 저장소의 마지막 값 (네트워크 없음, warm start용)
+    반환: ({종목 이름: {필드 이름: rows}}, {종목 이름: 마지막 기록 시각}) — 저장된 값이 없는 종목은 빠짐
+    """
+    quotes, times = {}, {}
+    for entries in _group_by_label(wants).values():
+        for batch in _batches(entries):
+            items = [(prefix, list(field_map.values())) for _, prefix, _, field_map in batch]
+            raw, ts = batch[0][0].stored(items, months)
+            if raw is None:
+                continue
+            for name, fields in _to_names(batch, raw).items():
+                quotes[name] = fields
+                times[name] = ts
+    return quotes, times
@@ -0,0 +1,49 @@
+"""
+세션 입력값 저장/복원 (Page1 수동 입력, Page3 계산기 입력)
+
+종료할 때 JSON 하나로 저장하고, 다음 실행 때 네트워크 없이 바로 불러옵니다.
+시세 자체는 request/quote_store.py의 로컬 저장소에서 복원합니다.
+"""
+import datetime
+import json
+import os
+import time
+
+import config
+from app_paths import data_path
+
+
+def load_session_state(path=None):
+    """저장된 상태 dict. 파일이 없거나 깨져 있으면 빈 dict"""
+    path = path or data_path(config.SESSION_STATE_PATH)
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"세션 상태 읽기 실패: {e}")
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_session_state(state, path=None):
+    """임시 파일에 먼저 쓰고 교체하므로 저장 도중 종료되어도 이전 파일은 남음"""
+    path = path or data_path(config.SESSION_STATE_PATH)
+    state = dict(state, saved_at=time.time())
+    tmp_path = path + ".tmp"
+    try:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"세션 상태 저장 실패: {e}")
+
+
+def stale_label(ts):
+    """'이전 세션 값 (10-17 15:30 기준)'"""
+    when = datetime.datetime.fromtimestamp(ts).strftime("%m-%d %H:%M")
+    return f"이전 세션 값 ({when} 기준)"
@@ -12,6 +12,7 @@ setup(
         "requests",
         "selenium",
         "datetime",
-        "PyQt6"
+        "PyQt6",
+        "numpy"
     ],
 )
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+시작 시간 리포트 (python main.py --startup-report)
+
+`python -X importtime`과 비슷하게 모듈별 import 시간을 재고, 시작 단계별 경과 시간과 함께 출력합니다.
+PyInstaller로 빌드한 exe에서는 -X 옵션을 줄 수 없으므로 import hook으로 직접 측정합니다.
+--windowed exe에는 콘솔(sys.stdout)이 없으므로 리포트는 항상 exe 옆 startup_report.txt에도 저장합니다.
+"""
+import importlib.abc
+import os
+import sys
+import time
+
+from app_paths import data_path
+
+# 시작 경로에 있으면 안 되는 무거운 모듈 (로드되어 있으면 리포트에 표시)
+HEAVY_MODULES = ["selenium", "numpy", "requests", "PyQt6.QtWidgets"]
+REPORT_PATH = "startup_report.txt"
+
+_start = time.perf_counter()
+_marks = []
+# [(모듈 이름, 자기 자신 시간, 누적 시간, 깊이)]
+_imports = []
+_stack = []
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        _stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            nested = _stack.pop()
+            if _stack:
+                _stack[-1] += total
+            _imports.append((module.__name__, total - nested, total, len(_stack)))
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+
+def install():
+    """이 시점 이후의 import를 측정 (main.py 맨 앞에서 호출)"""
+    global _start
+    _start = time.perf_counter()
+    sys.meta_path.insert(0, _ImportTimer())
+
+
+def mark(phase):
+    """시작 단계 기록 (예: 'imports', 'window', 'first paint')"""
+    _marks.append((phase, time.perf_counter() - _start))
+
+
+def report(top=15):
+    """리포트를 파일로 저장하고 콘솔이 있으면 출력. 반환: (리포트 문자열, 저장한 경로 또는 None)"""
+    lines = ["===== 시작 시간 리포트 ====="]
+    previous = 0.0
+    for phase, elapsed in _marks:
+        lines.append(f"{phase:<16} {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:.1f} ms)")
+        previous = elapsed
+
+    lines.append(f"--- import 시간 상위 {top}개 (자기 자신 / 누적, ms) ---")
+    for name, self_time, total, depth in sorted(_imports, key=lambda x: x[1], reverse=True)[:top]:
+        lines.append(f"{self_time * 1000:8.1f} {total * 1000:8.1f}  {'  ' * depth}{name}")
+    lines.append(f"측정된 모듈 수: {len(_imports)}")
+
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    lines.append(f"로드된 무거운 모듈: {', '.join(loaded) if loaded else '없음'}")
+    text = "\n".join(lines)
+
+    path = data_path(REPORT_PATH)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    except OSError as e:
+        text += f"\n리포트 저장 실패: {e}"
+        path = None
+    # --windowed exe에서는 sys.stdout이 None
+    if sys.stdout is not None:
+        print(text)
+        if path:
+            print(f"저장: {path}")
+    return text, path
@@ -0,0 +1,57 @@
+"""
+calc/contract_calendar.py 상장 월물 달력
+
+    python -m pytest tests/test_contract_calendar.py
+"""
+import datetime
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc.contract_calendar import contract_months
+
+NOW = datetime.datetime(2026, 10, 18)
+
+
+def listed_months(prefix, count):
+    return [month for _, month, listed in contract_months(prefix, count, NOW) if listed]
+
+
+class ContractMonthsTest(unittest.TestCase):
+    def test_symbols_and_labels_roll_over_year(self):
+        months = contract_months("nf_TA", 4, NOW)
+        self.assertEqual(months, [
+            ("nf_TA2610", "26/10", True), ("nf_TA2611", "26/11", True),
+            ("nf_TA2612", "26/12", True), ("nf_TA2701", "27/01", True),
+        ])
+
+    def test_zce_lists_twelve_serial_months_only(self):
+        self.assertEqual(len(listed_months("nf_PX", 36)), 12)
+        self.assertEqual(listed_months("nf_PX", 36)[-1], "27/09")
+        # 곡선 길이는 그대로 두고 상장되지 않은 월물만 표시
+        self.assertEqual(len(contract_months("nf_PX", 36, NOW)), 36)
+
+    def test_brent_lists_every_month_on_long_curves(self):
+        self.assertEqual(len(listed_months("hf_OIL", 36)), 36)
+
+    def test_sgx_serial_then_quarterly(self):
+        months = listed_months("sgx_UC", 36)
+        # 연속 13개월 (26/10 ~ 27/10)
+        self.assertEqual(months[:13], [m for _, m, _ in contract_months("sgx_UC", 13, NOW)])
+        # 이후 36개월(29/09)까지는 분기월만
+        far = months[13:]
+        self.assertEqual(far, ["27/12", "28/03", "28/06", "28/09", "28/12", "29/03", "29/06", "29/09"])
+
+    def test_unknown_prefix_is_always_listed(self):
+        self.assertTrue(all(listed for _, _, listed in contract_months("manual_MOPJ", 24, NOW)))
+
+    def test_month_end_does_not_skip_months(self):
+        # 1월 31일 기준으로도 2월이 빠지지 않음 (relativedelta는 월말을 맞춰 줌)
+        labels = [m for _, m, _ in contract_months("hf_OIL", 3, datetime.datetime(2027, 1, 31))]
+        self.assertEqual(labels, ["27/01", "27/02", "27/03"])
+
+
+if __name__ == "__main__":
+    unittest.main()
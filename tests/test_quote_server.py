@@ -0,0 +1,156 @@
+"""
+quote_server.py <-> request/quote_client.py 를 localhost에서 가짜 fetch로 확인 (네트워크/Chrome 없음)
+
+    python -m pytest tests/test_quote_server.py
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from quote_server import QuoteServer
+from request.quote_cache import quote_cache
+from request.quote_client import QuoteSubscriber
+
+WANTS = {"PTA": ["price"], "USDCNH": ["price"]}
+
+
+def rows(*prices):
+    return [{"month": f"26/{i + 1:02d}", "price": price} for i, price in enumerate(prices)]
+
+
+class FakeFetch:
+    """호출될 때마다 responses의 다음 결과를 돌려줌 (마지막 결과는 계속 반복). None인 source는 실패로 보고"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, wants, months, force, on_error):
+        response = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        quotes = {}
+        for name, value in response.items():
+            if value is None:
+                on_error("SGX" if name == "USDCNH" else "Sina", RuntimeError("fake failure"))
+            else:
+                quotes[name] = value
+        return quotes
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class QuoteServerTest(unittest.TestCase):
+    def setUp(self):
+        self._store_enabled = config.QUOTE_STORE_ENABLED
+        config.QUOTE_STORE_ENABLED = False
+        quote_cache.clear()
+        self.subscriber = None
+        self.loop = None
+
+    def tearDown(self):
+        if self.subscriber is not None:
+            self.subscriber.stop()
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.task.cancel)
+            self.thread.join(5)
+        quote_cache.clear()
+        config.QUOTE_STORE_ENABLED = self._store_enabled
+
+    def start_server(self, fetch, interval=0.2, heartbeat=0.1):
+        self.server = QuoteServer(WANTS, months=3, interval=interval, fetch=fetch, heartbeat=heartbeat)
+
+        async def serve():
+            self.loop = asyncio.get_running_loop()
+            self.task = asyncio.current_task()
+            await self.server.serve("127.0.0.1", 0)
+
+        def run():
+            # asyncio.run이 끝날 때 남은 클라이언트 task까지 정리
+            try:
+                asyncio.run(serve())
+            except asyncio.CancelledError:
+                pass
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        self.assertTrue(wait_until(lambda: self.server.address is not None))
+        return "127.0.0.1:%d" % self.server.address[1]
+
+    def subscribe(self, address, **kwargs):
+        updates = []
+        self.subscriber = QuoteSubscriber(address, on_update=updates.append, retry=0.1, **kwargs).start()
+        return updates
+
+    def test_snapshot_and_delta_prime_cache(self):
+        fetch = FakeFetch([
+            {"PTA": {"price": rows("5000", "5010")}, "USDCNH": {"price": rows("7.10", "7.11")}},
+            {"PTA": {"price": rows("5000", "5020")}, "USDCNH": {"price": rows("7.10", "7.11")}},
+        ])
+        updates = self.subscribe(self.start_server(fetch))
+
+        self.assertTrue(wait_until(lambda: fetch.calls >= 2 and updates
+                                   and self.subscriber.current_quotes().get("PTA", {}).get("price", [{}])[-1].get("price") == "5020"))
+        quotes = self.subscriber.current_quotes()
+        self.assertEqual(quotes["USDCNH"]["price"], rows("7.10", "7.11"))
+        # delta에는 바뀐 월물만
+        self.assertIn({"PTA": {"price": [{"month": "26/02", "price": "5020"}]}}, updates)
+        # 받은 값은 캐시에 들어가 페이지의 가져오기가 upstream으로 가지 않음
+        self.assertEqual(quote_cache.get(("nf_TA", "26/02", 8)), "5020")
+        self.assertEqual(quote_cache.get(("sgx_UC", "26/01", "price")), "7.10")
+
+    def test_failed_source_keeps_last_value_without_refreshing_cache(self):
+        fetch = FakeFetch([
+            {"PTA": {"price": rows("5000")}, "USDCNH": {"price": rows("7.10")}},
+            {"PTA": {"price": rows("5001")}, "USDCNH": None},
+        ])
+        self.subscribe(self.start_server(fetch))
+
+        self.assertTrue(wait_until(lambda: self.subscriber.current_quotes().get("PTA", {}).get("price") == rows("5001")))
+        # 실패한 SGX는 마지막 값을 유지
+        self.assertEqual(self.subscriber.current_quotes()["USDCNH"]["price"], rows("7.10"))
+        quote_cache.clear()
+        self.assertTrue(wait_until(lambda: quote_cache.get(("nf_TA", "26/01", 8)) == "5001"))
+        # 이번에 가져오지 못한 종목은 캐시를 새로 채우지 않음 (TTL 뒤 만료)
+        self.assertIsNone(quote_cache.get(("sgx_UC", "26/01", "price")))
+
+    def test_heartbeat_keeps_connection_during_slow_fetch(self):
+        started = threading.Event()
+
+        def slow_fetch(wants, months, force, on_error):
+            if started.is_set():
+                time.sleep(1.0)
+            started.set()
+            return {"PTA": {"price": rows("5000")}}
+
+        address = self.start_server(slow_fetch, interval=0.05, heartbeat=0.05)
+        self.subscribe(address)
+        self.assertTrue(wait_until(lambda: self.subscriber.connected))
+        # heartbeat 0.05초 -> 클라이언트 제한 0.15초. 가져오기가 1초 걸려도 heartbeat로 연결 유지
+        time.sleep(1.2)
+        self.assertTrue(self.subscriber.connected)
+        self.assertEqual(len(self.server.clients), 1)
+
+    def test_subscribe_filters_instruments(self):
+        fetch = FakeFetch([{"PTA": {"price": rows("5000")}, "USDCNH": {"price": rows("7.10")}}])
+        self.subscribe(self.start_server(fetch), instruments=["USDCNH"])
+
+        self.assertTrue(wait_until(lambda: "USDCNH" in self.subscriber.current_quotes()))
+        time.sleep(0.3)
+        self.assertNotIn("PTA", self.subscriber.current_quotes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+request/rate_limit.py 호스트별 token bucket (실제로 잠들지 않도록 시계를 고정)
+
+    python -m pytest tests/test_rate_limit.py
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from request import rate_limit
+from request.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch("request.rate_limit.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2, burst=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        # 토큰이 없으면 초당 2개 -> 0.5초, 1초 뒤
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = TokenBucket(rate=1, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        self.clock.now += 100
+        self.assertEqual([bucket.reserve() for _ in range(2)], [0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_wait_time_does_not_consume(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        self.assertEqual(bucket.wait_time(), (0.0, False))
+        self.assertEqual(bucket.wait_time(), (0.0, False))
+        bucket.reserve()
+        wait, blocked = bucket.wait_time()
+        self.assertAlmostEqual(wait, 1.0)
+        self.assertFalse(blocked)
+
+    def test_penalize_blocks_until_backoff(self):
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.penalize(30)
+        wait, blocked = bucket.wait_time()
+        self.assertAlmostEqual(wait, 30)
+        self.assertTrue(blocked)
+        self.assertAlmostEqual(bucket.reserve(), 30)
+
+        self.clock.now += 31
+        self.assertFalse(bucket.wait_time()[1])
+
+    def test_acquire_sleeps_for_reserved_wait(self):
+        bucket = TokenBucket(rate=4, burst=1)
+        with mock.patch("request.rate_limit.time.sleep") as sleep:
+            self.assertEqual(bucket.acquire(), 0.0)
+            self.assertAlmostEqual(bucket.acquire(), 0.25)
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 0.25)
+
+
+class HostLimiterTest(unittest.TestCase):
+    def setUp(self):
+        rate_limit._buckets.clear()
+        self.addCleanup(rate_limit._buckets.clear)
+
+    def test_configured_hosts_share_one_bucket(self):
+        host = next(iter(config.HOST_RATE_LIMITS))
+        first = rate_limit.host_limiter(f"https://{host}/a")
+        self.assertIs(first, rate_limit.host_limiter(f"https://{host}/b?x=1"))
+        self.assertEqual((first.rate, first.burst), config.HOST_RATE_LIMITS[host])
+
+    def test_unknown_host_is_not_limited(self):
+        url = "http://127.0.0.1:8000/list=nf_TA2611"
+        self.assertIsNone(rate_limit.host_limiter(url))
+        self.assertEqual(rate_limit.wait_for_host(url), 0.0)
+        self.assertEqual(rate_limit.host_wait_time(url), (0.0, False))
+        rate_limit.penalize_host(url)
+
+    def test_penalize_host_uses_block_backoff(self):
+        url = "https://hq.sinajs.cn/list=nf_TA2611"
+        rate_limit.penalize_host(url)
+        wait, blocked = rate_limit.host_wait_time(url)
+        self.assertTrue(blocked)
+        self.assertAlmostEqual(wait, config.HOST_BLOCK_BACKOFF, delta=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
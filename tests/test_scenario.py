@@ -0,0 +1,88 @@
+"""
+calc/scenario.py Page3 시나리오 그리드
+
+    python -m pytest tests/test_scenario.py
+"""
+import math
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc.scenario import MODE_CONSTS, center_mask, implied_spread, inverse_target, offset_range, scenario_grid
+
+
+def scalar_target(mode, future, spread, usd):
+    """Page3 원래 계산기의 한 칸 계산 (비교 기준)"""
+    const_val = MODE_CONSTS[mode]
+    if mode == "PX-PTA":
+        return (future - spread) / (const_val * usd)
+    return (future * const_val * usd) + spread
+
+
+class OffsetRangeTest(unittest.TestCase):
+    def test_inclusive_and_rounded(self):
+        self.assertEqual(offset_range(-2, 2, 0.5).tolist(), [-2, -1.5, -1, -0.5, 0, 0.5, 1, 1.5, 2])
+        # 0.1 간격 누적 오차가 남지 않음
+        self.assertEqual(offset_range(0, 0.3, 0.1).tolist(), [0.0, 0.1, 0.2, 0.3])
+        self.assertEqual(offset_range(0, 0, 0.01).tolist(), [0.0])
+
+    def test_invalid_ranges(self):
+        for args in [(0, 1, 0), (0, 1, -1), (1, 0, 0.5), (math.inf, 2, 1), (0, math.nan, 1), (0, 1, math.inf)]:
+            with self.assertRaises(ValueError, msg=args):
+                offset_range(*args)
+
+    def test_row_limit(self):
+        with mock.patch("config.SCENARIO_MAX_ROWS", 10):
+            self.assertEqual(len(offset_range(0, 9, 1)), 10)
+            with self.assertRaises(ValueError):
+                offset_range(0, 10, 1)
+        # 차이가 float 범위를 넘어도 OverflowError가 아니라 ValueError
+        with self.assertRaises(ValueError):
+            offset_range(-1e308, 1e308, 1)
+
+
+class ScenarioGridTest(unittest.TestCase):
+    def test_grid_matches_scalar_formula(self):
+        offsets = offset_range(-2, 2, 1)
+        fx_offsets = offset_range(-0.02, 0.02, 0.01)
+        for mode, future in [("PX-PTA", 5800.0), ("ZCE-SGX", 850.0)]:
+            target, spreads, usd_values = scenario_grid(mode, future, 120.0, 7.1, offsets, fx_offsets)
+            self.assertEqual(target.shape, (len(fx_offsets), len(offsets)))
+            for i, u in enumerate(usd_values):
+                for j, off in enumerate(offsets):
+                    self.assertAlmostEqual(target[i, j], scalar_target(mode, future, 120.0, u) + off)
+                    # 바뀐 target에서 spread를 다시 구하면 역산 수식과 맞아야 함
+                    self.assertAlmostEqual(inverse_target(mode, future, spreads[i, j], u), target[i, j])
+
+    def test_vary_spread(self):
+        offsets = offset_range(-10, 10, 5)
+        target, spreads, _ = scenario_grid("PX-PTA", 5800.0, 120.0, 7.1, offsets, vary="spread")
+        np.testing.assert_allclose(spreads[0], 120.0 + offsets)
+        np.testing.assert_allclose(target[0], [scalar_target("PX-PTA", 5800.0, s, 7.1) for s in 120.0 + offsets])
+        np.testing.assert_allclose(implied_spread("PX-PTA", 5800.0, target, 7.1), spreads)
+
+    def test_non_positive_usd_is_rejected(self):
+        with self.assertRaises(ValueError):
+            scenario_grid("PX-PTA", 5800.0, 120.0, 0.05, [0.0], offset_range(-0.1, 0.1, 0.05))
+
+    def test_grid_row_limit(self):
+        with mock.patch("config.SCENARIO_MAX_ROWS", 20):
+            scenario_grid("PX-PTA", 5800.0, 120.0, 7.1, np.zeros(4), np.zeros(5))
+            with self.assertRaises(ValueError):
+                scenario_grid("PX-PTA", 5800.0, 120.0, 7.1, np.zeros(5), np.zeros(5))
+
+    def test_center_mask_marks_only_base_scenario(self):
+        mask = center_mask(offset_range(-1, 1, 0.5), offset_range(-0.01, 0.01, 0.01))
+        self.assertEqual(mask.shape, (3, 5))
+        self.assertEqual(list(zip(*np.nonzero(mask))), [(1, 2)])
+        # 환율 offset 0이 구간에 없으면 강조할 칸도 없음
+        self.assertFalse(center_mask([0.0], [0.01, 0.02]).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+calc/sheet.py 재계산 엔진과 calc/page1_sheet.py Page1 수식 (Qt 없음)
+
+    python -m pytest tests/test_sheet.py
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc.page1_sheet import (COL_BOX, COL_MOPJ, COL_MOPJ_SPREAD, COL_PTA_FUTURE, COL_PX, COL_PX_FUTURE, COL_PX_PTA,
+                              COL_PX_SPREAD, COL_PXN, COL_USD_CNH, COL_ZCE_SGX, HEADERS, PAGE1_FORMULAS,
+                              build_page1_sheet, compute_page1_grid)
+from calc.sheet import Formula, Sheet
+
+N_ROWS = 12
+
+
+def page1_inputs(seed=0):
+    """Page1 입력 열(첫 행 Mopj/PX, spread, 선물, 환율)만 채운 {(row, col): 값}"""
+    rng = np.random.default_rng(seed)
+    updates = {(0, COL_MOPJ): 650.0, (0, COL_PX): 980.0}
+    for row in range(N_ROWS):
+        updates[(row, COL_MOPJ_SPREAD)] = float(rng.uniform(-5, 5))
+        updates[(row, COL_PX_SPREAD)] = float(rng.uniform(-5, 5))
+        updates[(row, COL_PX_FUTURE)] = float(rng.uniform(6500, 7500))
+        updates[(row, COL_PTA_FUTURE)] = float(rng.uniform(4800, 5400))
+        updates[(row, COL_USD_CNH)] = float(rng.uniform(7.0, 7.3))
+    return updates
+
+
+def cell_sheet():
+    """batch_fn 없이 셀 단위로만 계산하는 Page1 시트"""
+    return Sheet(N_ROWS, len(HEADERS), PAGE1_FORMULAS)
+
+
+class SetManyTest(unittest.TestCase):
+    def test_only_downstream_cells_are_recomputed(self):
+        evaluated = []
+
+        def counted(col, fn):
+            def wrapper(*args):
+                evaluated.append(col)
+                return fn(*args)
+            return wrapper
+
+        # A(입력) -> B = A*2 -> C = B+1,  D(입력) -> E = D*3
+        sheet = Sheet(3, 5, [
+            Formula(1, [(0, 0)], counted(1, lambda a: a * 2)),
+            Formula(2, [(0, 1)], counted(2, lambda b: b + 1)),
+            Formula(4, [(0, 3)], counted(4, lambda d: d * 3)),
+        ])
+        sheet.recompute_all()
+        evaluated.clear()
+
+        changed = sheet.set_many({(1, 0): 5.0})
+        self.assertEqual(sorted(evaluated), [1, 2])
+        self.assertEqual(sorted(changed), [(1, 0), (1, 1), (1, 2)])
+        self.assertEqual(sheet.get(1, 2), 11.0)
+
+    def test_page1_future_change_touches_only_its_spread(self):
+        sheet = cell_sheet()
+        sheet.set_many(page1_inputs())
+
+        changed = sheet.set_many({(3, COL_PTA_FUTURE): 5555.0})
+        self.assertEqual(sorted(changed), [(3, COL_PTA_FUTURE), (3, COL_PX_PTA)])
+
+    def test_page1_spread_change_cascades_to_later_rows(self):
+        sheet = cell_sheet()
+        sheet.set_many(page1_inputs())
+
+        changed = set(sheet.set_many({(5, COL_MOPJ_SPREAD): 99.0}))
+        # 6행부터 Mopj가 계단식으로 바뀌고 PXN/BOX가 따라 바뀜 (5행 이전은 그대로)
+        self.assertIn((N_ROWS - 1, COL_MOPJ), changed)
+        self.assertIn((5, COL_BOX), changed)
+        self.assertFalse({cell for cell in changed if cell[0] < 5})
+        self.assertFalse({cell for cell in changed if cell[1] in (COL_PX_PTA, COL_ZCE_SGX)})
+
+    def test_unchanged_value_is_not_reported(self):
+        sheet = cell_sheet()
+        sheet.set_many(page1_inputs())
+        self.assertEqual(sheet.set_many({(2, COL_USD_CNH): sheet.get(2, COL_USD_CNH)}), [])
+
+
+class RecomputeAllTest(unittest.TestCase):
+    def test_cell_recompute_matches_vector_grid(self):
+        for seed in range(3):
+            sheet = cell_sheet()
+            for (row, col), value in page1_inputs(seed).items():
+                sheet.values[row, col] = value
+            expected = compute_page1_grid(sheet.values)
+            sheet.recompute_all()
+            np.testing.assert_allclose(sheet.values, expected, rtol=1e-12)
+
+    def test_batch_sheet_matches_cell_sheet(self):
+        batch, cells = build_page1_sheet(N_ROWS), cell_sheet()
+        for sheet in (batch, cells):
+            sheet.set_many(page1_inputs(7))
+        batch.values[0, COL_MOPJ] = cells.values[0, COL_MOPJ] = 700.0
+        batch.recompute_all()
+        cells.recompute_all()
+        np.testing.assert_allclose(batch.values, cells.values, rtol=1e-12)
+        # 마지막 월 BOX는 다음 달이 없으므로 계산하지 않음
+        self.assertFalse(cells.is_formula(N_ROWS - 1, COL_BOX))
+        self.assertTrue(cells.is_formula(0, COL_PXN))
+
+    def test_stacked_scenarios(self):
+        base = np.zeros((N_ROWS, len(HEADERS)))
+        for (row, col), value in page1_inputs().items():
+            base[row, col] = value
+        stacked = np.stack([base, base])
+        stacked[1, 0, COL_PX] += 10
+        out = compute_page1_grid(stacked)
+        np.testing.assert_allclose(out[1, :, COL_PX] - out[0, :, COL_PX], 10)
+        np.testing.assert_allclose(out[0], compute_page1_grid(base))
+
+
+class CycleTest(unittest.TestCase):
+    def test_cycle_raises(self):
+        with self.assertRaises(ValueError):
+            Sheet(2, 2, [Formula(0, [(0, 1)], lambda b: b), Formula(1, [(0, 0)], lambda a: a)])
+
+    def test_cycle_across_rows_raises(self):
+        # 0열은 아래 행 1열, 1열은 위 행 0열 -> (0,0) -> (1,1) -> (0,0)
+        with self.assertRaises(ValueError):
+            Sheet(2, 2, [Formula(0, [(1, 1)], lambda b: b), Formula(1, [(-1, 0)], lambda a: a)])
+
+
+if __name__ == "__main__":
+    unittest.main()
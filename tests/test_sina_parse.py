@@ -0,0 +1,85 @@
+"""
+request/request_other.py Sina 응답 파싱 (네트워크 없음)
+
+    python -m pytest tests/test_sina_parse.py
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc.contract_calendar import contract_months
+from request.request_other import decode_hq_body, get_bulk_prices, hq_field, parse_hq_response
+
+
+def hq_line(symbol, price, prev_settle="", name="PTA"):
+    """index 0 = 이름, 8 = 현재가, 10 = 전일 정산가인 한 줄"""
+    fields = [name] + ["0"] * 7 + [price, "0", prev_settle, "tail", "more"]
+    return f'var hq_str_{symbol}="{",".join(fields)}";'
+
+
+class ParseHqResponseTest(unittest.TestCase):
+    def test_lines_are_keyed_by_symbol_not_order(self):
+        text = "\n".join([hq_line("nf_TA2612", "5100"), hq_line("nf_TA2611", "5000")])
+        parsed = parse_hq_response(text, [8])
+        self.assertEqual(hq_field(parsed["nf_TA2611"], 8), "5000")
+        self.assertEqual(hq_field(parsed["nf_TA2612"], 8), "5100")
+
+    def test_missing_and_empty_lines(self):
+        text = "\n".join([hq_line("nf_TA2611", "5000"), 'var hq_str_nf_TA2612="";'])
+        parsed = parse_hq_response(text, [8])
+        self.assertEqual(parsed["nf_TA2612"], [])
+        self.assertEqual(hq_field(parsed["nf_TA2612"], 8), "N/A")
+        self.assertNotIn("nf_TA2701", parsed)
+        self.assertEqual(hq_field(parsed.get("nf_TA2701", []), 8), "N/A")
+
+    def test_truncated_last_line_is_ignored(self):
+        full = hq_line("nf_TA2611", "5000")
+        cut = hq_line("nf_TA2612", "5100")[:40]
+        parsed = parse_hq_response(full + "\n" + cut, [8])
+        self.assertEqual(list(parsed), ["nf_TA2611"])
+
+    def test_fields_split_only_up_to_requested_index(self):
+        parsed = parse_hq_response(hq_line("nf_TA2611", "5000", "4990"), [8, 10])
+        fields = parsed["nf_TA2611"]
+        self.assertEqual((fields[8], fields[10]), ("5000", "4990"))
+        self.assertEqual(fields[-1], "tail,more")
+
+    def test_gb18030_decoding(self):
+        # GBK 밖의 한자(4바이트 GB18030)와 일반 GBK 한자가 섞인 이름
+        name = "精对苯二甲酸𠀀"
+        body = hq_line("nf_TA2611", "5000", name=name).encode("gb18030")
+        parsed = parse_hq_response(decode_hq_body(body), [8])
+        self.assertEqual(parsed["nf_TA2611"][0], name)
+        self.assertEqual(parsed["nf_TA2611"][8], "5000")
+
+
+class GetBulkPricesTest(unittest.TestCase):
+    def test_rows_follow_calendar_with_reordered_and_missing_lines(self):
+        calendar = contract_months("nf_TA", 14)
+        listed = [symbol for symbol, _, is_listed in calendar if is_listed]
+        # 순서를 뒤집고 두 번째 월물은 빠진 응답
+        lines = [hq_line(symbol, str(5000 + i)) for i, symbol in enumerate(listed) if i != 1]
+        body = "\n".join(reversed(lines)).encode("gb18030")
+        response = mock.Mock(content=body)
+
+        with mock.patch("request.request_other.http_get", return_value=response) as http_get:
+            rows = get_bulk_prices(["nf_TA"], [8], months=14)["nf_TA"][8]
+
+        # 상장되지 않은 월물은 요청 URL에 넣지 않음
+        url = http_get.call_args[0][1]
+        for symbol, _, is_listed in calendar:
+            self.assertEqual(symbol in url, is_listed)
+        self.assertEqual([row["month"] for row in rows], [month for _, month, _ in calendar])
+        self.assertEqual(rows[0]["price"], "5000")
+        self.assertEqual(rows[1]["price"], "N/A")
+        self.assertEqual(rows[2]["price"], "5002")
+        for row, (_, _, is_listed) in zip(rows, calendar):
+            if not is_listed:
+                self.assertEqual(row["price"], "N/A")
+
+
+if __name__ == "__main__":
+    unittest.main()
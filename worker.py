@@ -0,0 +1,106 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtWidgets import QLabel
+
+from request.fetch_orchestrator import fetch_concurrently
+
+
+class WorkerSignals(QObject):
+    """QRunnable은 시그널을 가질 수 없으므로 별도 QObject로 분리"""
+    progress = pyqtSignal(str, str)   # (source, 상태)
+    result = pyqtSignal(str, object)  # (source, 데이터)
+    error = pyqtSignal(str, str)      # (source, 오류 메시지)
+    finished = pyqtSignal()
+
+
+class FetchWorker(QRunnable):
+    """
+    네트워크/Selenium 호출을 GUI 스레드 밖에서 실행합니다.
+    tasks: [(source 이름, 인자 없는 함수)] — 각 source는 병렬로 실행되고,
+    결과는 도착하는 순서대로 source별 result 시그널로 전달됩니다.
+    """
+
+    def __init__(self, tasks, timeouts=None):
+        super().__init__()
+        self.tasks = tasks
+        self.timeouts = timeouts
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """이미 시작된 요청은 끊을 수 없으므로, 대기를 중단하고 결과 전달을 막습니다."""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        # 모든 source를 동시에 요청하고, 도착하는 대로 result 시그널 전달
+        for source, _ in self.tasks:
+            self.signals.progress.emit(source, "로딩 중")
+
+        def on_result(source, data):
+            if self._cancelled:
+                return
+            self.signals.result.emit(source, data)
+            self.signals.progress.emit(source, "완료")
+
+        def on_error(source, e):
+            if self._cancelled:
+                return
+            self.signals.error.emit(source, str(e))
+            self.signals.progress.emit(source, "실패")
+
+        fetch_concurrently(self.tasks, timeouts=self.timeouts, on_result=on_result, on_error=on_error,
+                           is_cancelled=self.is_cancelled)
+
+        if self._cancelled:
+            for source, _ in self.tasks:
+                self.signals.progress.emit(source, "취소됨")
+        self.signals.finished.emit()
+
+
+def start_worker(tasks, on_result=None, on_progress=None, on_error=None, on_finished=None, timeouts=None):
+    """FetchWorker를 만들어 시그널을 연결하고 전역 스레드풀에서 실행 (timeouts: {source: 초})"""
+    worker = FetchWorker(tasks, timeouts)
+    if on_result: worker.signals.result.connect(on_result)
+    if on_progress: worker.signals.progress.connect(on_progress)
+    if on_error: worker.signals.error.connect(on_error)
+    if on_finished: worker.signals.finished.connect(on_finished)
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+
+class ProgressLabel(QLabel):
+    """source별 진행 상태를 한 줄로 표시 (예: Sina: 완료 | SGX: 로딩 중)"""
+
+    def __init__(self):
+        super().__init__("")
+        self._states = {}
+        self._errors = {}
+
+    def reset(self, sources):
+        self._states = {s: "대기" for s in sources}
+        self._errors = {}
+        self.setToolTip("")
+        self.setStyleSheet("")
+        self._render()
+
+    def set_stale(self, text):
+        """복원한 이전 세션 값을 보여주는 중임을 회색으로 표시 (다음 reset에서 해제)"""
+        self._states = {}
+        self.setStyleSheet("color: #9E9E9E; font-style: italic;")
+        self.setText(text)
+
+    def set_status(self, source, status):
+        self._states[source] = status
+        self._render()
+
+    def set_error(self, source, message):
+        """실패 사유는 마우스를 올리면 보이도록 툴팁에 표시"""
+        self._states[source] = "실패"
+        self._errors[source] = message
+        self.setToolTip("\n".join(f"{s}: {m}" for s, m in self._errors.items()))
+        self._render()
+
+    def _render(self):
+        self.setText(" | ".join(f"{s}: {st}" for s, st in self._states.items()))